@@ -0,0 +1,239 @@
+# uvicorn api:app --host 0.0.0.0 --port 8000
+
+# -*- coding: utf-8 -*-
+# 자격증 조회 REST API — Streamlit 앱과 같은 cert_core 엔진(점수/필터/인덱스)을 그대로 사용
+# 응답은 데이터셋 버전 기반 ETag(If-None-Match → 304) + gzip. 모바일(Flutter) 앱용.
+
+import hashlib
+import math
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+
+from cert_core.compact import widen_floats
+from cert_core.config import (
+    GRADE_LABELS,
+    NAME_COL, ID_COL, CLS_COL, GRADE_COL, FREQ_COL,
+)
+from cert_core.dataset import get_dataset
+from cert_core.ncs import path_rows
+from cert_core.qr import license_url
+from cert_core.results import filter_state, get_results
+from cert_core.stats import phase_avg_col
+
+MAX_PAGE_SIZE = 100
+
+# 목록 항목에 싣는 컬럼 → 응답 키
+SUMMARY_FIELDS = {
+    ID_COL: "id",
+    NAME_COL: "name",
+    CLS_COL: "class",
+    GRADE_COL: "grade_code",
+    FREQ_COL: "exam_frequency",
+    "STRUCT_TXT": "structure",
+    "DIFF_LEVEL(1-5)": "difficulty_level",
+    "DIFF_SCORE": "difficulty_score",
+    "OVERALL_PASS(%)": "pass_rate_avg",
+    "APPLICANTS_AVG": "applicants_avg",
+    "NO_PASS_DATA": "no_pass_data",
+}
+
+
+# -------------------------------------------------
+# 직렬화
+# -------------------------------------------------
+def _clean(v):
+    # numpy 스칼라 → 파이썬, NaN/inf/NA → null
+    if v is pd.NA:
+        return None
+    if isinstance(v, np.generic):
+        v = v.item()
+    if isinstance(v, float) and not math.isfinite(v):
+        return None
+    return v
+
+
+def _grade_label(code):
+    try:
+        return GRADE_LABELS.get(int(round(float(code), -2)))
+    except (TypeError, ValueError):
+        return None
+
+
+def _summary(row):
+    out = {key: _clean(row.get(col)) for col, key in SUMMARY_FIELDS.items()}
+    out["id"] = str(out["id"]).strip() if out["id"] is not None else None
+    out["grade"] = _grade_label(row.get(GRADE_COL))
+    if out["difficulty_level"] is not None:
+        out["difficulty_level"] = int(out["difficulty_level"])
+    return out
+
+
+def _summaries(ds, positions):
+    frame = widen_floats(ds.cert.iloc[positions])
+    return [_summary(row) for row in frame.to_dict(orient="records")]
+
+
+def _page(ds, order, page, size, **extra):
+    start = (page - 1) * size
+    return {
+        "version": ds.version,
+        "total": int(len(order)),
+        "page": page,
+        "size": size,
+        "pages": max(1, math.ceil(len(order) / size)),
+        **extra,
+        "items": _summaries(ds, order[start:start + size]),
+    }
+
+
+def _etag(version, path, query):
+    digest = hashlib.sha1(f"{path}?{query}".encode("utf-8")).hexdigest()[:16]
+    return f'W/"{version}-{digest}"'
+
+
+def _ncs_node(node):
+    return {
+        "name": node.name,
+        "license_count": len(node.ids),
+        "children": [_ncs_node(node.children[n]) for n in dict.fromkeys(node.options)],
+    }
+
+
+# -------------------------------------------------
+# 앱
+# -------------------------------------------------
+def create_app(get_ds=get_dataset):
+    """get_ds: 현재 Dataset 을 돌려주는 함수 (테스트에서는 고정 데이터셋을 넘겨 로컬 클라이언트로 호출).
+
+    핸들러는 pandas/numpy 작업을 하므로 모두 일반 def → FastAPI 스레드풀에서 실행 (이벤트 루프를 막지 않음).
+    """
+
+    @asynccontextmanager
+    async def lifespan(app):
+        # 첫 데이터셋 빌드(스냅샷 없으면 1초 이상)는 요청을 받기 전에 끝낸다
+        await run_in_threadpool(get_ds)
+        yield
+
+    app = FastAPI(title="자격증 대시보드 API", lifespan=lifespan)
+    app.add_middleware(GZipMiddleware, minimum_size=500)
+
+    def dataset():
+        ds = get_ds()
+        if ds is None or ds.cert is None:
+            raise HTTPException(503, "자격증 데이터 파일을 찾을 수 없습니다.")
+        return ds
+
+    @app.middleware("http")
+    async def etag_by_version(request: Request, call_next):
+        # 같은 데이터셋 버전 + 같은 URL → 같은 응답. 일치하면 핸들러를 실행하지 않고 304.
+        # (보통 lifespan 에서 빌드가 끝나 즉시 반환되지만, 혹시 모를 첫 빌드도 루프 밖에서)
+        ds = await run_in_threadpool(get_ds)
+        if request.method != "GET" or ds is None:
+            return await call_next(request)
+        etag = _etag(ds.version, request.url.path, request.url.query)
+        inm = request.headers.get("if-none-match", "")
+        if inm.strip() == "*" or etag in (t.strip() for t in inm.split(",")):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+        resp = await call_next(request)
+        if resp.status_code == 200:
+            resp.headers["ETag"] = etag
+            resp.headers["Cache-Control"] = "no-cache"
+            resp.headers["X-Dataset-Version"] = ds.version
+        return resp
+
+    @app.get("/certifications")
+    def list_certifications(
+        page: int = Query(1, ge=1),
+        size: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+        q: Optional[str] = None,
+        cls: Optional[str] = Query(None, description="자격증_분류"),
+        grade: Optional[List[int]] = Query(None, description="등급 코드 버킷 (100~500, 복수)"),
+        written: bool = False,
+        practical: bool = False,
+        interview: bool = False,
+        level: Optional[List[int]] = Query(None, description="난이도 등급 1~5 (복수)"),
+        ncs_large: Optional[str] = None,
+        ncs_mid: Optional[str] = None,
+        ncs_small: Optional[str] = None,
+        major: Optional[str] = None,
+        no_pass: bool = Query(False, description="합격률 없는 자격증만"),
+    ):
+        """필터 + 검색 결과 (화면과 같은 정렬: 난이도 점수 내림차순 → 합격률 오름차순)."""
+        ds = dataset()
+        fs = filter_state(
+            q=q, cls=cls, buckets=grade, want_w=written, want_p=practical, want_i=interview,
+            levels=level if level is not None else [1, 2, 3, 4, 5],
+            ncs_large=ncs_large, ncs_mid=ncs_mid, ncs_small=ncs_small, major=major, only_no_pass=no_pass,
+        )
+        order, fuzzy = get_results(ds, fs)
+        return _page(ds, order, page, size, fuzzy=fuzzy)
+
+    @app.get("/certifications/{license_id}")
+    def get_certification(license_id: str):
+        ds = dataset()
+        pos = ds.facets.positions_of(license_id)
+        if not len(pos):
+            raise HTTPException(404, f"자격증ID '{license_id}' 를 찾을 수 없습니다.")
+        row = widen_floats(ds.cert.iloc[pos[:1]]).iloc[0]
+        out = _summary(row.to_dict())
+        out["pass_rate_phase_avg"] = {ph: _clean(row.get(phase_avg_col(ph))) for ph in ds.stats.phases}
+        out["yearly"] = {str(y): v for y, v in ds.stats.row(int(pos[0])).items()}
+        out["url"] = license_url(out["id"])
+        return {"version": ds.version, "item": out}
+
+    @app.get("/certifications/{license_id}/jobs")
+    def get_certification_jobs(license_id: str):
+        ds = dataset()
+        if not len(ds.facets.positions_of(license_id)):
+            raise HTTPException(404, f"자격증ID '{license_id}' 를 찾을 수 없습니다.")
+        jobs = [
+            {"job_seq": j.seq, "title": j.title, "majors": list(j.major_list)}
+            for j in ds.job_index.jobs_for(license_id)
+        ]
+        return {"version": ds.version, "license_id": license_id.strip(), "items": jobs}
+
+    @app.get("/majors/{name}/certifications")
+    def get_major_certifications(
+        name: str,
+        page: int = Query(1, ge=1),
+        size: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    ):
+        ds = dataset()
+        if ds.majors is None or not ds.majors.license_ids(name):
+            raise HTTPException(404, f"학과명 '{name}' 을(를) 찾을 수 없습니다.")
+        order, _ = get_results(ds, filter_state(major=name, levels=[1, 2, 3, 4, 5]))
+        rates = ds.majors.employment(name)
+        employment = None if rates is None else dict(zip(("total", "male", "female"), map(_clean, rates)))
+        return _page(ds, order, page, size, major=name, employment_rate=employment)
+
+    @app.get("/ncs/tree")
+    def get_ncs_tree():
+        ds = dataset()
+        return {"version": ds.version, "tree": _ncs_node(ds.ncs_tree.root)}
+
+    @app.get("/ncs/links")
+    def get_ncs_links(large: Optional[str] = None, mid: Optional[str] = None, small: Optional[str] = None):
+        """NCS 경로(대/중/소, 일부만 가능)에 연결된 학과·직업. 링크 테이블은 첫 호출 때 로드."""
+        ds = dataset()
+        rows = path_rows(ds.ncs, large, mid, small)
+        if not len(rows):
+            raise HTTPException(404, "해당 NCS 직무 경로를 찾을 수 없습니다.")
+        links = ds.ncs_links.for_rows(rows)
+        return {
+            "version": ds.version,
+            "path": {"large": large, "mid": mid, "small": small},
+            "majors": links.get("major", []),
+            "jobs": links.get("job", []),
+        }
+
+    return app
+
+
+app = create_app()
@@ -0,0 +1,11 @@
+# -*- coding: utf-8 -*-
+# 자격증 대시보드 코어 (Streamlit 비의존) — 앱(streamlit.py), REST API(api.py), 오프라인 도구가 함께 사용
+#
+#   config    경로 / 컬럼 키        loaders   엑셀/CSV 로드·정규화      snapshot  컬럼형 스냅샷
+#   scoring   난이도 점수/등급      search    이름 검색(초성/오타)      facets    필터 비트맵 + 정렬 순열
+#   ncs       NCS 직무 트리         majors    학과 인덱스               jobs      직업 인덱스/상세
+#   results   필터 결과 캐시        dataset   위 인덱스를 묶은 Dataset  charts/qr 차트 스펙·PNG / QR
+#   compact   테이블 dtype 압축·메모리 보고   stats  연도×차수 합격률/응시자 수 배열
+#
+# import 비용은 numpy/pandas 가 대부분이다. matplotlib·qrcode(PIL)·argparse 는 실제로 그리거나
+# CLI 를 실행할 때만 함수 안에서 import 하므로, 모듈 상단에 무거운 import 를 추가하지 말 것.
@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+# 성능 벤치마크 — 저장소의 원천 파일(고정 입력)로 실제 코드 경로를 측정해 JSON 으로 저장하고 비교
+#
+#   python -m cert_core.bench                              # 전체 실행 → dist/bench.json
+#   python -m cert_core.bench --only filter --repeat 9     # 이름에 'filter' 가 들어간 항목만
+#   python -m cert_core.bench --compare base.json          # 실행 후 base.json 과 비교 (회귀 시 종료 코드 1)
+#   python -m cert_core.bench --compare base.json new.json # 저장된 두 결과만 비교
+#
+# 그룹: load / score / index / filter / render / app(Streamlit AppTest 로 스크립트 전체 재실행)
+# 네트워크를 쓰지 않는다. matplotlib / streamlit 이 없으면 해당 항목만 건너뛴다.
+
+import importlib.metadata
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import warnings
+
+from .config import CERT_PATHS, NCS_HOT_COLS, NCS_PATHS, ID_COL, NAME_COL, SNAPSHOT_DIR
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_OUT = "dist/bench.json"
+FORMAT_VERSION = 1
+
+
+# -------------------------------------------------
+# 측정
+# -------------------------------------------------
+def _clock(fn, number):
+    t = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return time.perf_counter() - t
+
+
+def measure(fn, repeat=5, min_time=0.05, slow=1.0):
+    """1회 워밍업 후 repeat 개 표본 (회당 ms). 한 번이 짧으면 timeit 처럼 min_time 이 될 때까지 묶어서 잰다.
+    워밍업이 slow 초를 넘는 항목(엑셀 읽기 등)은 표본을 3개로 줄인다."""
+    if _clock(fn, 1) > slow:
+        repeat = min(repeat, 3)
+    number = 1
+    while True:
+        t = _clock(fn, number)
+        if t >= min_time or number >= 100_000:
+            break
+        number *= 10 if t < min_time / 10 else 2
+    samples = [t / number] + [_clock(fn, number) / number for _ in range(repeat - 1)]
+    ms = [s * 1000.0 for s in samples]
+    return {
+        "median_ms": round(statistics.median(ms), 4),
+        "min_ms": round(min(ms), 4),
+        "mean_ms": round(statistics.fmean(ms), 4),
+        "stdev_ms": round(statistics.stdev(ms), 4) if len(ms) > 1 else 0.0,
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+# -------------------------------------------------
+# 벤치마크 정의 — (이름, 함수) 목록을 그룹별로 만든다
+# -------------------------------------------------
+def _load_cases():
+    from .loaders import SOURCES, _read_first_excel, _read_ncs, load_sources
+    from .snapshot import load_ncs_links, load_snapshot, source_ncs_links
+
+    cases = [("load.ncs_csv", lambda: _read_ncs(NCS_PATHS)),
+             ("load.ncs_csv_hot", lambda: _read_ncs(NCS_PATHS, columns=NCS_HOT_COLS)),
+             ("load.ncs_links_csv", source_ncs_links),
+             ("load.cert_excel", lambda: _read_first_excel(CERT_PATHS))]
+    for name, paths in SOURCES.items():
+        if name not in ("cert", "ncs"):
+            cases.append((f"load.{name}_excel", lambda p=paths: _read_first_excel(p)))
+    cases.append(("load.sources_all", load_sources))
+    if load_snapshot(SNAPSHOT_DIR, check_sources=False) is not None:
+        cases.append(("load.snapshot", lambda: load_snapshot(SNAPSHOT_DIR, check_sources=False)))
+        cases.append(("load.ncs_links_snapshot", lambda: load_ncs_links(SNAPSHOT_DIR)))
+    return cases
+
+
+def _score_cases(tables):
+    from .scoring import flag_no_pass, qcut_1to5, score_table
+    from .stats import YearPhaseStats
+
+    # 두 함수 모두 컬럼을 in-place 로 추가하므로 원본 복사본에서 시작 (복사 비용 포함)
+    raw, no_pass = tables["cert"].copy(), tables["no_pass"]
+    flagged = flag_no_pass(raw.copy(), no_pass)
+    diff = score_table(flagged.copy()).loc[lambda d: ~d["NO_PASS_DATA"], "DIFF_SCORE"]
+    return [
+        ("score.flag_no_pass", lambda: flag_no_pass(raw.copy(), no_pass)),
+        ("score.year_phase_stats", lambda: YearPhaseStats.from_frame(raw)),
+        ("score.score_table", lambda: score_table(flagged.copy())),
+        ("score.pipeline", lambda: score_table(flag_no_pass(raw.copy(), no_pass))),
+        ("score.qcut_1to5", lambda: qcut_1to5(diff)),
+    ]
+
+
+def _index_cases(ds, tables):
+    from .facets import FacetIndex
+    from .jobs import JobIndex
+    from .majors import MajorIndex
+    from .ncs import NcsTree
+    from .search import NameSearchIndex
+
+    cases = [
+        ("index.facets", lambda: FacetIndex(ds.cert)),
+        ("index.search", lambda: NameSearchIndex(ds.cert[NAME_COL])),
+        ("index.ncs_tree", lambda: NcsTree(tables["ncs"])),
+        ("index.jobs", lambda: JobIndex(tables["jobs"], tables["jobinfo"])),
+    ]
+    if tables["major"] is not None:
+        cases.append(("index.majors", lambda: MajorIndex(tables["major"])))
+    return cases
+
+
+def filter_combos(ds):
+    """사이드바 필터 조합 (이름 → filter_state 인자). 데이터에서 첫 선택지를 골라 고정 입력으로 쓴다."""
+    tree = ds.ncs_tree
+    large = (tree.large_options() or [None])[0]
+    mid = (tree.mid_options(large) or [None])[0] if large else None
+    small = (tree.small_options_for(large, mid) or [None])[0] if mid else None
+    major = next((m for m in ds.majors.names if ds.majors.license_ids(m)), None) if ds.majors else None
+    cls = next((c for c in ds.facets.cls_values if "국가기술" in c), None)
+    every = [1, 2, 3, 4, 5]
+    return {
+        "default": dict(levels=every),
+        "q_substring": dict(q="정보", levels=every),
+        "q_choseong": dict(q="ㅈㅂㅊㄹ", levels=every),
+        "q_fuzzy": dict(q="전기긱사", levels=every),
+        "cls_grade": dict(cls=cls, buckets=[300, 400], levels=every),
+        "structure": dict(want_w=True, want_p=True, levels=every),
+        "levels_4_5": dict(levels=[4, 5]),
+        "ncs_large": dict(ncs_large=large, levels=every),
+        "ncs_small": dict(ncs_large=large, ncs_mid=mid, ncs_small=small, levels=every),
+        "major": dict(major=major, levels=every),
+        "no_pass": dict(only_no_pass=True),
+        "combined": dict(q="기사", cls=cls, buckets=[300], want_p=True, levels=[3, 4, 5], ncs_large=large),
+    }
+
+
+def _filter_cases(ds):
+    from .results import filter_state, get_results, run_query
+
+    cases = []
+    for name, kwargs in filter_combos(ds).items():
+        fs = filter_state(**kwargs)
+        cases.append((f"filter.{name}", lambda fs=fs: run_query(ds, fs)))
+    fs = filter_state(levels=[1, 2, 3, 4, 5])
+    get_results(ds, fs)
+    cases.append(("filter.cached_hit", lambda: get_results(ds, fs)))
+    return cases
+
+
+def _render_cases(ds):
+    from .charts import chart_style, pass_rate_series, pass_rate_spec, radar_spec
+    from .jobs import DETAIL_SECTIONS, SCORE_KEYS, _build_detail, render_detail_html
+
+    pos = int(ds.cert["NO_PASS_DATA"].to_numpy(dtype=bool).argmin())  # 합격률 있는 첫 행
+    row = ds.cert.iloc[pos]
+    years, series = pass_rate_series(ds.stats, pos)
+    ji = ds.job_index
+    seqs = list(ji._info)[:200]
+    texts = [str(ji._info[s].get(col, "")) for s in seqs for col in DETAIL_SECTIONS]
+    cases = [
+        ("render.pass_rate_spec", lambda: pass_rate_spec(str(row[NAME_COL]), years, series)),
+        ("render.radar_spec", lambda: radar_spec(SCORE_KEYS, [50.0] * len(SCORE_KEYS))),
+        (f"render.detail_html_x{len(texts)}", lambda: [render_detail_html(t) for t in texts]),
+        (f"render.job_detail_x{len(seqs)}", lambda: [_build_detail(ji._info[s], ji.scores[ji._pos[s]]) for s in seqs]),
+    ]
+    try:
+        import matplotlib  # noqa: F401
+    except ImportError:
+        return cases
+    from .charts import render_pass_rate_png, render_radar_png
+
+    style = chart_style()
+    cases += [
+        ("render.pass_rate_png", lambda: render_pass_rate_png(str(row[NAME_COL]), years, series, style)),
+        ("render.radar_png", lambda: render_radar_png(SCORE_KEYS, [50.0] * len(SCORE_KEYS), style)),
+    ]
+    return cases
+
+
+def _import_apptest():
+    # 저장소 루트의 streamlit.py 가 streamlit 패키지를 가리지 않도록 import 하는 동안만 경로에서 뺀다
+    saved = sys.path[:]
+    sys.path[:] = [p for p in sys.path if os.path.abspath(p or ".") != ROOT]
+    try:
+        from streamlit import config as st_config, logger as st_logger
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        return None
+    finally:
+        sys.path[:] = saved
+    # 재실행마다 찍히는 폐기 예정(use_container_width) 안내 등 Streamlit 로그는 오류만
+    # (AppTest 가 설정을 다시 읽으면서 로그 레벨을 되돌리므로 설정값으로도 지정)
+    st_config.set_option("logger.level", "error")
+    st_logger.set_log_level("error")
+    return AppTest
+
+
+def _app_cases(ds):
+    """streamlit.py 전체 재실행: 첫 페이지 카드 그리드 / 자격증 합격률 차트 / 직업 상세 (워밍업 후라 캐시 적중 상태)."""
+    AppTest = _import_apptest()
+    if AppTest is None:
+        return []
+    script = os.path.join(ROOT, "streamlit.py")
+    lic = next((str(i) for i in ds.cert.loc[~ds.cert["NO_PASS_DATA"], ID_COL] if ds.job_index.jobs_for(i)), None)
+    seq = ds.job_index.jobs_for(lic)[0].seq if lic else None
+
+    def session(query=None, **state):
+        at = AppTest.from_file(script, default_timeout=120)
+        for k, v in (query or {}).items():
+            at.query_params[k] = v
+        for k, v in state.items():
+            at.session_state[k] = v
+        at.run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        return at
+
+    cases = [("app.cards_grid", session().run)]
+    if lic:
+        cases.append(("app.license_chart", session(selected_license=lic).run))
+        cases.append(("app.job_detail", session(selected_license=lic, selected_job_seq=seq).run))
+        cases.append(("app.license_chart_png", session({"charts": "png"}, selected_license=lic).run))
+    return cases
+
+
+# -------------------------------------------------
+# 실행 / 저장 / 비교
+# -------------------------------------------------
+def _meta(ds, repeat):
+    import numpy as np
+    import pandas as pd
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, timeout=10).stdout.strip() or None
+    except Exception:
+        commit = None
+    # 배포 메타데이터에서 읽는다 — import 하면 --no-app 일 때 저장소 루트의 streamlit.py(앱)가 실행됨
+    try:
+        st_version = importlib.metadata.version("streamlit")
+    except importlib.metadata.PackageNotFoundError:
+        st_version = None
+    return {
+        "format": FORMAT_VERSION,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "dataset_version": ds.version,
+        "rows": {"cert": len(ds.cert), "ncs": 0 if ds.ncs is None else len(ds.ncs),
+                 "jobinfo": 0 if ds.jobinfo is None else len(ds.jobinfo)},
+        "repeat": repeat,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "streamlit": st_version,
+    }
+
+
+def run(only=None, repeat=5, with_app=True, log=print):
+    """모든 벤치마크 실행 → {"meta": ..., "results": {이름: 측정값}}."""
+    from .dataset import build_dataset
+    from .loaders import load_sources
+    from .profiling import setup_logging
+
+    # 측정과 무관한 반복 출력(한글 글꼴 없는 환경의 글리프 경고, 재실행마다의 계측 로그) 숨김
+    warnings.filterwarnings("ignore", message=r"Glyph \d+ .* missing from font")
+    setup_logging(logging.WARNING)
+
+    tables = load_sources()
+    ds = build_dataset()
+    if ds.cert is None:
+        raise SystemExit("[bench] 자격증 데이터 파일을 찾을 수 없습니다.")
+
+    groups = [
+        lambda: _load_cases(),
+        lambda: _score_cases(tables),
+        lambda: _index_cases(ds, tables),
+        lambda: _filter_cases(ds),
+        lambda: _render_cases(ds),
+    ]
+    if with_app:
+        groups.append(lambda: _app_cases(ds))
+
+    results = {}
+    for make in groups:
+        for name, fn in make():
+            if only and not any(o in name for o in only):
+                continue
+            r = measure(fn, repeat=repeat)
+            results[name] = r
+            log(f"{name:<32} {r['median_ms']:>11.3f} ms  (min {r['min_ms']:.3f}, ×{r['number']}, n={r['repeat']})")
+    return {"meta": _meta(ds, repeat), "results": results}
+
+
+def compare(base, new, threshold=0.25, min_ms=0.05):
+    """중앙값 기준 비교 → 행 목록. 비율이 1+threshold 를 넘고 차이가 min_ms 이상이면 회귀."""
+    rows = []
+    b, n = base["results"], new["results"]
+    for name in sorted(set(b) | set(n)):
+        if name not in b or name not in n:
+            rows.append((name, b.get(name, {}).get("median_ms"), n.get(name, {}).get("median_ms"), None, "missing"))
+            continue
+        bm, nm = b[name]["median_ms"], n[name]["median_ms"]
+        ratio = nm / bm if bm > 0 else float("inf")
+        if ratio > 1 + threshold and nm - bm >= min_ms:
+            flag = "REGRESSION"
+        elif ratio < 1 / (1 + threshold) and bm - nm >= min_ms:
+            flag = "faster"
+        else:
+            flag = ""
+        rows.append((name, bm, nm, ratio, flag))
+    return rows
+
+
+def _print_compare(rows, base, new):
+    print(f"[bench] base {base['meta'].get('commit')} ({base['meta'].get('created_at')})"
+          f" → new {new['meta'].get('commit')} ({new['meta'].get('created_at')})")
+    for name, bm, nm, ratio, flag in rows:
+        fmt = lambda v: "-" if v is None else f"{v:.3f}"
+        r = "-" if ratio is None else f"{ratio:.2f}x"
+        print(f"{name:<32} {fmt(bm):>11} → {fmt(nm):>11} ms  {r:>7}  {flag}")
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write(path, result):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+def main(argv=None):
+    import argparse
+
+    ap = argparse.ArgumentParser(description="자격증 대시보드 성능 벤치마크 (JSON 저장 / 비교)")
+    ap.add_argument("--out", default=DEFAULT_OUT, help=f"결과 JSON 경로 (기본: {DEFAULT_OUT})")
+    ap.add_argument("--repeat", type=int, default=5, help="항목당 표본 수 (기본 5)")
+    ap.add_argument("--only", nargs="*", help="이름에 이 문자열이 들어간 항목만 (예: filter render.)")
+    ap.add_argument("--no-app", action="store_true", help="Streamlit AppTest 재실행 항목 제외")
+    ap.add_argument("--compare", nargs="+", metavar="JSON", help="BASE [NEW] — NEW 생략 시 지금 실행한 결과와 비교")
+    ap.add_argument("--threshold", type=float, default=0.25, help="회귀 판정 비율 (기본 0.25 = 25%% 느려짐)")
+    ap.add_argument("--min-ms", type=float, default=0.05, help="이보다 작은 차이는 무시 (ms, 기본 0.05)")
+    args = ap.parse_args(argv)
+
+    # 명령줄로 준 경로는 호출한 디렉터리 기준 (기본 출력만 저장소 루트 기준) — chdir 전에 절대 경로로
+    args.out = os.path.abspath(args.out) if args.out != DEFAULT_OUT else os.path.join(ROOT, DEFAULT_OUT)
+    args.compare = [os.path.abspath(p) for p in args.compare or []]
+    # 원천 경로가 저장소 루트 기준 상대 경로
+    os.chdir(ROOT)
+    if args.compare and len(args.compare) > 2:
+        ap.error("--compare 는 BASE [NEW] 두 개까지")
+
+    if args.compare and len(args.compare) == 2:
+        base, new = _read(args.compare[0]), _read(args.compare[1])
+    else:
+        new = run(only=args.only, repeat=max(2, args.repeat), with_app=not args.no_app)
+        _write(args.out, new)
+        print(f"[bench] {len(new['results'])}개 항목 → {args.out}")
+        if not args.compare:
+            return 0
+        base = _read(args.compare[0])
+
+    rows = compare(base, new, threshold=args.threshold, min_ms=args.min_ms)
+    _print_compare(rows, base, new)
+    regressions = [r[0] for r in rows if r[4] == "REGRESSION"]
+    if regressions:
+        print(f"[bench] 회귀 {len(regressions)}건 (>{args.threshold:.0%}): {', '.join(regressions)}")
+        return 1
+    print("[bench] 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# 프로세스 공유 LRU 캐시 — 모든 세션이 같이 쓰므로 잠금으로 보호, 적중/미스 횟수 집계
+# 데이터셋 버전이 바뀌면 이전 버전 항목은 버린다.
+
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """크기 제한 LRU. get_or_compute(version, key, fn) 으로 쓰면 데이터셋 버전별로 무효화된다."""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = None
+        self._built_at = float("-inf")
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def _bind(self, version, built_at):
+        # 더 새로 빌드된 데이터셋이 보이면 비우고 교체. 교체 직전의 옛 데이터셋 요청은 저장하지 않음.
+        if version == self._version:
+            return True
+        if built_at > self._built_at:
+            self._data.clear()
+            self._version, self._built_at = version, built_at
+            return True
+        return False
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_compute(self, version, built_at, key, compute):
+        with self._lock:
+            current = self._bind(version, built_at)
+            if current and key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+        # 계산은 잠금 밖에서 (같은 키가 동시에 계산될 수 있지만 결과는 같다)
+        value = compute()
+        if current:
+            with self._lock:
+                if version == self._version:
+                    self._data[key] = value
+                    while len(self._data) > self.maxsize:
+                        self._data.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "version": self._version,
+            }
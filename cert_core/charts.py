@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+# 차트 렌더링 + 렌더링된 차트 캐시
+#
+# 그리기는 pyplot 없이 matplotlib.figure.Figure 로만 한다 (전역 figure 목록/상태 없음 → 세션 간 병렬 렌더,
+# 참조가 끊기면 figure 도 해제). 폰트/크기는 전역 rcParams 를 바꾸지 않고 ChartStyle 을 각 요소에 직접 적용.
+#
+# 클라이언트 모드는 같은 데이터로 Vega-Lite(합격률)/Plotly(레이더) JSON 스펙만 만들어 브라우저가 그리게 한다.
+# PNG 경로는 정적 내보내기용으로 유지.
+#
+# 캐시: (차트 종류, 자격증ID/jobdicSeq, 데이터셋 버전, 스타일) → PNG 바이트
+# 메모리 LRU 가 1차, CHART_CACHE_DIR 가 있으면 내용 주소(sha256) 파일이 2차.
+
+import functools
+import hashlib
+import io
+import os
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .cache import LRUCache
+from .config import CHART_CACHE_DIR
+
+# 그리는 코드나 모양이 바뀌면 올린다 (이전 캐시 무효화)
+CHART_STYLE = "v2"
+
+# 합격률 차트(절반 크기)
+BASE_CHART_W, BASE_CHART_H = (3.2, 1.6)
+LINE_W, MARKER_S = 1.8, 5.0
+TITLE_FSIZE, TICK_FSIZE, LABEL_FSIZE = 12, 9, 10
+
+KOREAN_FONTS = ["Malgun Gothic", "AppleGothic", "NanumGothic", "Noto Sans CJK KR", "DejaVu Sans"]
+
+
+# -------------------------------------------------
+# 스타일
+# -------------------------------------------------
+@functools.lru_cache(maxsize=1)
+def korean_font():
+    """설치된 첫 한글 폰트 (프로세스당 한 번 조회)."""
+    from matplotlib import font_manager
+
+    installed = {f.name for f in font_manager.fontManager.ttflist}
+    return next((f for f in KOREAN_FONTS if f in installed), "DejaVu Sans")
+
+
+@dataclass(frozen=True)
+class ChartStyle:
+    font: str = "DejaVu Sans"
+    title_weight: str = "bold"
+    title_size: float = 15
+    label_size: float = 11
+    tick_size: float = 10
+    text_size: float = 10
+    grid_linestyle: str = "--"
+    grid_alpha: float = 0.35
+
+    @property
+    def key(self):
+        # 캐시 키용 문자열
+        return f"{CHART_STYLE}|{self.font}|{self.title_size}|{self.label_size}|{self.tick_size}"
+
+
+def chart_style():
+    return ChartStyle(font=korean_font())
+
+
+def _png(fig):
+    # st.pyplot 과 같은 저장 옵션
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    return buf.getvalue()
+
+
+def _hide_spines(ax):
+    for s in ("top", "right"):
+        if s in ax.spines:
+            ax.spines[s].set_visible(False)
+
+
+# -------------------------------------------------
+# 차트 데이터
+# -------------------------------------------------
+def pass_rate_series(stats, pos):
+    """연도×차수 통계의 pos 번째 자격증 → (연도 목록, {차수: 연도별 합격률}). 모든 차수 컬럼이 있는 연도만."""
+    return stats.series(pos)
+
+
+# -------------------------------------------------
+# 클라이언트 렌더링 스펙 (JSON 직렬화 가능한 dict, 숫자 수십 개)
+# -------------------------------------------------
+def _num_or_none(v):
+    return None if v is None or pd.isna(v) else round(float(v), 2)
+
+
+def pass_rate_spec(title, years, series):
+    """연도별 합격률 꺾은선 Vega-Lite 스펙. 값이 없는 점은 null → 선이 끊김."""
+    values = [
+        {"연도": str(y), "차수": ph, "합격률": _num_or_none(v)}
+        for ph, yv in series.items()
+        for y, v in zip(years, yv)
+    ]
+    return {
+        "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
+        "title": {"text": title, "fontSize": TITLE_FSIZE + 2, "fontWeight": "bold"},
+        "height": 220,
+        "data": {"values": values},
+        "mark": {"type": "line", "point": {"size": 50}, "strokeWidth": LINE_W + 0.7, "strokeCap": "round"},
+        "encoding": {
+            "x": {"field": "연도", "type": "ordinal", "title": None, "axis": {"labelAngle": 0}},
+            "y": {
+                "field": "합격률",
+                "type": "quantitative",
+                "title": "합격률(%)",
+                "scale": {"domain": [0, 100]},
+                "axis": {"values": [0, 20, 40, 60, 80, 100], "gridDash": [4, 4], "gridOpacity": 0.6},
+            },
+            "color": {"field": "차수", "type": "nominal", "sort": list(series),
+                      "legend": {"orient": "top", "title": None}},
+            "tooltip": [
+                {"field": "연도", "type": "ordinal"},
+                {"field": "차수", "type": "nominal"},
+                {"field": "합격률", "type": "quantitative", "format": ".1f"},
+            ],
+        },
+    }
+
+
+def radar_spec(keys, vals):
+    """직업 지표 레이더 Plotly 스펙 (figure dict)."""
+    keys, vals = list(keys), [float(v) for v in vals]
+    return {
+        "data": [{
+            "type": "scatterpolar",
+            "r": vals + vals[:1],
+            "theta": keys + keys[:1],
+            "fill": "toself",
+            "fillcolor": "rgba(31,119,180,0.12)",
+            "line": {"color": "#1f77b4", "width": 2.4},
+            "mode": "lines+markers+text",
+            "text": [f"{v:.0f}" for v in vals] + [""],
+            "textposition": "top center",
+            "hovertemplate": "%{theta}: %{r:.0f}<extra></extra>",
+        }],
+        "layout": {
+            "title": {"text": "직업 지표 레이더", "x": 0.5, "xanchor": "center"},
+            "polar": {
+                "radialaxis": {"range": [0, 100], "tickvals": [20, 40, 60, 80, 100], "angle": 90,
+                               "griddash": "dash"},
+                "angularaxis": {"rotation": 90, "direction": "clockwise", "griddash": "dash"},
+            },
+            "showlegend": False,
+            "height": 460,
+            "margin": {"l": 60, "r": 60, "t": 70, "b": 40},
+        },
+    }
+
+
+# -------------------------------------------------
+# 렌더링 (PNG 바이트)
+# -------------------------------------------------
+def render_pass_rate_png(title, years, series, style):
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(BASE_CHART_W, BASE_CHART_H), dpi=160)
+    ax = fig.add_subplot()
+    x = np.arange(len(years))
+    for ph, yv in series.items():
+        ax.plot(x, yv, marker="o", linewidth=LINE_W, markersize=MARKER_S, label=ph, solid_capstyle="round")
+    ax.set_xticks(x, [str(y) for y in years], fontsize=TICK_FSIZE, fontfamily=style.font)
+    ax.set_ylim(0, 100)
+    ticks = np.arange(0, 101, 20)
+    ax.set_yticks(ticks, [str(t) for t in ticks], fontsize=TICK_FSIZE, fontfamily=style.font)
+    ax.set_ylabel("합격률(%)", fontsize=LABEL_FSIZE, labelpad=3, fontfamily=style.font)
+    ax.set_title(title, pad=4, fontsize=TITLE_FSIZE, fontweight=style.title_weight, fontfamily=style.font)
+    ax.legend(
+        ncol=3,
+        loc="upper left",
+        bbox_to_anchor=(0.02, 1.02),
+        frameon=False,
+        prop={"family": style.font, "size": 9},
+        handlelength=2.0,
+        columnspacing=1.0,
+    )
+    ax.grid(True, which="major", linestyle=style.grid_linestyle, alpha=style.grid_alpha)
+    _hide_spines(ax)
+    fig.tight_layout(pad=0.4)
+    return _png(fig)
+
+
+def render_radar_png(keys, vals, style):
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(5.2, 5.2))
+    ax = fig.add_subplot(polar=True)
+    angles = np.linspace(0, 2 * np.pi, len(vals), endpoint=False)
+    ax.set_theta_offset(np.pi / 2)
+    ax.set_theta_direction(-1)
+    angles_c = np.concatenate([angles, angles[:1]])
+    vals_c = np.concatenate([vals, vals[:1]])
+    ax.plot(angles_c, vals_c, linewidth=2.4)
+    ax.fill(angles_c, vals_c, alpha=0.12)
+    ax.set_thetagrids(np.degrees(angles), keys, fontsize=style.tick_size, fontfamily=style.font)
+    ax.set_ylim(0, 100)
+    ax.set_rgrids([20, 40, 60, 80, 100], angle=90, fontsize=9, fontfamily=style.font)
+    ax.set_title("직업 지표 레이더", pad=12, fontsize=style.title_size,
+                 fontweight=style.title_weight, fontfamily=style.font)
+    ax.grid(True, linestyle=style.grid_linestyle, alpha=style.grid_alpha)
+    ax.spines["polar"].set_linewidth(0.9)
+    for ang, val in zip(angles, vals):
+        ax.annotate(
+            f"{val:.0f}",
+            (ang, val),
+            textcoords="offset points",
+            xytext=(0, 6),
+            ha="center",
+            fontsize=style.text_size,
+            fontfamily=style.font,
+        )
+    fig.tight_layout()
+    return _png(fig)
+
+
+# -------------------------------------------------
+# 캐시
+# -------------------------------------------------
+
+
+def chart_key(kind, item, version, style=CHART_STYLE):
+    raw = "\x1f".join(str(x) for x in (kind, str(item).strip(), version, style))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ChartCache:
+    def __init__(self, maxsize=128, disk_dir=CHART_CACHE_DIR):
+        self.memory = LRUCache(maxsize=maxsize)
+        self.disk_dir = disk_dir
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.disk_dir, key[:2], f"{key}.png")
+
+    def _read_disk(self, key):
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._path(key), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _write_disk(self, key, data):
+        if not self.disk_dir:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.tmp{os.getpid()}"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # 디스크 캐시는 선택 사항 — 실패해도 렌더 결과는 그대로 사용
+
+    def get_or_render(self, ds, kind, item, render, style=CHART_STYLE):
+        """render() → PNG 바이트. 같은 (종류, 항목, 버전, 스타일)이면 다시 그리지 않는다."""
+        key = chart_key(kind, item, ds.version, style)
+
+        def _load():
+            data = self._read_disk(key)
+            if data is None:
+                data = render()
+                if data:
+                    self._write_disk(key, data)
+            return data
+
+        return self.memory.get_or_compute(ds.version, ds.built_at, key, _load)
+
+    def stats(self):
+        return {**self.memory.stats(), "disk_dir": self.disk_dir}
+
+
+CHART_CACHE = ChartCache()
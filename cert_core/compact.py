@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# 메모리 압축 레이아웃 — 공유 Dataset 의 자격증/NCS 테이블을 작은 dtype 으로 바꾼다 (워커 프로세스마다 한 벌)
+#
+#   반복 문자열 (자격증_분류, 등급_분류, 검정 횟수, 시험종류, STRUCT_TXT, NCS 이름/학과/직업 …) → category
+#   합격률·응시자 수·평균 등 실수 → float32      (정렬 키 DIFF_SCORE 는 순서가 바뀌지 않도록 float64 유지)
+#   등급 코드 → Int16 (결측 허용),  NCS 대/중/소직무·직무 코드 → 가장 작은 정수형
+#   HAS_* / NO_PASS_DATA → bool,   자격증ID → 앞뒤 공백 없는 문자열 한 벌
+#
+#   python -m cert_core.compact     # 테이블별 압축 전/후 메모리 + 큰 컬럼 + 프로세스 RSS
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from .config import GRADE_COL, ID_COL, NAME_COL, NCS_JOB_CODE, NCS_L_CODE, NCS_LIC_ID, NCS_M_CODE, NCS_S_CODE
+from .loaders import _to_key
+
+# 고유값 비율이 이 이하인 문자열 컬럼만 category (자격증명처럼 거의 고유한 컬럼은 그대로)
+CATEGORY_MAX_RATIO = 0.5
+KEEP_FLOAT64 = {"DIFF_SCORE"}
+BOOL_COLS = ["NO_PASS_DATA", "HAS_W", "HAS_P", "HAS_I"]
+NCS_CODE_COLS = [NCS_L_CODE, NCS_M_CODE, NCS_S_CODE, NCS_JOB_CODE]
+
+
+def frame_bytes(df):
+    return 0 if df is None else int(df.memory_usage(index=True, deep=True).sum())
+
+
+def _is_text(s):
+    return s.dtype == object or pd.api.types.is_string_dtype(s.dtype)
+
+
+def _categorize(df, keep=()):
+    for c in df.columns:
+        s = df[c]
+        if c in keep or not _is_text(s) or isinstance(s.dtype, pd.CategoricalDtype):
+            continue
+        n = s.notna().sum()
+        if n and s.nunique(dropna=True) <= CATEGORY_MAX_RATIO * n:
+            df[c] = s.astype("category")
+
+
+def _float32(df):
+    for c in df.columns:
+        if c not in KEEP_FLOAT64 and df[c].dtype == np.float64:
+            df[c] = df[c].astype(np.float32)
+
+
+def _small_int(df, cols):
+    for c in cols:
+        if c not in df.columns:
+            continue
+        v = pd.to_numeric(df[c], errors="coerce")
+        if v.notna().all() and (v == v.round()).all():
+            df[c] = pd.to_numeric(v.astype(np.int64), downcast="integer")
+
+
+def compact_cert(df):
+    """점수 계산이 끝난 자격증 테이블 → 압축 복사본."""
+    out = df.copy()
+    out[ID_COL] = _to_key(out[ID_COL])
+    for c in BOOL_COLS:
+        if c in out.columns:
+            out[c] = out[c].to_numpy(dtype=bool)
+    if GRADE_COL in out.columns:
+        g = pd.to_numeric(out[GRADE_COL], errors="coerce")
+        if (g.dropna() == g.dropna().round()).all() and g.abs().max(skipna=True) < 2 ** 15:
+            out[GRADE_COL] = g.round().astype("Int16")
+    _float32(out)
+    _categorize(out, keep={NAME_COL, ID_COL})
+    return out
+
+
+def compact_ncs(df):
+    """NCS 매핑 테이블 → 압축 복사본 (코드는 작은 정수, 이름/학과/직업/자격증ID 는 category)."""
+    out = df.copy()
+    _small_int(out, NCS_CODE_COLS)
+    _float32(out)
+    _categorize(out)
+    if NCS_LIC_ID in out.columns and not isinstance(out[NCS_LIC_ID].dtype, pd.CategoricalDtype):
+        out[NCS_LIC_ID] = out[NCS_LIC_ID].astype("category")
+    return out
+
+
+def compact_tables(tables):
+    """{이름: 프레임} 중 자격증/NCS 를 압축 → (새 dict, {이름: (압축 전 바이트, 후 바이트)})."""
+    out, report = dict(tables), {}
+    for name, fn in (("cert", compact_cert), ("ncs", compact_ncs)):
+        t = tables.get(name)
+        if t is None:
+            continue
+        out[name] = fn(t)
+        report[name] = (frame_bytes(t), frame_bytes(out[name]))
+    return out, report
+
+
+def widen_floats(df):
+    """표시/직렬화용 (한 페이지 정도의 작은 프레임): float32 컬럼 → float64.
+    float32 의 최단 표기를 거쳐 45.3 이 45.29999923… 로 나가지 않게 한다."""
+    f32 = [c for c in df.columns if df[c].dtype == np.float32]
+    if not f32:
+        return df
+    out = df.copy()
+    for c in f32:
+        out[c] = pd.to_numeric(df[c].astype(str), errors="coerce")
+    return out
+
+
+# -------------------------------------------------
+# 메모리 보고
+# -------------------------------------------------
+def column_bytes(df, top=10):
+    """큰 컬럼 순 [(컬럼, dtype, 바이트)]."""
+    usage = df.memory_usage(index=False, deep=True).sort_values(ascending=False)
+    return [(c, str(df[c].dtype), int(b)) for c, b in usage.head(top).items()]
+
+
+def memory_report(ds):
+    """Dataset → [(테이블, 행 수, 압축 전 바이트 또는 None, 현재 바이트)]."""
+    rows = []
+    for name in ("cert", "ncs", "major", "jobs", "jobinfo"):
+        t = getattr(ds, name)
+        if t is None:
+            continue
+        before = ds.memory.get(name, (None, None))[0]
+        rows.append((name, len(t), before, frame_bytes(t)))
+    if ds.stats is not None:
+        rows.append(("stats", len(ds.stats), None, ds.stats.nbytes))
+    # NCS 학과/직업 링크는 로드된 경우에만 (처음 조회 전에는 메모리에 없음)
+    if ds.ncs_links is not None and ds.ncs_links.loaded:
+        for kind, t in ds.ncs_links.tables().items():
+            rows.append((f"ncs_{kind}", len(t), None, frame_bytes(t)))
+    return rows
+
+
+def _mb(b):
+    return f"{'-':>11}" if b is None else f"{b / 2**20:8.2f} MB"
+
+
+def main(argv=None):
+    import argparse
+
+    from .dataset import build_dataset
+    from .profiling import rss_bytes
+
+    ap = argparse.ArgumentParser(description="공유 Dataset 테이블 메모리 보고 (압축 전/후)")
+    ap.add_argument("--columns", type=int, default=8, help="테이블마다 보여줄 큰 컬럼 수 (기본 8)")
+    ap.add_argument("--links", action="store_true", help="NCS 학과/직업 링크 테이블도 로드해서 보고")
+    args = ap.parse_args(argv)
+
+    ds = build_dataset()
+    if args.links:
+        ds.ncs_links.tables()
+    total_before = total_after = 0
+    for name, n, before, after in memory_report(ds):
+        ratio = f"  ({after / before:.0%})" if before else ""
+        print(f"[memory] {name:<8} {n:>9,}행  {_mb(before)} → {_mb(after)}{ratio}")
+        total_before += before if before is not None else after
+        total_after += after
+        if name in ds.memory:
+            for c, dtype, b in column_bytes(getattr(ds, name), args.columns):
+                print(f"           {c:<24} {dtype:<10} {b / 1024:10.1f} KB")
+    print(f"[memory] 합계 {_mb(total_before)} → {_mb(total_after)},  프로세스 RSS {_mb(rss_bytes())}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
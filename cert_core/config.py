@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# 데이터 경로 / 컬럼 키 — 앱과 오프라인 빌드 도구가 함께 사용
+
+import os
+
+# -------------------------------------------------
+# 데이터 경로
+# -------------------------------------------------
+# 데이터 폴더 지정 (합성 데이터 등, python -m cert_core.synth) — 설정하면 그 폴더의 파일과 스냅샷만 사용
+DATA_DIR = os.environ.get("CERT_DATA_DIR") or None
+
+# 테이블 → data/ 폴더 파일명
+DATA_FILES = {
+    "cert": "data_cert.xlsx",
+    "major": "data_major.xlsx",
+    "jobs": "data_jobs.xlsx",
+    "jobinfo": "job_info.xlsx",
+    "no_pass": "no_pass.xlsx",
+    "ncs": "ncs_mapping.csv",
+}
+
+
+def data_dir_paths(data_dir, filename):
+    """데이터 폴더 안의 후보 경로 — 같은 이름의 .xlsx, .csv (대용량은 CSV)."""
+    stem = os.path.splitext(filename)[0]
+    return [os.path.join(data_dir, stem + ext) for ext in (".xlsx", ".csv")]
+
+
+def _paths(root_file, table):
+    return data_dir_paths(DATA_DIR, DATA_FILES[table]) if DATA_DIR else [root_file, f"data/{DATA_FILES[table]}"]
+
+
+CERT_PATHS = _paths("1010자격증데이터_통합.xlsx", "cert")
+MAJOR_PATHS = _paths("1013전공정보통합_final.xlsx", "major")
+JOBS_PATHS = _paths("직무분류데이터_병합완_with_ID_v3.xlsx", "jobs")
+JOBINFO_PATHS = _paths("직업정보_데이터.xlsx", "jobinfo")
+NO_PASS_PATHS = _paths("합격률이 나오지 않는 자격증.xlsx", "no_pass")
+NCS_PATHS = _paths("NCS직무상세분류_자격증_ID완전매핑.csv", "ncs")
+
+# 배포 주소 (홈 QR / 자격증 딥링크 QR)
+BASE_URL = "https://certificationapp-brnj3ctcykqixb9uyz9fb2.streamlit.app"
+
+# 빌드된 컬럼형 스냅샷 위치 (python -m cert_core.snapshot)
+SNAPSHOT_DIR = os.path.join(DATA_DIR, "snapshot") if DATA_DIR else "data/snapshot"
+
+# 렌더링된 차트 PNG 디스크 캐시 (미설정이면 메모리 캐시만 사용)
+CHART_CACHE_DIR = os.environ.get("CHART_CACHE_DIR") or None
+
+# 차트 표시 방식: "client" = Vega-Lite/Plotly 스펙을 브라우저가 그림, "png" = 서버 matplotlib 렌더 (URL ?charts=png 로도 전환)
+CHART_BACKEND = os.environ.get("CHART_BACKEND", "client")
+
+# 재실행 1회 렌더 예산(ms) — 초과하면 계측 로그를 WARNING 으로 남김 (0 이면 끔)
+RENDER_BUDGET_MS = float(os.environ.get("RENDER_BUDGET_MS", "1500"))
+
+# -------------------------------------------------
+# 컬럼 키
+# -------------------------------------------------
+GRADE_LABELS = {
+    100: "기술사(100)",
+    200: "기능장(200)",
+    300: "기사(300)",
+    400: "산업기사(400)",
+    500: "기능사(500)",
+}
+NAME_COL, ID_COL, CLS_COL = "자격증명", "자격증ID", "자격증_분류"
+GRADE_COL, GRADE_TYPE_COL = "자격증_등급_코드", "등급_분류"
+FREQ_COL, STRUCT_COL = "검정 횟수", "시험종류"
+W_COL, P_COL, I_COL = "필기", "실기", "면접"
+JOB_ID_COL, JOB_SEQ_COL = "자격증ID", "jobdicSeq"
+MAJOR_NAME_COL = "학과명"
+MAJOR_RATE_COLS = ["취업률_전체", "취업률_남", "취업률_여"]
+
+# 연도·차수별 통계 컬럼 (예: "2024년 1차 합격률", "2022년 2차 응시자수", "2023년 3차 응시자 수")
+# — 이름 패턴으로 찾으므로 연도/차수가 늘어도 코드 수정 불필요 (stats.py)
+STAT_COL_PATTERN = r"^\s*(?P<year>\d{4})\s*년\s*(?P<phase>\d+)\s*차\s*(?P<kind>합격률|응시자\s*수)\s*$"
+
+# NCS 컬럼명
+NCS_L_CODE, NCS_L_NAME = "대직무코드", "대직무분류"
+NCS_M_CODE, NCS_M_NAME = "중직무코드", "중직무분류"
+NCS_S_CODE, NCS_S_NAME = "소직무코드", "소직무분류"
+NCS_LIC_ID = "자격증ID"
+NCS_JOB_CODE = "직무코드"
+# 쉼표로 나열된 긴 텍스트 컬럼 → NCS 행 ↔ 학과 / 직업 링크 테이블 (필요할 때 로드)
+NCS_LINK_COLS = {"major": "학과", "job": "직업"}
+# 필터 화면(hot path)에 필요한 컬럼만 — 이 밖의 컬럼(학과, 직업, 자격증)은 읽지 않는다
+NCS_HOT_COLS = [NCS_L_CODE, NCS_L_NAME, NCS_M_CODE, NCS_M_NAME, NCS_S_CODE, NCS_S_NAME, NCS_JOB_CODE, NCS_LIC_ID]
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# 프로세스 공유 데이터셋 — 한 번 빌드해 모든 세션이 읽기 전용으로 공유
+# 원천 파일(mtime/크기)이 바뀌면 백그라운드에서 새로 빌드한 뒤 참조만 교체한다.
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .compact import compact_tables
+from .config import SNAPSHOT_DIR
+from .facets import FacetIndex
+from .jobs import JobIndex
+from .majors import MajorIndex
+from .ncs import NcsLinks, NcsTree
+from .profiling import RunProfile
+from .scoring import flag_no_pass, score_table
+from .snapshot import SCHEMA_VERSION, load_ncs_links, load_tables, snapshot_fingerprint, source_fingerprints
+from .stats import YearPhaseStats
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """파생 컬럼까지 계산된 테이블 묶음. 공유 객체이므로 프레임을 수정하지 말 것."""
+    version: str
+    cert: Optional[pd.DataFrame]
+    major: Optional[pd.DataFrame]
+    jobs: Optional[pd.DataFrame]
+    jobinfo: Optional[pd.DataFrame]
+    ncs: Optional[pd.DataFrame]
+    ncs_tree: NcsTree
+    facets: Optional[FacetIndex]
+    majors: Optional[MajorIndex]
+    job_index: JobIndex
+    built_at: float
+    build_ms: dict = field(default_factory=dict)
+    memory: dict = field(default_factory=dict)  # 압축한 테이블 → (압축 전 바이트, 후 바이트)
+    ncs_links: Optional[NcsLinks] = None        # NCS 행 ↔ 학과/직업 (처음 조회할 때 로드)
+    stats: Optional[YearPhaseStats] = None      # cert 행 × 연도 × 차수 합격률/응시자 수 (float32)
+
+
+def _fingerprints(snapshot_dir, with_hash):
+    # 원천 파일 + 스냅샷 manifest (스냅샷만 배포한 경우 원천 지문은 모두 None)
+    return dict(source_fingerprints(with_hash=with_hash), snapshot=snapshot_fingerprint(snapshot_dir, with_hash))
+
+
+def _version(fingerprints):
+    # 내용 해시 기반 → 파일을 touch 만 한 경우 같은 버전
+    payload = {k: (v or {}).get("sha256") for k, v in fingerprints.items()}
+    payload["schema"] = SCHEMA_VERSION
+    raw = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()[:12]
+
+
+def _stat_key(snapshot_dir=SNAPSHOT_DIR):
+    # 변경 감지용 저비용 키 (해시 없이 stat 만)
+    fps = _fingerprints(snapshot_dir, with_hash=False)
+    return tuple(
+        (name, fp["path"], fp["size"], fp["mtime_ns"]) if fp else (name, None)
+        for name, fp in sorted(fps.items())
+    )
+
+
+def build_dataset(snapshot_dir=SNAPSHOT_DIR):
+    # 단계별 소요 시간은 Dataset.build_ms 에 남기고 구조화 로그로도 기록 (디버그 패널 ?profile=1)
+    prof = RunProfile("dataset_build", budget_ms=0)
+    prof.lap("fingerprint")
+    fingerprints = _fingerprints(snapshot_dir, with_hash=True)
+    prof.lap("load")
+    tables = load_tables(snapshot_dir)
+    df = tables["cert"]
+    stats = None
+    if df is not None:
+        prof.lap("no_pass")
+        df = flag_no_pass(df, tables["no_pass"])
+        prof.lap("stats")
+        stats = YearPhaseStats.from_frame(df)
+        prof.lap("scoring")
+        df = score_table(df, stats)
+        # 연도·차수 원본 컬럼은 배열로 옮겼으므로 자격증 테이블에서는 뺀다
+        df = df.drop(columns=stats.columns)
+        stats = stats.astype(np.float32)
+    # 자격증/NCS 는 작은 dtype 으로 바꿔 보관 (인덱스도 압축된 프레임에서 만든다)
+    prof.lap("compact")
+    tables, memory = compact_tables(dict(tables, cert=df))
+    df = tables["cert"]
+    prof.lap("ncs")
+    ncs_tree = NcsTree(tables["ncs"])
+    prof.lap("facets")
+    facets = FacetIndex(df) if df is not None else None
+    prof.lap("majors")
+    majors = MajorIndex(tables["major"]) if tables["major"] is not None else None
+    prof.lap("jobs")
+    job_index = JobIndex(tables["jobs"], tables["jobinfo"])
+    prof.tags["version"] = version = _version(fingerprints)
+    prof.log()
+    return Dataset(
+        version=version,
+        cert=df,
+        major=tables["major"],
+        jobs=tables["jobs"],
+        jobinfo=tables["jobinfo"],
+        ncs=tables["ncs"],
+        ncs_tree=ncs_tree,
+        facets=facets,
+        majors=majors,
+        job_index=job_index,
+        built_at=time.time(),
+        build_ms=dict(prof.phases, total=prof.total_ms),
+        memory=memory,
+        ncs_links=NcsLinks(lambda: load_ncs_links(snapshot_dir)),
+        stats=stats,
+    )
+
+
+class DatasetStore:
+    """현재 Dataset 참조를 보관. get() 은 잠금 없이 즉시 반환하고, 변경 감지 시 재빌드는 별도 스레드."""
+
+    def __init__(self, builder=build_dataset, check_interval=2.0):
+        self._builder = builder
+        self._check_interval = check_interval
+        self._lock = threading.Lock()
+        self._current = None
+        self._stat_key = None
+        self._next_check = 0.0
+        self._rebuilding = False
+        self.last_error = None
+
+    def get(self):
+        cur = self._current
+        if cur is None:
+            # 최초 1회만 동기 빌드 (동시 첫 요청은 잠금에서 대기)
+            with self._lock:
+                if self._current is None:
+                    self._stat_key = _stat_key()
+                    self._current = self._builder()
+                    self._next_check = time.monotonic() + self._check_interval
+                return self._current
+        self._maybe_refresh()
+        return cur
+
+    def _maybe_refresh(self):
+        now = time.monotonic()
+        if now < self._next_check or self._rebuilding:
+            return
+        with self._lock:
+            if now < self._next_check or self._rebuilding:
+                return
+            self._next_check = now + self._check_interval
+            key = _stat_key()
+            if key == self._stat_key:
+                return
+            self._rebuilding = True
+        threading.Thread(target=self._rebuild, args=(key,), name="dataset-rebuild", daemon=True).start()
+
+    def _rebuild(self, key):
+        try:
+            ds, err = self._builder(), None
+        except Exception as e:
+            # 빌드 실패 시 기존 데이터셋 유지, 다음 파일 변경 때 재시도
+            ds, err = None, e
+        with self._lock:
+            if ds is not None and (self._current is None or ds.version != self._current.version):
+                self._current = ds
+            self._stat_key = key
+            self.last_error = err
+            self._rebuilding = False
+
+    def refresh(self, wait=False):
+        """파일 변경 여부와 관계없이 재빌드. wait=True 면 완료까지 대기."""
+        with self._lock:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+        t = threading.Thread(target=self._rebuild, args=(_stat_key(),), name="dataset-rebuild", daemon=True)
+        t.start()
+        if wait:
+            t.join()
+
+
+_STORE = DatasetStore()
+
+
+def get_dataset():
+    """프로세스 공유 Dataset (모듈 전역 → Streamlit 재실행/세션 간 유지)."""
+    return _STORE.get()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+# 사이드바 필터용 비트맵 인덱스 — 패싯 값마다 행 위치 불리언 배열을 미리 만들어 두고
+# 필터는 배열 AND 몇 번으로 끝낸다. 실제 행(DataFrame)은 보이는 페이지만 꺼낸다.
+# 화면 정렬 순서도 행 위치 순열로 미리 만들어 두므로 재실행마다 정렬하지 않는다.
+
+import numpy as np
+import pandas as pd
+
+from .config import NAME_COL, ID_COL, CLS_COL, GRADE_COL
+from .loaders import _to_key
+from .search import NameSearchIndex
+
+GRADE_BUCKETS = [100, 200, 300, 400, 500]
+
+
+def _value_bitmaps(values):
+    # 값 종류가 적은 컬럼 → {값: 불리언 배열}
+    codes, uniques = pd.factorize(values, use_na_sentinel=True)
+    return {u: codes == i for i, u in enumerate(uniques)}
+
+
+def _presort(df, keys, ascending):
+    # 정렬 순서의 행 위치 (안정 정렬, NaN 은 뒤로)
+    sub = df[keys].reset_index(drop=True)
+    return sub.sort_values(keys, ascending=ascending, kind="stable").index.to_numpy(dtype=np.intp)
+
+
+def _positions_by_key(keys):
+    # 고유값이 많은 컬럼(자격증ID) → {값: 행 위치 배열}
+    codes, uniques = pd.factorize(keys, use_na_sentinel=True)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+    return {u: order[bounds[i]:bounds[i + 1]] for i, u in enumerate(uniques)}
+
+
+class FacetIndex:
+    """자격증 테이블(행 위치 0..n-1)에 대한 패싯 비트맵."""
+
+    def __init__(self, df):
+        self.size = n = len(df)
+        self._none = np.zeros(n, dtype=bool)
+        self.names = df[NAME_COL].astype(str).to_numpy(dtype=object)
+        self.search = NameSearchIndex(self.names)
+        self.no_pass = df["NO_PASS_DATA"].to_numpy(dtype=bool)
+        self.has_w = df["HAS_W"].to_numpy(dtype=bool)
+        self.has_p = df["HAS_P"].to_numpy(dtype=bool)
+        self.has_i = df["HAS_I"].to_numpy(dtype=bool)
+
+        self.by_cls = _value_bitmaps(df[CLS_COL].astype(str))
+        self.cls_values = sorted(df[CLS_COL].dropna().astype(str).unique().tolist())
+
+        buckets = pd.to_numeric(df[GRADE_COL], errors="coerce").round(-2)
+        self.by_grade = _value_bitmaps(buckets)
+        self.grade_buckets = [b for b in GRADE_BUCKETS if b in self.by_grade]
+
+        self.by_level = _value_bitmaps(df["DIFF_LEVEL(1-5)"])
+        self._id_pos = _positions_by_key(_to_key(df[ID_COL]))
+
+        # 화면 정렬 순열: 난이도 점수 내림차순 → 합격률 오름차순 / 합격률 없음 목록은 이름순
+        self.by_score = _presort(df, ["DIFF_SCORE", "OVERALL_PASS(%)"], [False, True])
+        self.by_name = _presort(df, [NAME_COL], [True])
+
+    def _any_of(self, bitmaps, values):
+        m = self._none.copy()
+        for v in values:
+            b = bitmaps.get(v)
+            if b is not None:
+                m |= b
+        return m
+
+    def ids_mask(self, ids):
+        m = self._none.copy()
+        for k in ids:
+            pos = self._id_pos.get(str(k).strip())
+            if pos is not None:
+                m[pos] = True
+        return m
+
+    def positions_of(self, license_id):
+        return self._id_pos.get(str(license_id).strip(), np.empty(0, dtype=np.intp))
+
+    def ordered(self, mask, only_no_pass=False, rank=None):
+        """mask 에 해당하는 행 위치를 화면 정렬 순서로 (미리 만든 순열에서 골라냄).
+        rank(행 위치별 점수 배열)를 주면 점수 내림차순이 1순위, 기존 순서는 동점 처리."""
+        perm = self.by_name if only_no_pass else self.by_score
+        pos = perm[mask[perm]]
+        if rank is not None:
+            pos = pos[np.argsort(-rank[pos], kind="stable")]
+        return pos
+
+    def mask(self, *, only_no_pass=False, ids=None, q=None, cls=None, buckets=None,
+             want_w=False, want_p=False, want_i=False, levels=None, ncs_ids=None):
+        """조건을 모두 만족하는 행의 불리언 배열. None/False 인 조건은 적용하지 않음."""
+        m = self.no_pass.copy() if only_no_pass else ~self.no_pass
+        if ids:
+            m &= self.ids_mask(ids)
+        if cls is not None:
+            m &= self.by_cls.get(cls, self._none)
+        if buckets is not None:
+            m &= self._any_of(self.by_grade, buckets)
+        if want_w:
+            m &= self.has_w
+        if want_p:
+            m &= self.has_p
+        if want_i:
+            m &= self.has_i
+        if ncs_ids is not None:
+            m &= self.ids_mask(ncs_ids)
+        if levels is not None and not only_no_pass:
+            m &= self._any_of(self.by_level, levels)
+        if q:
+            # 리터럴 부분 일치 + 초성 검색 (정규식 아님)
+            m &= self.search.mask(q)
+        return m
+
+
+def query_rows(facets, *, q=None, only_no_pass=False, **filters):
+    """필터 + 이름 검색 → (정렬된 행 위치 배열, 오타 허용 검색 사용 여부).
+    검색어와 일치하는 이름이 하나도 없으면 필터를 통과한 행 중 오타 허용 검색 상위 결과로 대체하고
+    유사도 순으로 정렬. 오타 허용 검색 결과도 없으면 사용 여부는 False (빈 목록)."""
+    m = facets.mask(only_no_pass=only_no_pass, **filters)
+    rank = None
+    if q:
+        hit = facets.search.mask(q)
+        if not hit.any():
+            pos, score = facets.search.fuzzy(q, mask=m)
+            rank = np.full(facets.size, np.nan)
+            rank[pos] = score
+            hit = ~np.isnan(rank)
+        m &= hit
+    return facets.ordered(m, only_no_pass=only_no_pass, rank=rank), rank is not None and bool(hit.any())
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+# 자격증 → 관련 직무 / jobdicSeq → 직업정보 인덱스 — 로드 시 한 번 만들어 두고 화면에서는 dict 조회만
+# 직업 상세 패널(지표/레이더/본문 HTML)은 jobdicSeq 별로 처음 볼 때 한 번 만들어 인덱스에 보관한다.
+
+import html
+import re
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+from .config import JOB_ID_COL, JOB_SEQ_COL
+from .loaders import _to_key
+
+JOB_TITLE_COL, JOB_MAJOR_COL = "직업명", "학과명"
+JOB_MAJOR_SEP = ","  # 원천 학과명 셀의 구분자
+UNKNOWN_TITLE = "(직업명 미상)"
+
+# 관련 직무 카드 한 장: jobdicSeq, 직업명, 관련 학과(", " 로 합친 표시용 문자열), 관련 학과명 튜플
+# (API 는 튜플을 그대로 반환 — 학과명에 ", " 가 있어도 쪼개지지 않음)
+JobLink = namedtuple("JobLink", ["seq", "title", "majors", "major_list"])
+
+# 직업 상세: info = 원본 dict, metrics = ((지표, 값), ...), radar = 지표 6개 점수(없으면 None),
+# sections = ((제목, HTML 조각), ...)
+JobDetail = namedtuple("JobDetail", ["info", "metrics", "radar", "sections"])
+
+SCORE_KEYS = ["보상", "고용안정", "발전가능성", "근무여건", "직업전문성", "고용평등"]
+DETAIL_SECTIONS = [
+    "직업전망요약", "취업방법", "준비과정", "교육과정", "적성", "고용형태",
+    "고용분류", "표준분류", "직무구분", "초임", "유사직업명",
+]
+_NUM_RE = r"([-+]?\d*\.?\d+)"
+_BULLET_RE = re.compile(r"^[-•·‣]\s*")
+
+
+def _blank(v):
+    return not v or v.lower() in ("nan", "none")
+
+
+def render_detail_html(text):
+    """본문 텍스트 → HTML 조각. '-', '•' 등으로 시작하는 줄은 목록, 나머지는 문단. 내용은 HTML 이스케이프."""
+    if not text:
+        return ""
+    cleaned = []
+    for ln in (ln.strip() for ln in str(text).splitlines()):
+        if ln == "" and (not cleaned or cleaned[-1] == ""):
+            continue
+        cleaned.append(ln)
+
+    out, ul_open = [], False
+    for ln in cleaned:
+        m = _BULLET_RE.match(ln)
+        if m:
+            if not ul_open:
+                out.append("<ul style='margin:.25rem 0 .25rem 1.1rem;'>")
+                ul_open = True
+            out.append(f"<li>{html.escape(ln[m.end():])}</li>")
+        elif ln:
+            if ul_open:
+                out.append("</ul>")
+                ul_open = False
+            out.append(f"<p style='margin:.2rem 0;'>{html.escape(ln)}</p>")
+    if ul_open:
+        out.append("</ul>")
+    return "<div class='detail-box'>" + "".join(out) + "</div>"
+
+
+def score_matrix(df_jobinfo):
+    """지표 컬럼 → (행 수 × 6) float 행렬. 각 칸 텍스트의 첫 숫자, 없으면 NaN."""
+    cols = []
+    for k in SCORE_KEYS:
+        if k in df_jobinfo.columns:
+            num = df_jobinfo[k].astype("string").str.extract(_NUM_RE, expand=False)
+            cols.append(pd.to_numeric(num, errors="coerce").to_numpy(dtype="float64"))
+        else:
+            cols.append(np.full(len(df_jobinfo), np.nan))
+    return np.column_stack(cols) if cols else np.empty((len(df_jobinfo), 0))
+
+
+def _license_links(df_jobs):
+    lic = _to_key(df_jobs[JOB_ID_COL])
+    titles = df_jobs[JOB_TITLE_COL] if JOB_TITLE_COL in df_jobs.columns else UNKNOWN_TITLE
+    d = df_jobs.assign(_lic=lic.to_numpy(), **{JOB_TITLE_COL: titles})
+    if JOB_SEQ_COL not in d.columns:
+        d[JOB_SEQ_COL] = ""
+
+    links = {}
+    if JOB_MAJOR_COL in d.columns:
+        # (자격증, jobdicSeq, 직업명) 별로 학과명을 등장 순 중복 제거 — 키 정렬 순
+        # 원천 셀 하나에 "학과1, 학과2" 처럼 여러 학과가 들어 있으므로 인덱스를 만들 때 한 번만 나눈다
+        keys = ["_lic", JOB_SEQ_COL, JOB_TITLE_COL]
+        d = d.dropna(subset=keys)
+        majors = {}
+        for *key, cell in d.loc[d[JOB_MAJOR_COL].notna(), keys + [JOB_MAJOR_COL]].drop_duplicates().itertuples(
+            index=False, name=None
+        ):
+            names = majors.setdefault(tuple(key), {})
+            names.update(dict.fromkeys(m.strip() for m in str(cell).split(JOB_MAJOR_SEP) if m.strip()))
+        for key, seq, title in d[keys].drop_duplicates().sort_values(keys).itertuples(index=False, name=None):
+            names = tuple(majors.get((key, seq, title), ()))
+            links.setdefault(key, []).append(JobLink(str(seq).strip(), str(title), ", ".join(names), names))
+    else:
+        for key, seq, title in zip(d["_lic"], d[JOB_SEQ_COL], d[JOB_TITLE_COL]):
+            links.setdefault(key, []).append(JobLink(str(seq).strip(), str(title), "", ()))
+    return {k: tuple(v) for k, v in links.items()}
+
+
+def _info_rows(df_jobinfo):
+    # 값은 모두 문자열(결측은 "nan") + strip — 화면 코드의 "nan"/"none" 검사와 맞춤
+    cols = list(df_jobinfo.columns)
+    rows, pos = {}, {}
+    for i, (seq, values) in enumerate(zip(_to_key(df_jobinfo[JOB_SEQ_COL]),
+                                          df_jobinfo.itertuples(index=False, name=None))):
+        if seq not in rows:  # 같은 jobdicSeq 가 여럿이면 첫 행
+            rows[seq] = {c: ("nan" if pd.isna(v) else str(v)).strip() for c, v in zip(cols, values)}
+            pos[seq] = i
+    return rows, pos
+
+
+def _build_detail(r, scores):
+    metrics = tuple((k, r[k]) for k in SCORE_KEYS if not _blank(r.get(k, "")))
+    radar = None if np.isnan(scores).all() else tuple(np.nan_to_num(scores, nan=0.0).tolist())
+    sections = tuple(
+        (key, render_detail_html(r[key])) for key in DETAIL_SECTIONS if not _blank(r.get(key, ""))
+    )
+    return JobDetail(r, metrics, radar, sections)
+
+
+class JobIndex:
+    """jobs_for(자격증ID) → JobLink 튜플, info(jobdicSeq) → 직업정보 dict, detail(jobdicSeq) → JobDetail.
+    없는 jobdicSeq 는 None."""
+
+    def __init__(self, df_jobs, df_jobinfo):
+        self.has_jobs = df_jobs is not None and JOB_ID_COL in df_jobs.columns
+        self.has_info = df_jobinfo is not None and JOB_SEQ_COL in df_jobinfo.columns
+        self._links = _license_links(df_jobs) if self.has_jobs else {}
+        self._info, self._pos = _info_rows(df_jobinfo) if self.has_info else ({}, {})
+        self.scores = score_matrix(df_jobinfo) if self.has_info else np.empty((0, len(SCORE_KEYS)))
+        self._details = {}
+
+    def jobs_for(self, license_id):
+        return self._links.get(str(license_id).strip(), ())
+
+    def info(self, seq):
+        return self._info.get(str(seq).strip())
+
+    def detail(self, seq):
+        key = str(seq).strip()
+        d = self._details.get(key)
+        if d is None:
+            r = self._info.get(key)
+            if r is None:
+                return None
+            # 세션 간 공유 — 동시에 만들어도 결과는 같으므로 잠금 없이 마지막 값으로 덮어씀
+            d = self._details[key] = _build_detail(r, self.scores[self._pos[key]])
+        return d
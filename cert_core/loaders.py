@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# 원천 엑셀/CSV 로드 + 키 정규화
+
+import os
+
+import pandas as pd
+
+from .config import (
+    CERT_PATHS, MAJOR_PATHS, JOBS_PATHS, JOBINFO_PATHS, NO_PASS_PATHS, NCS_PATHS,
+    JOB_ID_COL, JOB_SEQ_COL,
+    NCS_L_CODE, NCS_L_NAME, NCS_M_CODE, NCS_M_NAME, NCS_S_CODE, NCS_S_NAME, NCS_LIC_ID,
+)
+
+# 테이블 이름 → 후보 경로 (앞에서부터 처음 읽히는 파일 사용)
+SOURCES = {
+    "cert": CERT_PATHS,
+    "major": MAJOR_PATHS,
+    "jobs": JOBS_PATHS,
+    "jobinfo": JOBINFO_PATHS,
+    "no_pass": NO_PASS_PATHS,
+    "ncs": NCS_PATHS,
+}
+
+
+def _to_key(series):
+    return pd.Series(series, dtype="object").astype(str).str.strip()
+
+
+def _read_first_excel(paths):
+    for p in paths:
+        try:
+            # 합성 대용량 데이터는 같은 컬럼의 CSV (엑셀 행 수 제한)
+            if str(p).lower().endswith(".csv"):
+                return pd.read_csv(p, encoding="utf-8-sig")
+            return pd.read_excel(p)
+        except Exception:
+            continue
+    return None
+
+
+def _read_ncs(paths, columns=None):
+    # columns: 읽을 컬럼만 (없는 컬럼은 무시) — 긴 텍스트 컬럼을 건너뛰어 파싱/메모리 절약
+    usecols = None if columns is None else (lambda c, keep=frozenset(columns): c in keep)
+    for p in paths:
+        try:
+            if str(p).lower().endswith((".csv", ".txt")):
+                return pd.read_csv(p, encoding="utf-8-sig", usecols=usecols)
+            else:
+                return pd.read_excel(p, usecols=usecols)
+        except Exception:
+            try:
+                return pd.read_csv(p, encoding="cp949", usecols=usecols)
+            except Exception:
+                continue
+    return None
+
+
+def resolve_source(paths):
+    """후보 경로 중 실제로 존재하는 첫 파일 (없으면 None)."""
+    for p in paths:
+        if os.path.isfile(p):
+            return p
+    return None
+
+
+def normalize_tables(tables):
+    """직무/직업정보/NCS 키 컬럼을 문자열·숫자로 정리 (in-place)."""
+    df_jobs = tables.get("jobs")
+    if df_jobs is not None:
+        if JOB_ID_COL in df_jobs.columns:
+            df_jobs[JOB_ID_COL] = _to_key(df_jobs[JOB_ID_COL])
+        if JOB_SEQ_COL in df_jobs.columns:
+            df_jobs[JOB_SEQ_COL] = _to_key(df_jobs[JOB_SEQ_COL])
+
+    df_jobinfo = tables.get("jobinfo")
+    if df_jobinfo is not None and JOB_SEQ_COL in df_jobinfo.columns:
+        df_jobinfo[JOB_SEQ_COL] = _to_key(df_jobinfo[JOB_SEQ_COL])
+
+    df_ncs = tables.get("ncs")
+    if df_ncs is not None and not df_ncs.empty:
+        for c in [NCS_L_NAME, NCS_M_NAME, NCS_S_NAME, NCS_LIC_ID]:
+            if c in df_ncs.columns:
+                df_ncs[c] = df_ncs[c].astype(str).str.strip()
+        for c in [NCS_L_CODE, NCS_M_CODE, NCS_S_CODE]:
+            if c in df_ncs.columns:
+                df_ncs[c] = pd.to_numeric(df_ncs[c], errors="coerce")
+    return tables
+
+
+def load_sources(sources=SOURCES, ncs_columns=None):
+    """원천 파일(엑셀/CSV)에서 전체 테이블을 읽어 정규화한다. 느린 경로.
+    ncs_columns: NCS 에서 읽을 컬럼 (기본 전체, 앱은 NCS_HOT_COLS)."""
+    tables = {}
+    for name, paths in sources.items():
+        tables[name] = _read_ncs(paths, ncs_columns) if name == "ncs" else _read_first_excel(paths)
+    return normalize_tables(tables)
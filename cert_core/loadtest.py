@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+# 다중 세션 부하 시험 — Streamlit AppTest 로 한 프로세스 안에서 동시 세션 N 개를 돌려 재실행 지연을 잰다
+#
+#   python -m cert_core.loadtest                              # 1/5/10/20 세션 단계별 → dist/loadtest.json
+#   python -m cert_core.loadtest --sessions 10 40 --loops 3   # 세션 수 / 세션당 시나리오 반복 횟수
+#   CERT_DATA_DIR=data/synth/x100 python -m cert_core.loadtest --budget-ms 500
+#
+# 세션마다 실제 사용 흐름(전공으로 필터, 자격증명 검색 q, NCS 대/중/소직무, 다음 ▶ 페이지 이동,
+# 관련 직무 보기 → 상세 정보)을 섞어 재생한다. 모든 세션이 같은 프로세스의 Dataset·캐시를 공유하므로
+# 서버 한 대가 받는 부하와 같다. 재실행 1회 = at.run() 1회 (스크립트 컴파일·실행 + 요소 트리 수신).
+#
+# AppTest 는 실행할 때마다 전역 Runtime/설정을 바꿔 끼우므로 동시에 두 개를 돌릴 수 없다 → 재실행은 잠금으로
+# 한 번에 하나씩 처리하고, 지연(latency)은 잠금 대기 + 실행으로 잰다. 스크립트는 대부분 GIL 을 잡는
+# 파이썬/pandas 코드라 실제 서버에서도 동시 재실행은 거의 직렬로 처리되므로 대기열 모델과 가깝다.
+# 실행 시간만 따로 service_* 로 남긴다 (서버와 달리 실행마다 스크립트를 다시 컴파일, 약 5 ms 포함).
+#
+# 보고: 단계별 p50/p95/p99 재실행 지연, 처리량(재실행/초), RSS 증가량/세션, 세션 상태 크기,
+# 그리고 p95 가 예산(--budget-ms) 안에 드는 최대 동시 세션 수.
+
+import os
+import pickle
+import random
+import statistics
+import sys
+import threading
+import time
+
+from .bench import ROOT, _import_apptest, _meta, _write
+from .profiling import rss_bytes
+
+DEFAULT_OUT = "dist/loadtest.json"
+DEFAULT_SESSIONS = [1, 5, 10, 20]
+ALL = "(전체)"
+
+_RUN_LOCK = threading.Lock()
+
+
+# -------------------------------------------------
+# 측정 도우미
+# -------------------------------------------------
+def percentile(values, p):
+    """선형 보간 백분위 (p: 0~100)."""
+    if not values:
+        return None
+    s = sorted(values)
+    k = (len(s) - 1) * p / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(s) - 1)
+    return s[lo] + (s[hi] - s[lo]) * (k - lo)
+
+
+def _state_bytes(at):
+    total = 0
+    for v in at.session_state.to_dict().values():
+        try:
+            total += len(pickle.dumps(v))
+        except Exception:
+            total += sys.getsizeof(v)
+    return total
+
+
+def _summary(ms):
+    return {
+        "count": len(ms),
+        "p50_ms": round(percentile(ms, 50), 2) if ms else None,
+        "p95_ms": round(percentile(ms, 95), 2) if ms else None,
+        "p99_ms": round(percentile(ms, 99), 2) if ms else None,
+        "max_ms": round(max(ms), 2) if ms else None,
+        "mean_ms": round(statistics.fmean(ms), 2) if ms else None,
+    }
+
+
+# -------------------------------------------------
+# 세션 — AppTest 하나 + 재실행 기록
+# -------------------------------------------------
+class Session:
+    """한 사용자(브라우저 탭). 위젯을 조작하고 run() 으로 재실행해 지연을 기록한다."""
+
+    def __init__(self, AppTest, script, rng, think_ms=0.0):
+        self.at = AppTest.from_file(script, default_timeout=120)
+        self.rng = rng
+        self.think_ms = think_ms
+        self.samples = []  # (단계 이름, 지연 ms, 실행 ms)
+        self.errors = []
+
+    def run(self, step):
+        if self.think_ms:
+            time.sleep(self.rng.uniform(0, self.think_ms) / 1000.0)
+        t0 = time.perf_counter()
+        with _RUN_LOCK:
+            t1 = time.perf_counter()
+            self.at.run()
+        t2 = time.perf_counter()
+        self.samples.append((step, (t2 - t0) * 1000.0, (t2 - t1) * 1000.0))
+        if self.at.exception:
+            self.errors.append(f"{step}: {self.at.exception[0].message}")
+
+    def buttons(self, label):
+        return [b for b in self.at.button if b.label == label and not b.disabled]
+
+    def widget(self, kind, key):
+        try:
+            return getattr(self.at, kind)(key=key)
+        except KeyError:
+            return None
+
+    def pick(self, options):
+        options = [o for o in options if o != ALL]
+        return self.rng.choice(options) if options else None
+
+
+# -------------------------------------------------
+# 시나리오 — 세션을 받아 위젯 조작 + 재실행 (해당 위젯이 없으면 건너뜀)
+# -------------------------------------------------
+def scenario_major(s):
+    """전공으로 필터 ON → 전공 검색 → 학과 선택 → OFF."""
+    toggle = s.widget("toggle", "use_major_toggle")
+    if toggle is None:
+        return
+    toggle.set_value(True)
+    s.run("major.toggle_on")
+    sel = s.widget("selectbox", "major_select")
+    if sel is not None:
+        major = s.pick(sel.options)
+        if major:
+            s.widget("text_input", "maj_q").input(major[:2])
+            s.run("major.search")
+            sel = s.widget("selectbox", "major_select")
+            choice = s.pick(sel.options)
+            if choice:
+                sel.select(choice)
+                s.run("major.select")
+    s.widget("toggle", "use_major_toggle").set_value(False)
+    s.run("major.toggle_off")
+
+
+def scenario_search(s, names):
+    """자격증명 검색 q — 앞 두 글자 → 전체 이름 → 초성 → 지우기."""
+    from .search import to_choseong
+
+    q = s.widget("text_input", "q")
+    if q is None or not names:
+        return
+    name = s.rng.choice(names)
+    for step, text in (("search.prefix", name[:2]), ("search.full", name),
+                       ("search.choseong", to_choseong(name)[:4]), ("search.clear", "")):
+        s.widget("text_input", "q").input(text)
+        s.run(step)
+
+
+def scenario_ncs(s):
+    """NCS 대직무 → 중직무 → 소직무 → 대직무 (전체) 로 되돌리기."""
+    for step, key in (("ncs.large", "ncs_large_name"), ("ncs.mid", "ncs_mid_name"), ("ncs.small", "ncs_small_name")):
+        sel = s.widget("selectbox", key)
+        choice = s.pick(sel.options) if sel is not None else None
+        if choice is None:
+            break
+        sel.select(choice)
+        s.run(step)
+    sel = s.widget("selectbox", "ncs_large_name")
+    if sel is not None and sel.value != ALL:
+        sel.select(ALL)
+        s.run("ncs.reset")
+
+
+def scenario_paging(s):
+    """다음 ▶ 세 번, ◀ 이전 한 번."""
+    for step, label in (("page.next", "다음 ▶"),) * 3 + (("page.prev", "◀ 이전"),):
+        btn = s.buttons(label)
+        if not btn:
+            break
+        btn[0].click()
+        s.run(step)
+
+
+def scenario_jobs(s):
+    """카드의 관련 직무 보기 → 직무의 상세 정보 → 상세 보기 닫기."""
+    cards = s.buttons("관련 직무 보기")
+    if not cards:
+        return
+    s.rng.choice(cards).click()
+    s.run("jobs.related")
+    details = s.buttons("상세 정보")
+    if not details:
+        return
+    s.rng.choice(details).click()
+    s.run("jobs.detail")
+    close = s.buttons("상세 보기 닫기")
+    if close:
+        close[0].click()
+        s.run("jobs.close")
+
+
+def _session_script(s, names, loops):
+    scenarios = [scenario_major, lambda x: scenario_search(x, names), scenario_ncs, scenario_paging, scenario_jobs]
+    s.run("open")
+    for _ in range(loops):
+        for scenario in s.rng.sample(scenarios, len(scenarios)):
+            scenario(s)
+
+
+# -------------------------------------------------
+# 실행
+# -------------------------------------------------
+def run_level(AppTest, n, names, loops=2, think_ms=0.0, seed=0):
+    """세션 n 개를 동시에 시작해 각자 시나리오를 loops 번 재생 → 단계 결과 dict."""
+    script = os.path.join(ROOT, "streamlit.py")
+    rss0 = rss_bytes()
+    sessions = [Session(AppTest, script, random.Random(seed * 1000 + i), think_ms) for i in range(n)]
+    start = threading.Barrier(n + 1)
+    failures = []
+
+    def worker(s):
+        start.wait()
+        try:
+            _session_script(s, names, loops)
+        except Exception as e:  # 위젯 조작 실패 등 — 세션만 중단하고 집계는 계속
+            failures.append(f"{type(e).__name__}: {e}")
+
+    threads = [threading.Thread(target=worker, args=(s,), daemon=True) for s in sessions]
+    for t in threads:
+        t.start()
+    start.wait()
+    t0 = time.perf_counter()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - t0
+    rss1 = rss_bytes()
+
+    ms = [v for s in sessions for _, v, _ in s.samples]
+    service = [v for s in sessions for _, _, v in s.samples]
+    steps = {}
+    for s in sessions:
+        for step, v, _ in s.samples:
+            steps.setdefault(step, []).append(v)
+    errors = [e for s in sessions for e in s.errors] + failures
+    out = {
+        "sessions": n,
+        "reruns": len(ms),
+        "wall_s": round(wall, 3),
+        "throughput_rps": round(len(ms) / wall, 2) if wall > 0 else None,
+        **_summary(ms),
+        "service_p50_ms": round(percentile(service, 50), 2) if service else None,
+        "service_p95_ms": round(percentile(service, 95), 2) if service else None,
+        "errors": len(errors),
+        "error_samples": errors[:5],
+        "rss_mb": None if rss1 is None else round(rss1 / 2**20, 1),
+        "rss_per_session_kb": None if rss0 is None or rss1 is None else round((rss1 - rss0) / n / 1024, 1),
+        "state_bytes_mean": round(statistics.fmean(_state_bytes(s.at) for s in sessions)),
+        "steps": {k: _summary(v) for k, v in sorted(steps.items())},
+    }
+    del sessions
+    return out
+
+
+def capacity(levels, budget_ms):
+    """p95 가 예산 안에 드는 최대 동시 세션 수 (오류가 난 단계는 제외, 없으면 0)."""
+    ok = [lv["sessions"] for lv in levels if lv["p95_ms"] is not None and lv["p95_ms"] <= budget_ms and not lv["errors"]]
+    return max(ok) if ok else 0
+
+
+def run(sessions=DEFAULT_SESSIONS, loops=2, think_ms=0.0, budget_ms=500.0, seed=0, log=print):
+    """세션 수 단계별로 부하 시험 → {"meta": ..., "budget_ms": ..., "capacity": ..., "levels": [...]}."""
+    import logging
+    import warnings
+
+    from .config import NAME_COL
+    from .dataset import get_dataset
+    from .profiling import setup_logging
+
+    warnings.filterwarnings("ignore", message=r"Glyph \d+ .* missing from font")
+    setup_logging(logging.WARNING)
+    AppTest = _import_apptest()
+    if AppTest is None:
+        raise SystemExit("[loadtest] streamlit 이 설치되어 있지 않습니다.")
+
+    ds = get_dataset()
+    if ds.cert is None:
+        raise SystemExit("[loadtest] 자격증 데이터 파일을 찾을 수 없습니다.")
+    names = sorted(ds.cert[NAME_COL].dropna().astype(str).unique().tolist())
+
+    # 워밍업: 모듈 import·캐시 채우기가 첫 단계 지연에 섞이지 않도록 한 세션을 미리 돌린다
+    run_level(AppTest, 1, names, loops=1, seed=seed)
+
+    levels = []
+    for n in sessions:
+        lv = run_level(AppTest, n, names, loops=loops, think_ms=think_ms, seed=seed)
+        levels.append(lv)
+        log(f"[loadtest] {n:>4} 세션  {lv['reruns']:>5} 재실행  p50 {lv['p50_ms']:>8.1f}  p95 {lv['p95_ms']:>8.1f}"
+            f"  p99 {lv['p99_ms']:>8.1f} ms  {lv['throughput_rps']:>7.2f} rps"
+            f"  RSS/세션 {lv['rss_per_session_kb'] if lv['rss_per_session_kb'] is not None else '-'} KB"
+            + (f"  오류 {lv['errors']}" if lv["errors"] else ""))
+    meta = _meta(ds, repeat=loops)
+    meta.update(loops=loops, think_ms=think_ms, seed=seed)
+    return {"meta": meta, "budget_ms": budget_ms, "capacity": capacity(levels, budget_ms), "levels": levels}
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+def main(argv=None):
+    import argparse
+
+    ap = argparse.ArgumentParser(description="동시 세션 부하 시험 (Streamlit AppTest, 재실행 지연/처리량/메모리)")
+    ap.add_argument("--sessions", type=int, nargs="+", default=DEFAULT_SESSIONS,
+                    help="동시 세션 수 단계 (기본 1 5 10 20)")
+    ap.add_argument("--loops", type=int, default=2, help="세션당 시나리오 묶음 반복 횟수 (기본 2)")
+    ap.add_argument("--think-ms", type=float, default=0.0, help="조작 사이 대기 상한 ms (0~값 무작위, 기본 0)")
+    ap.add_argument("--budget-ms", type=float, default=500.0, help="p95 재실행 지연 예산 (기본 500)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--out", default=DEFAULT_OUT, help=f"결과 JSON 경로 (기본: {DEFAULT_OUT})")
+    args = ap.parse_args(argv)
+
+    if any(n < 1 for n in args.sessions):
+        ap.error("--sessions 는 1 이상")
+    # --out 은 호출한 디렉터리 기준 (기본 출력만 저장소 루트 기준) — chdir 전에 절대 경로로
+    args.out = os.path.abspath(args.out) if args.out != DEFAULT_OUT else os.path.join(ROOT, DEFAULT_OUT)
+    os.chdir(ROOT)
+    result = run(sorted(set(args.sessions)), loops=max(1, args.loops), think_ms=args.think_ms,
+                 budget_ms=args.budget_ms, seed=args.seed)
+    _write(args.out, result)
+    print(f"[loadtest] p95 ≤ {args.budget_ms:.0f} ms 최대 동시 세션: {result['capacity']} → {args.out}")
+    return 1 if any(lv["errors"] for lv in result["levels"]) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
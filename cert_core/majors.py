@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# 학과 → 자격증 인덱스 — 학과별 자격증ID/취업률과 정렬된 학과명 목록을 로드 시 한 번만 계산
+
+import numpy as np
+import pandas as pd
+
+from .config import ID_COL, MAJOR_NAME_COL, MAJOR_RATE_COLS
+from .search import NameSearchIndex
+
+
+class MajorIndex:
+    """학과명 → (자격증ID 튜플, 취업률(전체, 남, 여) 또는 None). names 는 학과명 오름차순."""
+
+    def __init__(self, df_major):
+        names = df_major[MAJOR_NAME_COL].astype(str)
+        self.names = sorted(names.unique().tolist())
+        self.search = NameSearchIndex(self.names)
+
+        # 학과별 자격증ID (첫 등장 순, 중복 제거)
+        ids = df_major[ID_COL].astype(str)
+        self._ids = {k: tuple(v.tolist()) for k, v in ids.groupby(names, sort=False).unique().items()}
+
+        # 취업률: 값이 하나라도 있는 첫 행
+        self._rates = {}
+        if all(c in df_major.columns for c in MAJOR_RATE_COLS):
+            rates = df_major[MAJOR_RATE_COLS].apply(pd.to_numeric, errors="coerce").dropna(how="all")
+            first = rates[~names.loc[rates.index].duplicated()]
+            for name, row in zip(names.loc[first.index], first.to_numpy(dtype="float64")):
+                self._rates[name] = tuple(float(x) for x in row)
+
+    def __len__(self):
+        return len(self.names)
+
+    def filter(self, q):
+        """부분 일치/초성으로 거른 학과명 (정렬 순서 유지). 빈 질의면 전체."""
+        if not str(q).strip():
+            return self.names
+        return [self.names[i] for i in np.flatnonzero(self.search.mask(q))]
+
+    def license_ids(self, name):
+        return self._ids.get(name, ())
+
+    def employment(self, name):
+        return self._rates.get(name)
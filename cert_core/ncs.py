@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+# NCS 대직무 > 중직무 > 소직무 트리 — 선택지 목록과 자격증ID 집합을 로드 시 한 번만 계산
+# + NCS 행 ↔ 학과 / 직업 링크 테이블 (긴 쉼표 나열 컬럼을 정규화, 처음 쓸 때 로드)
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .config import (
+    NCS_L_CODE, NCS_L_NAME, NCS_M_CODE, NCS_M_NAME, NCS_S_CODE, NCS_S_NAME, NCS_LIC_ID, NCS_LINK_COLS,
+)
+from .loaders import _to_key
+
+
+class NcsNode:
+    """트리 노드. options = 하위 선택지(이름 오름차순, 같은 이름이면 코드순), ids = 하위 전체 자격증ID."""
+    __slots__ = ("name", "options", "children", "ids")
+
+    def __init__(self, name, ids=frozenset()):
+        self.name = name
+        self.options = []
+        self.children = {}
+        self.ids = ids
+
+
+def _options(df_ncs, parent_cols, code_col, name_col):
+    # (상위 키, 코드, 이름) 중복 제거 → 이름/코드 정렬 → 상위 키별 이름 목록
+    cols = parent_cols + [code_col, name_col]
+    opts = (
+        df_ncs[cols]
+        .dropna(subset=[code_col, name_col])
+        .drop_duplicates()
+        .sort_values([name_col, code_col], kind="stable")
+    )
+    if not parent_cols:
+        return opts[name_col].tolist()
+    key = parent_cols[0] if len(parent_cols) == 1 else parent_cols
+    return {k: g[name_col].tolist() for k, g in opts.groupby(key, sort=False, observed=True)}
+
+
+def _ids(df_ncs, keys):
+    key = keys[0] if len(keys) == 1 else keys
+    # 경로에 행은 있지만 ID 가 비어 있으면 빈 집합 (→ 결과 0건)
+    return {k: frozenset(ids.dropna()) for k, ids in df_ncs.groupby(key, sort=False, observed=True)["_lic_key"]}
+
+
+class NcsTree:
+    """대직무 → 중직무 → 소직무. 대직무 노드는 중직무를 건너뛴 소직무 선택(small_*)도 가진다."""
+
+    def __init__(self, df_ncs):
+        self.root = NcsNode("(전체)")
+        self.small_options = {}   # 대직무 → 소직무 선택지 (중직무 전체)
+        self.small_ids = {}       # (대직무, 소직무) → 자격증ID
+        self.has_ids = df_ncs is not None and NCS_LIC_ID in df_ncs.columns
+        if df_ncs is None or df_ncs.empty:
+            return
+
+        d = df_ncs.assign(_lic_key=_to_key(df_ncs[NCS_LIC_ID]) if self.has_ids else None)
+        L, M, S = NCS_L_NAME, NCS_M_NAME, NCS_S_NAME
+
+        self.root.options = _options(df_ncs, [], NCS_L_CODE, L)
+        mid_opts = _options(df_ncs, [L], NCS_M_CODE, M)
+        small_opts = _options(df_ncs, [L, M], NCS_S_CODE, S)
+        self.small_options = _options(df_ncs, [L], NCS_S_CODE, S)
+
+        l_ids, m_ids, s_ids = _ids(d, [L]), _ids(d, [L, M]), _ids(d, [L, M, S])
+        self.small_ids = _ids(d, [L, S])
+
+        for l_name in dict.fromkeys(self.root.options):
+            ln = self.root.children[l_name] = NcsNode(l_name, l_ids.get(l_name, frozenset()))
+            ln.options = mid_opts.get(l_name, [])
+            for m_name in dict.fromkeys(ln.options):
+                mn = ln.children[m_name] = NcsNode(m_name, m_ids.get((l_name, m_name), frozenset()))
+                mn.options = small_opts.get((l_name, m_name), [])
+                for s_name in dict.fromkeys(mn.options):
+                    mn.children[s_name] = NcsNode(s_name, s_ids.get((l_name, m_name, s_name), frozenset()))
+
+    # ---- 선택지 ----
+    def large_options(self):
+        return self.root.options
+
+    def mid_options(self, large):
+        node = self.root.children.get(large)
+        return node.options if node else []
+
+    def small_options_for(self, large, mid=None):
+        node = self.root.children.get(large)
+        if node is None:
+            return []
+        if mid is None:
+            return self.small_options.get(large, [])
+        mid_node = node.children.get(mid)
+        return mid_node.options if mid_node else []
+
+    # ---- 자격증ID ----
+    def license_ids(self, large=None, mid=None, small=None):
+        """부분 경로(대 / 대+중 / 대+중+소 / 대+소)의 자격증ID 합집합.
+        선택이 없거나 일치하는 행이 없으면 None (= NCS 조건 미적용)."""
+        if not self.has_ids or (large is None and mid is None and small is None):
+            return None
+        larges = [self.root.children[large]] if large in self.root.children else (
+            [] if large is not None else list(self.root.children.values())
+        )
+        out, found = set(), False
+        for ln in larges:
+            if mid is None and small is None:
+                ids = ln.ids
+            elif mid is None:
+                ids = self.small_ids.get((ln.name, small))
+            else:
+                mn = ln.children.get(mid)
+                ids = None if mn is None else (mn.ids if small is None else getattr(mn.children.get(small), "ids", None))
+            if ids is not None:
+                out |= ids
+                found = True
+        return out if found else None
+
+
+# -------------------------------------------------
+# 링크 테이블 (NCS 행 → 학과 / 직업)
+# -------------------------------------------------
+NCS_ROW = "ncs_row"
+
+
+def split_links(df_ncs, col):
+    """쉼표로 나열된 텍스트 컬럼 → (ncs_row = NCS 테이블 행 위치, col = 값 하나) 링크 테이블.
+    앞뒤 공백/빈 값/같은 행의 중복은 제거, 값은 category."""
+    s = df_ncs[col].reset_index(drop=True)
+    s = s[s.notna()].astype(str).str.split(",").explode().str.strip()
+    s = s[s.ne("") & s.ne("nan")]
+    links = pd.DataFrame({NCS_ROW: s.index.to_numpy(dtype=np.int32), col: s.to_numpy(dtype=object)})
+    links = links.drop_duplicates(ignore_index=True)
+    links[col] = links[col].astype("category")
+    return links
+
+
+def build_links(df_ncs):
+    """{종류: 링크 테이블} — NCS_LINK_COLS 중 테이블에 있는 컬럼만."""
+    if df_ncs is None:
+        return {}
+    return {kind: split_links(df_ncs, col) for kind, col in NCS_LINK_COLS.items() if col in df_ncs.columns}
+
+
+def path_rows(df_ncs, large=None, mid=None, small=None):
+    """부분 경로(대/중/소 — 각각 None 이면 조건 없음)에 속한 NCS 테이블 행 위치 (링크 테이블의 ncs_row)."""
+    if df_ncs is None:
+        return np.empty(0, dtype=np.intp)
+    m = np.ones(len(df_ncs), dtype=bool)
+    for col, v in ((NCS_L_NAME, large), (NCS_M_NAME, mid), (NCS_S_NAME, small)):
+        if v is not None and col in df_ncs.columns:
+            m &= (df_ncs[col] == v).to_numpy(dtype=bool, na_value=False)
+    return np.flatnonzero(m)
+
+
+class NcsLinks:
+    """NCS 행 ↔ 학과/직업 링크. 필터 화면에는 필요 없으므로 처음 조회할 때 loader() 로 한 번만 읽는다."""
+
+    def __init__(self, loader):
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._tables = None
+
+    @property
+    def loaded(self):
+        return self._tables is not None
+
+    def tables(self):
+        if self._tables is None:
+            with self._lock:
+                if self._tables is None:
+                    self._tables = self._loader() or {}
+        return self._tables
+
+    def table(self, kind):
+        """kind: "major" / "job" → 링크 테이블 (없으면 None)."""
+        return self.tables().get(kind)
+
+    def names_for(self, kind, ncs_rows):
+        """NCS 행 위치들에 연결된 값 (정렬, 중복 제거)."""
+        t = self.table(kind)
+        if t is None:
+            return []
+        col = NCS_LINK_COLS[kind]
+        return sorted(t.loc[t[NCS_ROW].isin(list(ncs_rows)), col].astype(str).unique().tolist())
+
+    def for_rows(self, ncs_rows):
+        """NCS 행 위치들 → {"major": [학과…], "job": [직업…]} (NCS → 학과/직업 조회)."""
+        return {kind: self.names_for(kind, ncs_rows) for kind in NCS_LINK_COLS}
+
+    def rows_for(self, kind, name):
+        """값(학과명/직업명)에 연결된 NCS 행 위치 배열."""
+        t = self.table(kind)
+        if t is None:
+            return np.empty(0, dtype=np.int32)
+        return t.loc[t[NCS_LINK_COLS[kind]] == str(name).strip(), NCS_ROW].to_numpy()
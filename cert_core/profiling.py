@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+# 재실행(요청) 단위 계측 — 구간별 소요 시간 + 화면 요소 수/전송 바이트 → 디버그 패널 + 구조화 로그(JSON 한 줄)
+#
+#   prof = RunProfile("rerun")
+#   prof.lap("sidebar")            # 순차 구간: 다음 lap()/finish() 까지의 시간 (합 ≈ 전체)
+#   with prof.span("charts"): ...  # 다른 구간 안에 포함되는 부분 구간 (누적)
+#   prof.finish(); prof.log()
+#
+# 로그는 logger "cert_core.profile" 로 나가며, 예산(RENDER_BUDGET_MS) 초과 재실행은 WARNING.
+
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+from .config import RENDER_BUDGET_MS
+
+log = logging.getLogger("cert_core.profile")
+
+
+def setup_logging(level=logging.INFO):
+    """cert_core 로거에 stderr 핸들러를 한 번만 붙인다 (앱 진입점에서 호출, 이미 설정돼 있으면 그대로)."""
+    root = logging.getLogger("cert_core")
+    if not root.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+        root.addHandler(handler)
+        root.setLevel(level)
+        root.propagate = False
+    return root
+
+
+def rss_bytes():
+    """현재 프로세스 RSS (리눅스 /proc, 그 외에는 최대 RSS 로 대신)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _ms(seconds):
+    return round(seconds * 1000.0, 2)
+
+
+class RunProfile:
+    """한 번의 재실행에 대한 구간 기록. 세션 간 공유하지 않는다."""
+
+    def __init__(self, run="rerun", budget_ms=RENDER_BUDGET_MS, **tags):
+        self.run = run
+        self.budget_ms = budget_ms
+        self.tags = dict(tags)
+        self.phases = {}
+        self.spans = {}
+        self.messages = 0
+        self.elements = 0
+        self.blocks = 0
+        self.bytes = 0
+        self.total_ms = None
+        self._t0 = self._lap_t = time.perf_counter()
+        self._lap_name = None
+
+    # ---- 시간 ----
+    def lap(self, name):
+        """이전 구간을 닫고 name 구간을 시작 (같은 이름이 다시 오면 누적)."""
+        now = time.perf_counter()
+        if self._lap_name is not None:
+            self.phases[self._lap_name] = self.phases.get(self._lap_name, 0.0) + _ms(now - self._lap_t)
+        self._lap_name, self._lap_t = name, now
+
+    @contextmanager
+    def span(self, name):
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans[name] = self.spans.get(name, 0.0) + _ms(time.perf_counter() - t)
+
+    # ---- 전송량 ----
+    def count_message(self, kind, nbytes):
+        """브라우저로 보낸 메시지 1건. kind: "new_element" / "add_block" / 그 외."""
+        self.messages += 1
+        self.bytes += int(nbytes)
+        if kind == "new_element":
+            self.elements += 1
+        elif kind == "add_block":
+            self.blocks += 1
+
+    # ---- 마무리 ----
+    def finish(self):
+        if self.total_ms is None:
+            self.lap(None)
+            self.total_ms = _ms(time.perf_counter() - self._t0)
+        return self
+
+    @property
+    def over_budget(self):
+        return self.total_ms is not None and self.budget_ms > 0 and self.total_ms > self.budget_ms
+
+    def summary(self):
+        return {
+            "event": self.run,
+            **self.tags,
+            "total_ms": self.total_ms,
+            "budget_ms": self.budget_ms,
+            "over_budget": self.over_budget,
+            "phases_ms": {k: round(v, 2) for k, v in self.phases.items()},
+            "spans_ms": {k: round(v, 2) for k, v in self.spans.items()},
+            "messages": self.messages,
+            "elements": self.elements,
+            "blocks": self.blocks,
+            "bytes": self.bytes,
+        }
+
+    def log(self):
+        self.finish()
+        level = logging.WARNING if self.over_budget else logging.INFO
+        if log.isEnabledFor(level):
+            log.log(level, json.dumps(self.summary(), ensure_ascii=False, default=str))
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# QR 코드 생성 — 같은 (URL, 크기)는 프로세스당 한 번만 렌더해 PNG 바이트를 메모리에 보관
+# 자격증 딥링크(?license=ID) QR 은 인쇄물용으로 파일에 일괄 출력 (python -m cert_core.qr)
+
+import csv
+import functools
+import hashlib
+import io
+import os
+import re
+import sys
+import time
+from urllib.parse import quote
+
+from .config import BASE_URL, ID_COL
+
+HOME_QR = {"box_size": 4, "border": 2}
+
+
+@functools.lru_cache(maxsize=256)
+def qr_png(data, box_size=4, border=2):
+    """data → QR PNG 바이트 (캐시됨, 읽기 전용으로 공유)."""
+    import qrcode
+
+    qr = qrcode.QRCode(version=1, box_size=box_size, border=border)
+    qr.add_data(data)
+    qr.make(fit=True)
+    img = qr.make_image(fill_color="black", back_color="white")
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def home_qr_png(base_url=BASE_URL):
+    return qr_png(base_url, **HOME_QR)
+
+
+def license_url(license_id, base_url=BASE_URL):
+    """자격증 딥링크 — 앱이 ?license=ID 로 열리면 해당 자격증이 선택된다."""
+    return f"{base_url.rstrip('/')}/?license={quote(str(license_id).strip())}"
+
+
+def iter_license_qrs(license_ids, base_url=BASE_URL, box_size=8, border=2):
+    """(자격증ID, URL, PNG 바이트) 를 하나씩 생성. 인쇄용은 기본 box_size 8."""
+    for lid in dict.fromkeys(str(x).strip() for x in license_ids):
+        if not lid or lid.lower() == "nan":
+            continue
+        url = license_url(lid, base_url)
+        # 일괄 출력은 한 번씩만 쓰므로 메모리 캐시를 거치지 않는다
+        yield lid, url, qr_png.__wrapped__(url, box_size, border)
+
+
+_UNSAFE = re.compile(r"[^\w-]")
+RESERVED_STEMS = {"home", "index"}  # main() 이 같은 폴더에 쓰는 파일
+
+
+def qr_filename(license_id):
+    """자격증ID → out_dir 안의 PNG 파일명. 글자·숫자·_·- 만 남기고(/, .., : 등은 _),
+    바뀌었거나 예약 이름과 겹치면 원래 ID 해시를 붙여 서로 다른 ID 가 같은 파일을 덮어쓰지 않게 한다."""
+    lid = str(license_id)
+    stem = _UNSAFE.sub("_", lid)[:80]
+    if stem != lid or not stem or stem.lower() in RESERVED_STEMS:
+        stem = f"{stem}_{hashlib.sha1(lid.encode('utf-8')).hexdigest()[:8]}"
+    return f"{stem}.png"
+
+
+def write_license_qrs(license_ids, out_dir, base_url=BASE_URL, box_size=8, border=2):
+    """out_dir/<자격증ID>.png (qr_filename) 로 저장하고 (ID, URL, 경로) 목록을 반환."""
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+    for lid, url, png in iter_license_qrs(license_ids, base_url, box_size, border):
+        path = os.path.join(out_dir, qr_filename(lid))
+        with open(path, "wb") as f:
+            f.write(png)
+        written.append((lid, url, path))
+    return written
+
+
+def main(argv=None):
+    import argparse
+
+    ap = argparse.ArgumentParser(description="홈/자격증 딥링크 QR 코드 PNG 일괄 생성")
+    ap.add_argument("--out", default="dist/qr", help="출력 디렉터리 (기본: dist/qr)")
+    ap.add_argument("--base-url", default=BASE_URL)
+    ap.add_argument("--ids", nargs="*", help="자격증ID 목록 (생략 시 데이터셋 전체)")
+    ap.add_argument("--box-size", type=int, default=8)
+    ap.add_argument("--border", type=int, default=2)
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    ids = args.ids
+    if ids is None:
+        from .snapshot import load_tables
+
+        cert = load_tables()["cert"]
+        if cert is None:
+            print("[qr] 자격증 데이터 파일을 찾을 수 없습니다.")
+            return 1
+        ids = cert[ID_COL].tolist()
+
+    os.makedirs(args.out, exist_ok=True)
+    with open(os.path.join(args.out, "home.png"), "wb") as f:
+        f.write(qr_png(args.base_url, args.box_size, args.border))
+    written = write_license_qrs(ids, args.out, args.base_url, args.box_size, args.border)
+    with open(os.path.join(args.out, "index.csv"), "w", encoding="utf-8-sig", newline="") as f:
+        w = csv.writer(f)
+        w.writerow(["자격증ID", "url", "file"])
+        w.writerows((lid, url, os.path.basename(path)) for lid, url, path in written)
+    print(f"[qr] {args.out} — 홈 1개 + 자격증 {len(written):,}개 ({time.perf_counter() - t0:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
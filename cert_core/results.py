@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# 필터 상태 → 정렬된 결과 행 위치. 같은 조합은 세션과 관계없이 공유 LRU 에서 바로 꺼낸다.
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .cache import LRUCache
+from .facets import query_rows
+from .search import normalize
+
+RESULT_CACHE = LRUCache(maxsize=512)
+
+
+@dataclass(frozen=True)
+class FilterState:
+    """정규화된 필터 조합 (캐시 키). '(전체)'/'(선택)' 같은 미선택은 None."""
+    q: Optional[str] = None
+    cls: Optional[str] = None
+    buckets: Optional[Tuple[int, ...]] = None
+    want_w: bool = False
+    want_p: bool = False
+    want_i: bool = False
+    levels: Optional[Tuple[int, ...]] = None
+    ncs: Tuple[Optional[str], Optional[str], Optional[str]] = (None, None, None)
+    major: Optional[str] = None
+    only_no_pass: bool = False
+
+
+def _unset(v, *blank):
+    return None if v is None or v in blank else v
+
+
+def filter_state(*, q=None, cls=None, buckets=None, want_w=False, want_p=False, want_i=False,
+                 levels=None, ncs_large=None, ncs_mid=None, ncs_small=None, major=None, only_no_pass=False):
+    """위젯 값 → FilterState. 결과가 같은 입력은 같은 키가 되도록 정렬/정규화한다."""
+    only_no_pass = bool(only_no_pass)
+    return FilterState(
+        # 검색은 소문자화 + 앞뒤 공백 무시 (공백만 입력하면 검색 조건 없음)
+        q=normalize(q).strip() or None if q else None,
+        cls=_unset(cls, "(전체)"),
+        buckets=None if buckets is None else tuple(sorted(set(buckets))),
+        want_w=bool(want_w),
+        want_p=bool(want_p),
+        want_i=bool(want_i),
+        # 합격률 없는 목록에는 난이도 조건이 적용되지 않음
+        levels=None if levels is None or only_no_pass else tuple(sorted(set(levels))),
+        ncs=tuple(_unset(x, "", "(전체)") for x in (ncs_large, ncs_mid, ncs_small)),
+        major=_unset(major, "", "(선택)"),
+        only_no_pass=only_no_pass,
+    )
+
+
+def run_query(ds, fs):
+    """캐시 없이 필터 파이프라인 실행 → (읽기 전용 행 위치 배열, 오타 허용 검색 사용 여부)."""
+    ids = list(ds.majors.license_ids(fs.major)) if fs.major and ds.majors is not None else None
+    order, fuzzy = query_rows(
+        ds.facets,
+        only_no_pass=fs.only_no_pass,
+        ids=ids,
+        q=fs.q,
+        cls=fs.cls,
+        buckets=None if fs.buckets is None else list(fs.buckets),
+        want_w=fs.want_w,
+        want_p=fs.want_p,
+        want_i=fs.want_i,
+        levels=None if fs.levels is None else list(fs.levels),
+        ncs_ids=ds.ncs_tree.license_ids(*fs.ncs),
+    )
+    order = np.ascontiguousarray(order)
+    order.flags.writeable = False
+    return order, fuzzy
+
+
+def get_results(ds, fs):
+    """(정렬된 행 위치, 오타 허용 검색 사용 여부). 데이터셋 버전이 바뀌면 캐시는 자동으로 비워진다."""
+    return RESULT_CACHE.get_or_compute(ds.version, ds.built_at, fs, lambda: run_query(ds, fs))
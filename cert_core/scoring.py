@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+# 합격률 없음 분리 + 난이도/합격률 계산
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from .config import (
+    NAME_COL, ID_COL, CLS_COL, GRADE_COL, FREQ_COL, STRUCT_COL, W_COL, P_COL, I_COL,
+)
+from .loaders import _to_key
+from .stats import YearPhaseStats, phase_avg_col
+
+# -------------------------------------------------
+# 합격률 없는 자격증 플래그
+# -------------------------------------------------
+def flag_no_pass(df, df_no):
+    df["NO_PASS_DATA"] = False
+    if df_no is not None and not df_no.empty:
+        ex_ids, ex_names = set(), set()
+        if ID_COL in df_no.columns:
+            ex_ids = set(_to_key(df_no[ID_COL]).dropna())
+        if NAME_COL in df_no.columns:
+            ex_names = set(_to_key(df_no[NAME_COL]).dropna())
+        # 추정 컬럼
+        if not ex_ids:
+            for c in df_no.columns:
+                if "자격증ID" in str(c) or str(c).lower() in ["id", "license_id", "cert_id"]:
+                    ex_ids = set(_to_key(df_no[c]).dropna())
+                    break
+        if not ex_names:
+            for c in df_no.columns:
+                if "자격증명" in str(c) or "자격증 명" in str(c) or str(c).lower() in ["name", "license_name", "cert_name"]:
+                    ex_names = set(_to_key(df_no[c]).dropna())
+                    break
+
+        df["NO_PASS_DATA"] = (
+            _to_key(df[ID_COL]).isin(ex_ids) |
+            _to_key(df[NAME_COL]).isin(ex_names)
+        )
+    return df
+
+
+# -------------------------------------------------
+# 난이도/합격률 계산
+# -------------------------------------------------
+SCORING = {
+    "trust_floor": 0.5,
+    "trust_span": 0.5,
+    "bonus_prac": 0.15,
+    "bonus_intv": 0.10,
+    "bonus_grade_max": 0.20,
+    "bonus_freq_max": 0.10,
+    "bonus_prof": 0.20,
+    "bonus_tech": 0.10,
+    "bonus_priv": 0.00,
+}
+
+
+def _map_unique(values, fn):
+    # 값 종류가 적은 컬럼: 고유값에만 fn 을 적용한 뒤 코드로 펼친다
+    codes, uniques = pd.factorize(pd.Series(values, dtype="object"), use_na_sentinel=True)
+    table = np.append(np.array([fn(u) for u in uniques], dtype="float64"), np.nan)
+    return table[codes]  # code -1(NaN) → 마지막 칸(NaN)
+
+
+def _label_bonus(label):
+    s = str(label)
+    if "전문" in s:
+        return SCORING["bonus_prof"]
+    if "기술" in s:
+        return SCORING["bonus_tech"]
+    if "민간" in s:
+        return SCORING["bonus_priv"]
+    return 0.0
+
+
+def class_bonus(labels):
+    b = _map_unique(labels, _label_bonus)
+    b[np.isnan(b)] = _label_bonus(np.nan)
+    return b
+
+
+def trust_weight(avg_apps):
+    a = np.asarray(avg_apps, dtype="float64")
+    valid = ~np.isnan(a)
+    if not valid.any():
+        return np.ones_like(a)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        norm = np.log1p(a) / np.nanmax(np.log1p(a))
+    return np.where(valid, SCORING["trust_floor"] + SCORING["trust_span"] * norm, 1.0)
+
+
+def grade_bonus(codes):
+    c = pd.to_numeric(pd.Series(codes), errors="coerce").to_numpy(dtype="float64")
+    b = np.clip((500.0 - c) / 400.0, 0.0, 1.0) * SCORING["bonus_grade_max"]
+    return np.where(np.isnan(c), 0.0, b)
+
+
+def freq_to_num(x):
+    if x is None:
+        return np.nan
+    if isinstance(x, (int, float)) and not np.isnan(x):
+        return float(x)
+    s = str(x).strip()
+    if s == "" or s.lower() == "nan":
+        return np.nan
+    if "상시" in s or "연중" in s:
+        return 12.0
+    if "수시" in s:
+        return 6.0
+    m = re.search(r"(\d+)", s)
+    return float(m.group(1)) if m else np.nan
+
+
+def freq_bonus(freq):
+    f = np.asarray(freq, dtype="float64")
+    valid = ~np.isnan(f)
+    if not valid.any():
+        return np.zeros_like(f)
+    fmin, fmax = float(np.nanmin(f)), float(np.nanmax(f))
+    if fmax == fmin:
+        return np.zeros_like(f)
+    return np.where(valid, ((fmax - f) / (fmax - fmin)) * SCORING["bonus_freq_max"], 0.0)
+
+
+def _band_1to5(v):
+    out = np.full(v.shape, np.nan)
+    valid = ~np.isnan(v)
+    if not valid.any():
+        return out
+    mn, mx = float(np.nanmin(v)), float(np.nanmax(v))
+    if mx == mn:
+        out[valid] = 3.0
+        return out
+    r = (v[valid] - mn) / (mx - mn + 1e-12)
+    out[valid] = np.clip(np.floor(r * 5) + 1, 1, 5)
+    return out
+
+
+def qcut_1to5(s: pd.Series) -> pd.Series:
+    """5분위 등급(1~5). 분위 경계가 겹치면 최소~최대 구간 5등분으로 대체."""
+    v = pd.to_numeric(s, errors="coerce").to_numpy(dtype="float64", copy=True)
+    v[np.isinf(v)] = np.nan
+    valid = ~np.isnan(v)
+    if np.unique(v[valid]).size >= 5:
+        # 분위 경계는 pandas 버전별 보정까지 동일하도록 pd.qcut 에 맡긴다
+        try:
+            out = np.full(v.shape, np.nan)
+            out[valid] = pd.qcut(v[valid], 5, labels=False) + 1.0
+            return pd.Series(out, index=s.index, dtype="float")
+        except ValueError:
+            pass
+    return pd.Series(_band_1to5(v), index=s.index, dtype="float")
+
+
+# 구조 파싱 (필기/실기/면접 여부 + 표시용 텍스트)
+STRUCT_LABELS = np.array([
+    "+".join(x for x, bit in (("필기", 1), ("실기", 2), ("면접", 4)) if code & bit)
+    for code in range(8)
+], dtype=object)
+
+
+def parse_structure(df):
+    n = len(df)
+    t = (
+        df[STRUCT_COL].fillna("").astype(str)
+        if STRUCT_COL in df.columns else pd.Series([""] * n, index=df.index)
+    )
+    flags = []
+    for word, col in (("필기", W_COL), ("실기", P_COL), ("면접", I_COL)):
+        has = t.str.contains(word, regex=False).to_numpy(dtype=bool)
+        if col in df.columns:
+            has = has | (pd.to_numeric(df[col], errors="coerce").to_numpy(dtype="float64") > 0)
+        flags.append(has)
+    has_w, has_p, has_i = flags
+    code = has_w.astype(np.int8) | (has_p.astype(np.int8) << 1) | (has_i.astype(np.int8) << 2)
+    return has_w, has_p, has_i, STRUCT_LABELS[code]
+
+
+def score_table(df, stats=None):
+    """평균 합격률/응시자수, 시험 구조, DIFF_SCORE / DIFF_LEVEL(1-5) 컬럼을 한 번에 추가 (in-place).
+    stats: df 의 연도×차수 배열 (없으면 df 의 통계 컬럼에서 만든다)."""
+    if stats is None:
+        stats = YearPhaseStats.from_frame(df)
+
+    # 평균 합격률/응시자수 — 연도×차수 배열의 축 방향 평균
+    phase_avg = stats.phase_avg()
+    for j, ph in enumerate(stats.phases):
+        df[phase_avg_col(ph)] = phase_avg[:, j]
+
+    overall = stats.overall()
+    df["OVERALL_PASS(%)"] = overall
+
+    apps = stats.applicants_avg()
+    df["APPLICANTS_AVG"] = apps
+
+    has_w, has_p, has_i, struct_txt = parse_structure(df)
+    df["HAS_W"], df["HAS_P"], df["HAS_I"], df["STRUCT_TXT"] = has_w, has_p, has_i, struct_txt
+
+    freq_numeric = _map_unique(df[FREQ_COL], freq_to_num) if FREQ_COL in df.columns else np.full(len(df), np.nan)
+    inv_overall = (100.0 - overall) / 100.0
+
+    raw = (
+        np.where(np.isnan(inv_overall), 0.0, inv_overall) * trust_weight(apps)
+        + class_bonus(df[CLS_COL])
+        + grade_bonus(df[GRADE_COL])
+        + freq_bonus(freq_numeric)
+        + (np.where(has_p, SCORING["bonus_prac"], 0.0) + np.where(has_i, SCORING["bonus_intv"], 0.0))
+    )
+
+    valid_mask = ~df["NO_PASS_DATA"].to_numpy(dtype=bool)
+    level = np.full(len(df), np.nan)
+    level[valid_mask] = qcut_1to5(pd.Series(raw[valid_mask])).to_numpy()
+    df["DIFF_LEVEL(1-5)"] = level
+    df["DIFF_SCORE"] = np.where(valid_mask, raw, np.nan)
+    return df
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+# 자격증명 검색 인덱스 — 초성(ㅈㅂㅊㄹ → 정보처리) / 부분 문자열 / 오타 허용
+#
+# 이름마다 두 가지 형태를 색인한다.
+#   원형  : 소문자화한 이름            "정보처리기사"
+#   초성형: 한글 음절을 초성으로 치환  "ㅈㅂㅊㄹㄱㅅ"
+# 질의의 각 글자는 초성형으로도 항상 바꿀 수 있으므로, 초성형 bigram 교집합이 후보의 상위집합이 되고
+# 음절끼리의 bigram 은 더 선택적인 원형 색인을 쓴다. 후보는 질의에서 만든 정규식으로 최종 확인.
+#
+# 오타 허용 검색(fuzzy)은 공백을 뺀 자모 분해 문자열(전기기사 → ㅈㅓㄴㄱㅣㄱㅣㅅㅏ)의 trigram 색인을 쓴다.
+# 자모 단위라 한 글자 오타가 깨뜨리는 trigram 수가 적다.
+
+import re
+
+import numpy as np
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHO_SET = frozenset(CHOSEONG)
+_SYL_FIRST, _SYL_LAST = 0xAC00, 0xD7A3
+_SYL_PER_CHO = 588  # 중성 21 × 종성 28
+JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+             "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+
+
+def _cho_char(ch):
+    code = ord(ch)
+    if _SYL_FIRST <= code <= _SYL_LAST:
+        return CHOSEONG[(code - _SYL_FIRST) // _SYL_PER_CHO]
+    return ch
+
+
+def normalize(text):
+    return str(text).casefold()
+
+
+def to_choseong(text):
+    """한글 음절 → 초성, 그 외 문자는 그대로 (소문자화)."""
+    return "".join(_cho_char(ch) for ch in normalize(text))
+
+
+def to_jamo(text):
+    """공백 제거 + 한글 음절을 초/중/종성으로 분해 (오타 비교용 키)."""
+    out = []
+    for ch in normalize(text):
+        code = ord(ch)
+        if _SYL_FIRST <= code <= _SYL_LAST:
+            idx = code - _SYL_FIRST
+            out.append(CHOSEONG[idx // _SYL_PER_CHO] + JUNGSEONG[(idx % _SYL_PER_CHO) // 28] + JONGSEONG[idx % 28])
+        elif not ch.isspace():
+            out.append(ch)
+    return "".join(out)
+
+
+def _trigrams(key):
+    padded = f"$${key}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def substring_distance(q, t):
+    """q 를 t 의 어느 구간에 맞추는 최소 편집 거리 (t 앞뒤 잘라내기는 무비용)."""
+    prev = [0] * (len(t) + 1)
+    for i, qc in enumerate(q, 1):
+        cur = [i]
+        for j, tc in enumerate(t, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (qc != tc)))
+        prev = cur
+    return min(prev)
+
+
+def _char_pattern(ch):
+    # 초성 글자는 해당 초성으로 시작하는 모든 음절과도 일치
+    if ch in _CHO_SET:
+        start = _SYL_FIRST + CHOSEONG.index(ch) * _SYL_PER_CHO
+        return f"[{ch}{chr(start)}-{chr(start + _SYL_PER_CHO - 1)}]"
+    return re.escape(ch)
+
+
+def query_pattern(q):
+    """질의 → 정규식. 입력 문자는 모두 리터럴 취급 (정규식 메타문자 안전)."""
+    return re.compile("".join(_char_pattern(ch) for ch in normalize(q)))
+
+
+def _grams(s, n):
+    return {s[i:i + n] for i in range(len(s) - n + 1)}
+
+
+class NameSearchIndex:
+    """행 위치 0..n-1 의 이름 목록에 대한 검색 인덱스. 데이터셋이 바뀔 때만 다시 만든다."""
+
+    def __init__(self, names):
+        self.names = [str(x) for x in names]
+        self.size = len(self.names)
+        self.norm = [normalize(x) for x in self.names]
+        self.cho = [to_choseong(x) for x in self.norm]
+
+        raw, cho = {}, {}
+        for i, (s, c) in enumerate(zip(self.norm, self.cho)):
+            for g in _grams(s, 1) | _grams(s, 2):
+                raw.setdefault(g, []).append(i)
+            for g in _grams(c, 1) | _grams(c, 2):
+                cho.setdefault(g, []).append(i)
+        self._raw = {g: np.asarray(v, dtype=np.int32) for g, v in raw.items()}
+        self._cho = {g: np.asarray(v, dtype=np.int32) for g, v in cho.items()}
+
+        # 오타 허용 검색용 자모 trigram 색인
+        self.jamo = [to_jamo(x) for x in self.norm]
+        tri = {}
+        for i, key in enumerate(self.jamo):
+            for g in _trigrams(key):
+                tri.setdefault(g, []).append(i)
+        self._tri = {g: np.asarray(v, dtype=np.int32) for g, v in tri.items()}
+
+    # ---- 후보 ----
+    def _postings(self, gram):
+        if any(ch in _CHO_SET for ch in gram):
+            return self._cho.get("".join(_cho_char(ch) for ch in gram))
+        return self._raw.get(gram)
+
+    def _candidates(self, qn):
+        grams = [qn] if len(qn) == 1 else [qn[i:i + 2] for i in range(len(qn) - 1)]
+        lists = []
+        for g in dict.fromkeys(grams):
+            p = self._postings(g)
+            if p is None:
+                return np.empty(0, dtype=np.int32)
+            lists.append(p)
+        lists.sort(key=len)
+        out = lists[0]
+        for p in lists[1:]:
+            out = np.intersect1d(out, p, assume_unique=True)
+            if not len(out):
+                break
+        return out
+
+    def _matches(self, qn):
+        # 후보 → 최종 확인. 단일 gram 이면 postings 자체가 정답, 아니면 가장 싼 방법으로 확인
+        cands = self._candidates(qn)
+        jamo = [ch in _CHO_SET for ch in qn]
+        if len(qn) <= 2 and (all(jamo) or not any(jamo)):
+            return cands
+        if not any(jamo):
+            keep = [i for i in cands.tolist() if qn in self.norm[i]]
+        elif all(jamo):
+            keep = [i for i in cands.tolist() if qn in self.cho[i]]
+        else:
+            pat = query_pattern(qn)
+            keep = [i for i in cands.tolist() if pat.search(self.norm[i])]
+        return np.asarray(keep, dtype=np.int32)
+
+    # ---- 조회 ----
+    def mask(self, q):
+        """일치 여부 불리언 배열 (순위 계산 없음)."""
+        m = np.zeros(self.size, dtype=bool)
+        qn = normalize(q).strip()
+        if qn:
+            m[self._matches(qn)] = True
+        return m
+
+    def fuzzy(self, q, k=20, min_score=0.6, pool=40, mask=None):
+        """오타 허용 검색 → (행 위치, 점수) 점수 내림차순 상위 k.
+        점수 = 0.5·(질의 trigram 중 이름에 있는 비율) + 0.5·(1 − 부분 편집거리/질의 길이), 소수 둘째 자리 반올림.
+        trigram 을 공유하는 이름만 후보로 보고, 공유 비율 상위 pool 개만 편집거리를 계산한다.
+        mask: 행 위치 불리언 배열 — 주면 그 행들 안에서만 후보/상위 k 를 고른다 (필터가 걸린 목록)."""
+        key = to_jamo(q)
+        if not key:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        grams = _trigrams(key)
+        lists = [self._tri[g] for g in grams if g in self._tri]
+        if not lists:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        cand, shared = np.unique(np.concatenate(lists), return_counts=True)
+        if mask is not None:
+            keep = mask[cand]
+            cand, shared = cand[keep], shared[keep]
+        coverage = shared / len(grams)
+        top = np.argsort(-coverage, kind="stable")[:pool]
+
+        scored, dist = [], {}
+        for c, cov in zip(cand[top].tolist(), coverage[top].tolist()):
+            t = self.jamo[c]
+            d = dist.get(t)
+            if d is None:
+                d = dist[t] = substring_distance(key, t)
+            score = round(0.5 * cov + 0.5 * max(0.0, 1.0 - d / len(key)), 2)
+            if score >= min_score:
+                scored.append((-score, len(t), c))
+        scored.sort()
+        scored = scored[:k]
+        return (
+            np.asarray([c for _, _, c in scored], dtype=np.intp),
+            np.asarray([-s for s, _, _ in scored], dtype="float64"),
+        )
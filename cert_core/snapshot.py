@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+# 컬럼형 데이터 스냅샷 — 엑셀/CSV 를 한 번 읽어 parquet 로 저장하고 앱은 이것을 우선 로드
+#
+#   python -m cert_core.snapshot            # data/snapshot 빌드
+#   python -m cert_core.snapshot --check    # 스냅샷이 원천 파일과 일치하는지 확인
+
+import hashlib
+import json
+import os
+import sys
+import time
+
+import pandas as pd
+
+from .config import NCS_HOT_COLS, NCS_LINK_COLS, NCS_PATHS, SNAPSHOT_DIR
+from .loaders import SOURCES, _read_ncs, load_sources, resolve_source
+from .ncs import build_links
+
+# 저장 형식/정규화 규칙이 바뀌면 올린다 → 이전 스냅샷은 자동으로 무시됨
+# v2: ncs.parquet 는 NCS_HOT_COLS 만, 학과/직업은 ncs_<종류>.parquet 링크 테이블로 분리
+SCHEMA_VERSION = 2
+MANIFEST_NAME = "manifest.json"
+
+
+# -------------------------------------------------
+# 원천 파일 지문 (경로 + 크기 + mtime + sha256)
+# -------------------------------------------------
+def _sha256(path, chunk=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as fp:
+        for block in iter(lambda: fp.read(chunk), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def file_fingerprint(path, with_hash=True):
+    st = os.stat(path)
+    fp = {"path": str(path), "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    if with_hash:
+        fp["sha256"] = _sha256(path)
+    return fp
+
+
+def source_fingerprints(with_hash=True, sources=SOURCES):
+    out = {}
+    for name, paths in sources.items():
+        p = resolve_source(paths)
+        out[name] = file_fingerprint(p, with_hash) if p else None
+    return out
+
+
+def _same_source(recorded, path):
+    if recorded is None or os.path.abspath(recorded.get("path", "")) != os.path.abspath(path):
+        return False
+    st = os.stat(path)
+    if st.st_size != recorded.get("size"):
+        return False
+    if st.st_mtime_ns == recorded.get("mtime_ns"):
+        return True
+    # git checkout 등으로 mtime 만 바뀐 경우 → 내용 해시로 판정
+    return recorded.get("sha256") is not None and _sha256(path) == recorded["sha256"]
+
+
+def is_stale(manifest, sources=SOURCES):
+    """원천 파일이 스냅샷 빌드 이후 바뀌었으면 True. 원천 파일이 없으면 스냅샷을 그대로 신뢰."""
+    recorded = manifest.get("sources", {})
+    for name, paths in sources.items():
+        p = resolve_source(paths)
+        if p is None:
+            continue
+        if not _same_source(recorded.get(name), p):
+            return True
+    return False
+
+
+def snapshot_fingerprint(snapshot_dir=SNAPSHOT_DIR, with_hash=True):
+    """스냅샷 manifest 지문 (없으면 None) — 원천 파일 없이 스냅샷만 배포해도 교체를 감지하기 위해.
+    sha256 은 manifest 의 내용(스키마·테이블·행 수·원천 해시)으로 계산 → 같은 데이터로 다시 빌드하면 같은 값."""
+    path = os.path.join(snapshot_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    fp = file_fingerprint(path, with_hash=False)
+    if with_hash:
+        m = read_manifest(snapshot_dir) or {}
+        content = {k: m.get(k) for k in ("schema_version", "tables", "links", "rows")}
+        content["sources"] = {n: (f or {}).get("sha256") for n, f in (m.get("sources") or {}).items()}
+        fp["sha256"] = hashlib.sha256(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+    return fp
+
+
+# -------------------------------------------------
+# 빌드 / 로드
+# -------------------------------------------------
+def _to_columnar(df):
+    # 엑셀 혼합형(object) 컬럼(예: 검정 횟수 = 1, "상시")은 문자열로 통일 — parquet 는 컬럼당 단일 타입
+    out = df.copy()
+    for c in out.columns:
+        if out[c].dtype == object:
+            s = out[c]
+            out[c] = s.where(s.isna(), s.astype(str))
+    return out
+
+
+def _write_atomic(path, write):
+    tmp = f"{path}.tmp{os.getpid()}"
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def read_manifest(snapshot_dir=SNAPSHOT_DIR):
+    try:
+        with open(os.path.join(snapshot_dir, MANIFEST_NAME), encoding="utf-8") as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return None
+
+
+def build_snapshot(snapshot_dir=SNAPSHOT_DIR, sources=SOURCES):
+    """원천 파일을 읽어 테이블별 parquet + manifest.json 을 쓴다. manifest 는 마지막에 교체.
+    sources: 테이블 → 후보 경로 (기본은 설정의 원천 경로, 합성 데이터 폴더 등은 직접 지정)."""
+    fingerprints = source_fingerprints(sources=sources)
+    tables = load_sources(sources)
+    os.makedirs(snapshot_dir, exist_ok=True)
+
+    # NCS: 필터용 컬럼만 본 테이블로, 긴 학과/직업 텍스트는 행 위치 기준 링크 테이블로
+    links = build_links(tables.get("ncs"))
+    if tables.get("ncs") is not None:
+        tables["ncs"] = tables["ncs"][[c for c in NCS_HOT_COLS if c in tables["ncs"].columns]]
+
+    def _save(fn, t):
+        _write_atomic(
+            os.path.join(snapshot_dir, fn),
+            lambda p: _to_columnar(t).to_parquet(p, index=False),
+        )
+        return fn
+
+    files, rows, link_files = {}, {}, {}
+    for name, t in tables.items():
+        if t is None:
+            continue
+        files[name], rows[name] = _save(f"{name}.parquet", t), len(t)
+    for kind, t in links.items():
+        link_files[kind], rows[f"ncs_{kind}"] = _save(f"ncs_{kind}.parquet", t), len(t)
+
+    manifest = {
+        "schema_version": SCHEMA_VERSION,
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "tables": files,
+        "links": link_files,
+        "rows": rows,
+        "sources": fingerprints,
+    }
+
+    def _dump(p):
+        with open(p, "w", encoding="utf-8") as fp:
+            json.dump(manifest, fp, ensure_ascii=False, indent=2)
+
+    _write_atomic(os.path.join(snapshot_dir, MANIFEST_NAME), _dump)
+    return manifest
+
+
+def _usable_manifest(snapshot_dir, check_sources):
+    manifest = read_manifest(snapshot_dir)
+    if not manifest or manifest.get("schema_version") != SCHEMA_VERSION:
+        return None
+    if check_sources and is_stale(manifest):
+        return None
+    return manifest
+
+
+def load_snapshot(snapshot_dir=SNAPSHOT_DIR, check_sources=True):
+    """스냅샷 테이블 dict. 없거나 스키마 버전이 다르거나 원천보다 오래되었으면 None."""
+    manifest = _usable_manifest(snapshot_dir, check_sources)
+    if manifest is None:
+        return None
+    try:
+        tables = {
+            name: pd.read_parquet(os.path.join(snapshot_dir, fn))
+            for name, fn in manifest.get("tables", {}).items()
+        }
+    except Exception:
+        # pyarrow 미설치 / 파일 손상 → 원천 경로로 폴백
+        return None
+    for name in SOURCES:
+        tables.setdefault(name, None)
+    return tables
+
+
+def load_tables(snapshot_dir=SNAPSHOT_DIR):
+    """스냅샷이 유효하면 스냅샷, 아니면 엑셀/CSV 원천에서 로드 (NCS 는 필터용 컬럼만)."""
+    tables = load_snapshot(snapshot_dir)
+    return tables if tables is not None else load_sources(ncs_columns=NCS_HOT_COLS)
+
+
+def load_ncs_links(snapshot_dir=SNAPSHOT_DIR):
+    """NCS 행 → 학과/직업 링크 테이블 dict. 스냅샷이 유효하면 스냅샷, 아니면 원천 CSV 의 두 컬럼만 읽어 만든다."""
+    manifest = _usable_manifest(snapshot_dir, check_sources=True)
+    if manifest is not None:
+        try:
+            return {
+                kind: pd.read_parquet(os.path.join(snapshot_dir, fn))
+                for kind, fn in manifest.get("links", {}).items()
+            }
+        except Exception:
+            pass
+    return source_ncs_links()
+
+
+def source_ncs_links():
+    """원천 NCS 파일에서 학과/직업 두 컬럼만 읽어 링크 테이블 dict 생성."""
+    return build_links(_read_ncs(NCS_PATHS, columns=list(NCS_LINK_COLS.values())))
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+def main(argv=None):
+    import argparse
+
+    ap = argparse.ArgumentParser(description="원천 엑셀/CSV → 컬럼형 스냅샷(parquet) 빌드")
+    ap.add_argument("--out", default=SNAPSHOT_DIR, help=f"스냅샷 디렉터리 (기본: {SNAPSHOT_DIR})")
+    ap.add_argument("--check", action="store_true", help="빌드하지 않고 최신 여부만 확인")
+    args = ap.parse_args(argv)
+
+    if args.check:
+        manifest = read_manifest(args.out)
+        if not manifest or manifest.get("schema_version") != SCHEMA_VERSION:
+            print(f"[snapshot] 없음 또는 스키마 불일치: {args.out}")
+            return 1
+        if is_stale(manifest):
+            print(f"[snapshot] 원천 파일이 변경됨 → 다시 빌드 필요: {args.out}")
+            return 1
+        print(f"[snapshot] 최신 (schema v{SCHEMA_VERSION}, built {manifest.get('built_at')})")
+        return 0
+
+    t0 = time.perf_counter()
+    manifest = build_snapshot(args.out)
+    rows = ", ".join(f"{k}={v:,}" for k, v in manifest["rows"].items())
+    print(f"[snapshot] {args.out} 빌드 완료 ({time.perf_counter() - t0:.2f}s) — {rows}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# 연도 × 차수 통계 — "2024년 1차 합격률", "2022년 2차 응시자수" 같은 컬럼을 이름 패턴으로 찾아
+# (자격증 × 연도 × 차수) 배열 두 개(합격률, 응시자 수)로 묶는다. 연도/차수가 늘어도 코드 수정 없이 반영.
+#
+# 차수 평균·전체 평균·평균 응시자 수·차트 시리즈는 모두 이 배열의 축 방향 축약으로 계산한다.
+# Dataset 에서는 원본 와이드 컬럼을 자격증 테이블에서 빼고 이 배열(float32)만 보관한다.
+
+import re
+
+import numpy as np
+import pandas as pd
+
+from .config import STAT_COL_PATTERN
+
+_STAT_RE = re.compile(STAT_COL_PATTERN)
+KINDS = ("pass_rate", "applicants")
+
+
+def parse_stat_column(name):
+    """컬럼명 → (종류, 연도, 차수 번호) 또는 None. 종류: "pass_rate" / "applicants"."""
+    m = _STAT_RE.match(str(name))
+    if m is None:
+        return None
+    kind = "pass_rate" if m.group("kind") == "합격률" else "applicants"
+    return kind, int(m.group("year")), int(m.group("phase"))
+
+
+def stat_columns(columns):
+    """{(종류, 연도, 차수 번호): 컬럼명} — 패턴에 맞는 컬럼만."""
+    out = {}
+    for c in columns:
+        key = parse_stat_column(c)
+        if key is not None:
+            out.setdefault(key, c)
+    return out
+
+
+def phase_label(phase):
+    return f"{phase}차"
+
+
+def phase_avg_col(label):
+    """차수별 평균 합격률 파생 컬럼명 (예: PASS_1차_AVG)."""
+    return f"PASS_{label}_AVG"
+
+
+def _numeric_block(df, cols):
+    # 여러 컬럼을 한 번에 float 2차원 배열로 (숫자형이면 복사 한 번, 문자열이 섞였으면 to_numeric)
+    if not cols:
+        return np.empty((len(df), 0))
+    block = df[cols]
+    try:
+        return block.to_numpy(dtype="float64", na_value=np.nan)
+    except (TypeError, ValueError):
+        return block.apply(pd.to_numeric, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
+
+def _nanmean(a, axis):
+    # 값이 하나도 없으면 NaN (경고 없이) — DataFrame.mean(skipna=True) 과 같은 의미
+    cnt = (~np.isnan(a)).sum(axis=axis)
+    tot = np.nansum(a, axis=axis)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(cnt > 0, tot / cnt, np.nan)
+
+
+class YearPhaseStats:
+    """행(자격증 테이블 행 위치) × 연도 × 차수 배열.
+
+    pass_rate / applicants: (n, 연도 수, 차수 수), 없는 칸은 NaN.
+    present: (연도 수, 차수 수) 불리언 — 원천에 그 연도·차수 합격률 컬럼이 있었는지.
+    """
+
+    def __init__(self, years, phases, pass_rate, applicants, present, columns=()):
+        self.years = list(years)
+        self.phases = list(phases)
+        self.pass_rate = pass_rate
+        self.applicants = applicants
+        self.present = present
+        self.columns = list(columns)
+
+    @classmethod
+    def from_frame(cls, df):
+        found = stat_columns(df.columns)
+        years = sorted({y for _, y, _ in found})
+        phase_nums = sorted({p for _, _, p in found})
+        n, shape = len(df), (len(years), len(phase_nums))
+        y_at = {y: i for i, y in enumerate(years)}
+        p_at = {p: i for i, p in enumerate(phase_nums)}
+
+        arrays = {}
+        present = np.zeros(shape, dtype=bool)
+        for kind in KINDS:
+            keys = [k for k in found if k[0] == kind]
+            arr = np.full((n,) + shape, np.nan)
+            if keys:
+                yi = np.array([y_at[y] for _, y, _ in keys])
+                pi = np.array([p_at[p] for _, _, p in keys])
+                arr[:, yi, pi] = _numeric_block(df, [found[k] for k in keys])
+                if kind == "pass_rate":
+                    present[yi, pi] = True
+            arrays[kind] = arr
+        return cls(years, [phase_label(p) for p in phase_nums], arrays["pass_rate"], arrays["applicants"],
+                   present, columns=found.values())
+
+    def __len__(self):
+        return self.pass_rate.shape[0]
+
+    def astype(self, dtype):
+        """배열 dtype 만 바꾼 복사본 (Dataset 보관용 float32)."""
+        return YearPhaseStats(self.years, self.phases, self.pass_rate.astype(dtype),
+                              self.applicants.astype(dtype), self.present, self.columns)
+
+    @property
+    def nbytes(self):
+        return self.pass_rate.nbytes + self.applicants.nbytes
+
+    # ---- 축약 ----
+    def phase_avg(self):
+        """(n, 차수) — 차수별 연도 평균 합격률."""
+        return _nanmean(self.pass_rate.astype("float64", copy=False), axis=1)
+
+    def overall(self):
+        """(n,) — 차수 평균들의 평균 합격률."""
+        return _nanmean(self.phase_avg(), axis=1)
+
+    def applicants_avg(self):
+        """(n,) — 모든 연도·차수 응시자 수 평균."""
+        n, ny, npz = self.applicants.shape
+        return _nanmean(self.applicants.astype("float64", copy=False).reshape(n, ny * npz), axis=1)
+
+    # ---- 한 행 ----
+    @staticmethod
+    def _py(values):
+        # float32 도 최단 표기로 (45.3 → 45.3, 45.29999923… 아님), 결측은 None
+        return [None if np.isnan(v) else float(str(v)) for v in values]
+
+    def series(self, pos):
+        """차트용 (연도 목록, {차수: 연도별 합격률}) — 모든 차수 컬럼이 있는 연도만."""
+        keep = self.present.all(axis=1)
+        years = [y for y, k in zip(self.years, keep) if k]
+        rates = self.pass_rate[pos][keep]
+        return years, {ph: [np.nan if v is None else v for v in self._py(rates[:, j])]
+                       for j, ph in enumerate(self.phases)}
+
+    def row(self, pos):
+        """{연도: {차수: {"pass_rate", "applicants"}}} — 값은 파이썬 float 또는 None."""
+        out = {}
+        for i, y in enumerate(self.years):
+            rates, apps = self._py(self.pass_rate[pos, i]), self._py(self.applicants[pos, i])
+            out[y] = {ph: {"pass_rate": rates[j], "applicants": apps[j]} for j, ph in enumerate(self.phases)}
+        return out
+
+    # ---- 긴 형식 ----
+    def to_long(self, ids=None):
+        """(행, 연도, 차수, 합격률, 응시자 수) 긴 테이블. 두 값이 모두 없는 칸은 제외."""
+        n, ny, npz = self.pass_rate.shape
+        rows = np.repeat(np.arange(n), ny * npz)
+        out = pd.DataFrame({
+            "row": rows,
+            "연도": np.tile(np.repeat(np.asarray(self.years, dtype=np.int16), npz), n),
+            "차수": pd.Categorical.from_codes(np.tile(np.arange(npz), n * ny), self.phases),
+            "합격률": self.pass_rate.reshape(-1),
+            "응시자 수": self.applicants.reshape(-1),
+        })
+        if ids is not None:
+            out.insert(1, "id", np.asarray(ids, dtype=object)[rows])
+        return out[out["합격률"].notna() | out["응시자 수"].notna()].reset_index(drop=True)
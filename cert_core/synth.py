@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+# 합성 데이터 생성 — 번들 데이터를 본으로 행을 복제·변형해 10×~1000× 규모의 원천 파일 + 스냅샷을 만든다
+#
+#   python -m cert_core.synth --scale 10                  # → data/synth/x10 (엑셀 + NCS CSV + snapshot/)
+#   python -m cert_core.synth --scale 1000 --format csv   # 엑셀 행 수 제한을 넘는 규모는 CSV
+#   CERT_DATA_DIR=data/synth/x10 streamlit run streamlit.py
+#
+# 자격증은 원본 각 행을 scale-1 번 더 복제해 분류/등급/시험 구조/합격률 결측 패턴을 그대로 두고
+# 응시자 수·합격률에만 잡음을 더한다. 합격률 없음 목록과 학과/NCS/직무 링크는 본 자격증의 링크를 새 ID 로 복제.
+# 직업정보도 scale 배로 복제하고, 복제 자격증의 직무 링크는 같은 직업의 복제본 중 하나로 나눈다.
+# 같은 seed → 같은 파일.
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from .config import (
+    DATA_FILES, ID_COL, NAME_COL,
+    JOB_ID_COL, JOB_SEQ_COL, NCS_LIC_ID, data_dir_paths,
+)
+from .jobs import SCORE_KEYS
+from .loaders import _to_key
+from .stats import _numeric_block, stat_columns
+
+EXCEL_MAX_ROWS = 1_048_575  # 헤더 1행 제외
+LICENSE_NAME_COL = "자격증"  # 학과/NCS 테이블의 자격증명 컬럼
+JOB_TITLE_COL = "직업명"
+DEFAULT_SEED = 20241017
+
+# 복제 자격증명 앞에 붙는 시행기관풍 접두어 (가나다 2음절 조합)
+_PREFIX_A = "한누온새미다솔빛해바"
+_PREFIX_B = "리로솔빛온누람결샘아"
+
+
+# -------------------------------------------------
+# 복제 도우미
+# -------------------------------------------------
+def _gather(keys, wanted):
+    """keys 값이 wanted[i] 인 행들을 모아 (행 위치, i) — 링크 테이블을 새 키로 복제할 때 사용."""
+    codes, uniques = pd.factorize(pd.Series(keys, dtype="object"), use_na_sentinel=True)
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    lo = np.searchsorted(sorted_codes, np.arange(len(uniques)), side="left")
+    hi = np.searchsorted(sorted_codes, np.arange(len(uniques)), side="right")
+    w = pd.Index(uniques).get_indexer(pd.Index(wanted, dtype="object"))
+    ok = w >= 0
+    starts = np.where(ok, lo[np.maximum(w, 0)], 0)
+    lens = np.where(ok, hi[np.maximum(w, 0)] - lo[np.maximum(w, 0)], 0)
+    owner = np.repeat(np.arange(len(wanted)), lens)
+    offsets = np.arange(lens.sum()) - np.repeat(np.cumsum(lens) - lens, lens)
+    return order[np.repeat(starts, lens) + offsets], owner
+
+
+def _noisy_counts(rng, v, sigma=0.35):
+    # v: float 배열 (행 × 연도·차수 컬럼)
+    return np.where(np.isnan(v), np.nan, np.round(v * rng.lognormal(0.0, sigma, v.shape)))
+
+
+def _noisy_rates(rng, v, sd=6.0):
+    # 0% (응시자 없음 등)과 결측은 그대로
+    noisy = np.clip(v + rng.normal(0.0, sd, v.shape), 0.0, 100.0).round(1)
+    return np.where(np.isnan(v) | (v == 0), v, noisy)
+
+
+def _noisy_scores(rng, values, key, sd=8.0):
+    # 직업정보 점수 "보상: 26.0" 형식 유지
+    num = pd.to_numeric(values.astype("object").astype(str).str.extract(r"([-+]?\d*\.?\d+)")[0], errors="coerce")
+    v = np.clip(num.to_numpy(dtype="float64") + rng.normal(0.0, sd, len(num)), 0.0, 100.0).round(0)
+    out = pd.Series([f"{key}: {x:.1f}" for x in v], index=values.index, dtype="object")
+    return out.where(~np.isnan(v), values.astype("object"))
+
+
+def _replace(df, rows, **cols):
+    out = df.iloc[rows].reset_index(drop=True)
+    for c, v in cols.items():
+        if c in out.columns:
+            out[c] = v
+    return out
+
+
+# -------------------------------------------------
+# 생성
+# -------------------------------------------------
+def synth_tables(base, scale, seed=DEFAULT_SEED):
+    """base(load_sources 결과) → scale 배 테이블 dict. 원본 행은 그대로 앞에 둔다."""
+    if scale < 1:
+        raise ValueError("scale 은 1 이상")
+    rng = np.random.default_rng(seed)
+    cert = base["cert"]
+    if cert is None:
+        raise ValueError("자격증 데이터가 없습니다.")
+    if scale == 1:
+        return {k: (None if v is None else v.copy()) for k, v in base.items()}
+
+    # ---- 자격증 ----
+    n, copies = len(cert), scale - 1
+    tmpl = np.tile(np.arange(n), copies)
+    base_ids = _to_key(cert[ID_COL]).to_numpy(dtype=object)
+    base_names = cert[NAME_COL].astype(str).to_numpy(dtype=object)
+    serial = pd.Series(np.arange(len(tmpl))).astype(str).str.zfill(7).to_numpy(dtype=object)
+    new_ids = np.array([i[:1] for i in base_ids], dtype=object)[tmpl] + "X" + serial
+    prefixes = np.array([a + b for a in _PREFIX_A for b in _PREFIX_B], dtype=object)
+    new_names = prefixes[rng.integers(0, len(prefixes), len(tmpl))] + " " + base_names[tmpl]
+
+    clone = cert.iloc[tmpl].reset_index(drop=True)
+    clone[ID_COL], clone[NAME_COL] = new_ids, new_names
+    # 연도·차수 통계 컬럼은 종류별로 한 블록씩 잡음 (연도가 늘어도 그대로)
+    found = stat_columns(clone.columns)
+    for kind, noisy in (("applicants", _noisy_counts), ("pass_rate", _noisy_rates)):
+        cols = [c for k, c in found.items() if k[0] == kind]
+        if cols:
+            clone[cols] = noisy(rng, _numeric_block(clone, cols))
+    out = {"cert": pd.concat([cert, clone], ignore_index=True)}
+
+    # ---- 합격률 없음 목록 (본 자격증이 목록에 있으면 복제본도) ----
+    no_pass = base.get("no_pass")
+    if no_pass is not None:
+        listed = np.zeros(n, dtype=bool)
+        if ID_COL in no_pass.columns:
+            listed |= np.isin(base_ids, _to_key(no_pass[ID_COL]).to_numpy(dtype=object))
+        if NAME_COL in no_pass.columns:
+            listed |= np.isin(base_names, _to_key(no_pass[NAME_COL]).to_numpy(dtype=object))
+        hit = listed[tmpl]
+        extra = pd.DataFrame({ID_COL: new_ids[hit], NAME_COL: new_names[hit]})
+        out["no_pass"] = pd.concat([no_pass, extra[[c for c in no_pass.columns if c in extra.columns]]],
+                                   ignore_index=True)
+
+    # ---- 학과 / NCS 링크 (자격증ID 기준 복제) ----
+    wanted = base_ids[tmpl]
+    for name, key in (("major", ID_COL), ("ncs", NCS_LIC_ID)):
+        t = base.get(name)
+        if t is None or key not in t.columns:
+            out[name] = t
+            continue
+        rows, owner = _gather(_to_key(t[key]), wanted)
+        dup = _replace(t, rows, **{key: new_ids[owner], LICENSE_NAME_COL: new_names[owner]})
+        out[name] = pd.concat([t, dup], ignore_index=True)
+
+    # ---- 직업정보 (scale 배) ----
+    jobinfo = base.get("jobinfo")
+    seq_of = None
+    if jobinfo is not None and JOB_SEQ_COL in jobinfo.columns:
+        seqs = _to_key(jobinfo[JOB_SEQ_COL]).to_numpy(dtype=object)
+        n_jobs = len(seqs)
+        first = int(pd.to_numeric(pd.Series(seqs), errors="coerce").max()) + 1
+        jt = np.tile(np.arange(n_jobs), copies)
+        replica = np.repeat(np.arange(1, scale), n_jobs)
+        rep_seq = (first + np.arange(len(jt))).astype(str).astype(object)
+        titles = jobinfo[JOB_TITLE_COL].astype(str).to_numpy(dtype=object)
+        rep_title = titles[jt] + " (" + replica.astype(str).astype(object) + ")"
+        dup = _replace(jobinfo, jt, **{JOB_SEQ_COL: rep_seq, JOB_TITLE_COL: rep_title})
+        for k in SCORE_KEYS:
+            if k in dup.columns:
+                dup[k] = _noisy_scores(rng, dup[k], k)
+        out["jobinfo"] = pd.concat([jobinfo, dup], ignore_index=True)
+        # (원본 위치 j, 복제 번호 r) → (seq, 직업명); r=0 은 원본
+        seq_of = (pd.Index(seqs), np.concatenate([seqs, rep_seq]), np.concatenate([titles, rep_title]), n_jobs)
+    else:
+        out["jobinfo"] = jobinfo
+
+    # ---- 직무 링크 (자격증ID 기준 복제, 직업은 같은 직업의 복제본 중 하나로) ----
+    jobs = base.get("jobs")
+    if jobs is not None and JOB_ID_COL in jobs.columns:
+        rows, owner = _gather(_to_key(jobs[JOB_ID_COL]), wanted)
+        dup = _replace(jobs, rows, **{JOB_ID_COL: new_ids[owner], NAME_COL: new_names[owner]})
+        if seq_of is not None and JOB_SEQ_COL in dup.columns:
+            index, all_seq, all_title, n_jobs = seq_of
+            j = index.get_indexer(pd.Index(_to_key(dup[JOB_SEQ_COL]), dtype="object"))
+            r = rng.integers(0, scale, len(dup))
+            pick = np.where(j >= 0, (r * n_jobs) + np.maximum(j, 0), -1)
+            known = pick >= 0
+            seq_col = dup[JOB_SEQ_COL].to_numpy(dtype=object, copy=True)
+            seq_col[known] = all_seq[pick[known]]
+            dup[JOB_SEQ_COL] = seq_col
+            if JOB_TITLE_COL in dup.columns:
+                title_col = dup[JOB_TITLE_COL].to_numpy(dtype=object, copy=True)
+                title_col[known] = all_title[pick[known]]
+                dup[JOB_TITLE_COL] = title_col
+        out["jobs"] = pd.concat([jobs, dup], ignore_index=True)
+    else:
+        out["jobs"] = jobs
+    return out
+
+
+# -------------------------------------------------
+# 저장
+# -------------------------------------------------
+def _for_file(name, df):
+    # 원본 엑셀처럼 jobdicSeq 는 정수
+    if name in ("jobs", "jobinfo") and JOB_SEQ_COL in df.columns:
+        df = df.copy()
+        num = pd.to_numeric(df[JOB_SEQ_COL], errors="coerce")
+        if num.notna().all():
+            df[JOB_SEQ_COL] = num.astype("int64")
+    return df
+
+
+def write_tables(tables, out_dir, fmt="xlsx"):
+    """data_*.xlsx (NCS 는 항상 CSV) 또는 전부 CSV 로 저장 → {테이블: 경로}. 다른 확장자의 옛 파일은 지움."""
+    os.makedirs(out_dir, exist_ok=True)
+    written = {}
+    for name, filename in DATA_FILES.items():
+        df = tables.get(name)
+        if df is None:
+            continue
+        xlsx, csv = data_dir_paths(out_dir, filename)
+        as_csv = fmt == "csv" or filename.endswith(".csv")
+        if not as_csv and len(df) > EXCEL_MAX_ROWS:
+            raise ValueError(f"{name}: {len(df):,}행은 엑셀 한 시트에 들어가지 않습니다 (--format csv).")
+        path, stale = (csv, xlsx) if as_csv else (xlsx, csv)
+        if os.path.exists(stale):
+            os.remove(stale)
+        df = _for_file(name, df)
+        if as_csv:
+            df.to_csv(path, index=False, encoding="utf-8-sig")
+        else:
+            df.to_excel(path, index=False)
+        written[name] = path
+    return written
+
+
+def generate(scale, out_dir, seed=DEFAULT_SEED, fmt="auto", snapshot=True, log=print):
+    """번들(또는 CERT_DATA_DIR) 데이터를 본으로 합성 원천 파일과 스냅샷을 쓴다 → 테이블별 행 수."""
+    from .loaders import load_sources
+    from .snapshot import build_snapshot
+
+    if fmt == "auto":
+        fmt = "xlsx" if scale <= 10 else "csv"
+    t0 = time.perf_counter()
+    tables = synth_tables(load_sources(), scale, seed)
+    rows = {k: len(v) for k, v in tables.items() if v is not None}
+    log(f"[synth] x{scale} seed={seed} 생성 ({time.perf_counter() - t0:.1f}s) — "
+        + ", ".join(f"{k}={v:,}" for k, v in rows.items()))
+
+    t1 = time.perf_counter()
+    written = write_tables(tables, out_dir, fmt)
+    log(f"[synth] {out_dir} 저장 ({fmt}, {time.perf_counter() - t1:.1f}s)")
+
+    if snapshot:
+        # 저장한 파일을 앱과 같은 로더로 다시 읽어 스냅샷 빌드 (CERT_DATA_DIR 로 띄우면 바로 사용)
+        t2 = time.perf_counter()
+        sources = {name: data_dir_paths(out_dir, fn) for name, fn in DATA_FILES.items() if name in written}
+        build_snapshot(os.path.join(out_dir, "snapshot"), sources=sources)
+        log(f"[synth] 스냅샷 빌드 ({time.perf_counter() - t2:.1f}s)")
+    return rows
+
+
+# -------------------------------------------------
+# CLI
+# -------------------------------------------------
+def main(argv=None):
+    import argparse
+
+    ap = argparse.ArgumentParser(description="규모 시험용 합성 데이터(원천 파일 + 스냅샷) 생성")
+    ap.add_argument("--scale", type=int, default=10, help="번들 데이터 대비 배수 (기본 10, 10~1000 권장)")
+    ap.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    ap.add_argument("--out", help="출력 폴더 (기본: data/synth/x<scale>)")
+    ap.add_argument("--format", choices=["auto", "xlsx", "csv"], default="auto",
+                    help="auto = 10배 이하 엑셀, 그 이상 CSV (NCS 는 항상 CSV)")
+    ap.add_argument("--no-snapshot", action="store_true", help="스냅샷(parquet) 빌드 생략")
+    args = ap.parse_args(argv)
+
+    out_dir = args.out or os.path.join("data", "synth", f"x{args.scale}")
+    try:
+        generate(args.scale, out_dir, seed=args.seed, fmt=args.format, snapshot=not args.no_snapshot)
+    except ValueError as e:
+        print(f"[synth] {e}")
+        return 1
+    print(f"[synth] 사용: CERT_DATA_DIR={out_dir} streamlit run streamlit.py")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
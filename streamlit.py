@@ -3,20 +3,62 @@
 # -*- coding: utf-8 -*-
 # 전공별 자격증 대시보드 — 합격률 없음 분리 + 난이도 등분 보정 + NCS 3단 필터 + 토글 표시
 
-import re, io, qrcode
+import html
 import numpy as np
 import pandas as pd
 import streamlit as st
-import matplotlib.pyplot as plt
-from matplotlib import font_manager, rcParams
 from ui_theme import apply_theme
+from cert_core.config import (
+    GRADE_LABELS,
+    NAME_COL, ID_COL, CLS_COL, GRADE_COL, FREQ_COL,
+    CHART_BACKEND,
+)
+from cert_core.charts import (
+    CHART_CACHE, chart_style, pass_rate_series, pass_rate_spec, radar_spec,
+    render_pass_rate_png, render_radar_png,
+)
+from cert_core.dataset import get_dataset
+from cert_core.jobs import SCORE_KEYS
+from cert_core.ncs import path_rows
+from cert_core.profiling import RunProfile, setup_logging
+from cert_core.stats import phase_avg_col
+from cert_core.qr import home_qr_png
+from cert_core.results import RESULT_CACHE, filter_state, get_results
+
+# -------------------------------------------------
+# 재실행 계측 (구간 시간 + 전송 요소/바이트 → 구조화 로그, ?profile=1 이면 하단 패널)
+# -------------------------------------------------
+setup_logging()
+_prof = RunProfile("rerun")
+
+
+def _count_emitted(prof):
+    # 이번 재실행에서 브라우저로 나가는 메시지를 집계 (Streamlit 내부 API — 없으면 생략)
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        send = ctx._enqueue
+    except Exception:
+        return
+    send = getattr(send, "_orig_enqueue", send)
+
+    def _enqueue(msg):
+        kind = msg.delta.WhichOneof("type") if msg.WhichOneof("type") == "delta" else None
+        prof.count_message(kind, msg.ByteSize())
+        send(msg)
+
+    _enqueue._orig_enqueue = send
+    ctx._enqueue = _enqueue
+
+
+_count_emitted(_prof)
+_prof.lap("setup")
 
 apply_theme()
 
 # -------------------------------------------------
 # 기본 설정
 # -------------------------------------------------
-BASE_URL = "https://certificationapp-brnj3ctcykqixb9uyz9fb2.streamlit.app"
 st.set_page_config(page_title="전공별 자격증 대시보드", layout="wide", page_icon="🎓")
 
 
@@ -28,28 +70,6 @@ def get_query_params():
                 for k, v in st.experimental_get_query_params().items()}
 
 
-def use_korean_font():
-    candidates = ["Malgun Gothic", "AppleGothic", "NanumGothic", "Noto Sans CJK KR", "DejaVu Sans"]
-    installed = {f.name for f in font_manager.fontManager.ttflist}
-    for f in candidates:
-        if f in installed:
-            rcParams["font.family"] = f
-            break
-    rcParams["axes.unicode_minus"] = False
-
-
-def apply_pretty_style():
-    plt.rcParams.update({
-        "axes.titleweight": "bold",
-        "axes.titlesize": 15,
-        "axes.labelsize": 11,
-        "xtick.labelsize": 10,
-        "ytick.labelsize": 10,
-        "grid.linestyle": "--",
-        "grid.alpha": 0.35,
-    })
-
-
 def _force_light_theme():
     # 모든 환경에서 라이트 테마 강제: LocalStorage + URL(?theme=light) + 1회 새로고침
     st.markdown(
@@ -91,22 +111,9 @@ except Exception:
 # 시스템 다크 선호 무시하고 라이트로 고정
 st.markdown("<style>:root{ color-scheme: light; }</style>", unsafe_allow_html=True)
 
-use_korean_font()
-apply_pretty_style()
-
 # -------------------------------------------------
 # 공통 유틸
 # -------------------------------------------------
-def hide_spines(ax):
-    for s in ("top", "right"):
-        if s in ax.spines:
-            ax.spines[s].set_visible(False)
-
-
-def _to_key(series):
-    return pd.Series(series, dtype="object").astype(str).str.strip()
-
-
 def badge(t):
     return f"<span class='pill'>{t}</span>"
 
@@ -120,12 +127,6 @@ def fmt_int(x):
         return "-"
 
 
-def _num_in_text(x):
-    s = "" if x is None else str(x)
-    m = re.search(r"[-+]?\d*\.?\d+", s)
-    return float(m.group(0)) if m else np.nan
-
-
 def _emit_scroll_to_top_if_needed():
     if st.session_state.pop("_scroll_to_top", False):
         st.markdown(
@@ -198,50 +199,9 @@ def render_employ_donut_svg(male_pct, female_pct) -> str:
 """
 
 
-def render_detail_html(text: str) -> str:
-    if not text:
-        return ""
-    lines = [ln.strip() for ln in str(text).splitlines()]
-    cleaned = []
-    for ln in lines:
-        if ln == "" and (not cleaned or cleaned[-1] == ""):
-            continue
-        cleaned.append(ln)
-
-    html, ul_open = [], False
-
-    def open_ul():
-        nonlocal ul_open
-        if not ul_open:
-            html.append("<ul style='margin:.25rem 0 .25rem 1.1rem;'>")
-            ul_open = True
-
-    def close_ul():
-        nonlocal ul_open
-        if ul_open:
-            html.append("</ul>")
-            ul_open = False
-
-    for ln in cleaned:
-        if re.match(r"^[-•·‣]\s*", ln):
-            open_ul()
-            item = re.sub(r"^[-•·‣]\s*", "", ln)
-            html.append(f"<li>{item}</li>")
-        elif ln:
-            close_ul()
-            html.append(f"<p style='margin:.2rem 0;'>{ln}</p>")
-    close_ul()
-    return "<div class='detail-box'>" + "".join(html) + "</div>"
-
-
 def render_qr_home():
-    qr = qrcode.QRCode(version=1, box_size=4, border=2)
-    qr.add_data(BASE_URL)
-    qr.make(fit=True)
-    img = qr.make_image(fill_color="black", back_color="white")
-    buf = io.BytesIO()
-    img.save(buf, format="PNG")
-    st.image(buf.getvalue(), caption="대시보드 QR", use_container_width=False)
+    # 프로세스당 한 번 렌더된 PNG 재사용
+    st.image(home_qr_png(), caption="대시보드 QR", use_container_width=False)
 
 
 # -------------------------------------------------
@@ -271,150 +231,43 @@ st.markdown(
 )
 
 # -------------------------------------------------
-# 데이터 경로 / 키
+# 데이터 로드 (프로세스 공유 데이터셋 — 파생 컬럼/난이도 포함, 원천 변경 시 자동 재빌드)
 # -------------------------------------------------
-CERT_PATHS = ["1010자격증데이터_통합.xlsx", "data/data_cert.xlsx"]
-MAJOR_PATHS = ["1013전공정보통합_final.xlsx", "data/data_major.xlsx"]
-JOBS_PATHS = ["직무분류데이터_병합완_with_ID_v3.xlsx", "data/data_jobs.xlsx"]
-JOBINFO_PATHS = ["직업정보_데이터.xlsx", "data/job_info.xlsx"]
-NO_PASS_PATHS = ["합격률이 나오지 않는 자격증.xlsx", "data/no_pass.xlsx"]
-NCS_PATHS = ["NCS직무상세분류_자격증_ID완전매핑.csv", "data/ncs_mapping.csv"]
-
-YEARS = [2022, 2023, 2024]
-PHASES = ["1차", "2차", "3차"]
-GRADE_LABELS = {
-    100: "기술사(100)",
-    200: "기능장(200)",
-    300: "기사(300)",
-    400: "산업기사(400)",
-    500: "기능사(500)",
-}
-NAME_COL, ID_COL, CLS_COL = "자격증명", "자격증ID", "자격증_분류"
-GRADE_COL, GRADE_TYPE_COL = "자격증_등급_코드", "등급_분류"
-FREQ_COL, STRUCT_COL = "검정 횟수", "시험종류"
-W_COL, P_COL, I_COL = "필기", "실기", "면접"
-JOB_ID_COL, JOB_SEQ_COL = "자격증ID", "jobdicSeq"
-
-PASS_RATE_COLS = {
-    2022: {"1차": "2022년 1차 합격률", "2차": "2022년 2차 합격률", "3차": "2022년 3차 합격률"},
-    2023: {"1차": "2023년 1차 합격률", "2차": "2023년 2차 합격률", "3차": "2023년 3차 합격률"},
-    2024: {"1차": "2024년 1차 합격률", "2차": "2024년 2차 합격률", "3차": "2024년 3차 합격률"},
-}
-APPL_COLS = {
-    2022: {"1차": "2022년 1차 응시자 수", "2차": "2022년 2차 응시자수", "3차": "2022년 3차 응시자수"},
-    2023: {"1차": "2023년 1차 응시자 수", "2차": "2023년 2차 응시자 수", "3차": "2023년 3차 응시자 수"},
-    2024: {"1차": "2024년 1차 응시자 수", "2차": "2024년 2차 응시자 수", "3차": "2024년 3차 응시자 수"},
-}
-num = lambda s: pd.to_numeric(s, errors="coerce")
-
-# NCS 컬럼명
-NCS_L_CODE, NCS_L_NAME = "대직무코드", "대직무분류"
-NCS_M_CODE, NCS_M_NAME = "중직무코드", "중직무분류"
-NCS_S_CODE, NCS_S_NAME = "소직무코드", "소직무분류"
-NCS_LIC_ID = "자격증ID"
-
-# -------------------------------------------------
-# 데이터 로드
-# -------------------------------------------------
-def _read_first_excel(paths):
-    for p in paths:
-        try:
-            return pd.read_excel(p)
-        except Exception:
-            continue
-    return None
-
-
-def _read_ncs(paths):
-    for p in paths:
-        try:
-            if str(p).lower().endswith((".csv", ".txt")):
-                return pd.read_csv(p, encoding="utf-8-sig")
-            else:
-                return pd.read_excel(p)
-        except Exception:
-            try:
-                return pd.read_csv(p, encoding="cp949")
-            except Exception:
-                continue
-    return None
-
-
-df = _read_first_excel(CERT_PATHS)
+_prof.lap("dataset")
+ds = get_dataset()
+df = ds.cert
 if df is None:
     st.error("자격증 데이터 파일을 찾을 수 없습니다.")
     st.stop()
 
-df_major = _read_first_excel(MAJOR_PATHS)
-df_jobs = _read_first_excel(JOBS_PATHS)
-df_jobinfo = _read_first_excel(JOBINFO_PATHS)
-df_no = _read_first_excel(NO_PASS_PATHS)
-df_ncs = _read_ncs(NCS_PATHS)
-
-# 합격률 없는 자격증 플래그
-df["NO_PASS_DATA"] = False
-if df_no is not None and not df_no.empty:
-    ex_ids, ex_names = set(), set()
-    if ID_COL in df_no.columns:
-        ex_ids = set(_to_key(df_no[ID_COL]).dropna())
-    if NAME_COL in df_no.columns:
-        ex_names = set(_to_key(df_no[NAME_COL]).dropna())
-    # 추정 컬럼
-    if not ex_ids:
-        for c in df_no.columns:
-            if "자격증ID" in str(c) or str(c).lower() in ["id", "license_id", "cert_id"]:
-                ex_ids = set(_to_key(df_no[c]).dropna())
-                break
-    if not ex_names:
-        for c in df_no.columns:
-            if "자격증명" in str(c) or "자격증 명" in str(c) or str(c).lower() in ["name", "license_name", "cert_name"]:
-                ex_names = set(_to_key(df_no[c]).dropna())
-                break
-
-    df["NO_PASS_DATA"] = (
-        _to_key(df[ID_COL]).isin(ex_ids) |
-        _to_key(df[NAME_COL]).isin(ex_names)
-    )
-
-# 직무 / 직업정보 키 정리
-if df_jobs is not None:
-    if JOB_ID_COL in df_jobs.columns:
-        df_jobs[JOB_ID_COL] = _to_key(df_jobs[JOB_ID_COL])
-    if JOB_SEQ_COL in df_jobs.columns:
-        df_jobs[JOB_SEQ_COL] = _to_key(df_jobs[JOB_SEQ_COL])
-
-if df_jobinfo is not None and JOB_SEQ_COL in df_jobinfo.columns:
-    df_jobinfo[JOB_SEQ_COL] = _to_key(df_jobinfo[JOB_SEQ_COL])
-
-# NCS 매핑
-if df_ncs is not None and not df_ncs.empty:
-    for c in [NCS_L_NAME, NCS_M_NAME, NCS_S_NAME, NCS_LIC_ID]:
-        if c in df_ncs.columns:
-            df_ncs[c] = df_ncs[c].astype(str).str.strip()
-    for c in [NCS_L_CODE, NCS_M_CODE, NCS_S_CODE]:
-        if c in df_ncs.columns:
-            df_ncs[c] = pd.to_numeric(df_ncs[c], errors="coerce")
-
-    ncs_large_opts = (
-        df_ncs[[NCS_L_CODE, NCS_L_NAME]]
-        .dropna()
-        .drop_duplicates()
-        .sort_values([NCS_L_NAME, NCS_L_CODE], kind="stable")
-    )
-else:
-    ncs_large_opts = pd.DataFrame(columns=[NCS_L_CODE, NCS_L_NAME])
+major_index = ds.majors
+job_index = ds.job_index
+ncs_tree = ds.ncs_tree
+facets = ds.facets
+NCS_LINKS_SHOWN = 30  # 사이드바에 나열할 관련 학과/직업 수
+_prof.tags["version"] = ds.version
 
 # -------------------------------------------------
 # 모바일 감지
 # -------------------------------------------------
 IS_MOBILE = (str(get_query_params().get("m", "0")) == "1")
+# 차트: 브라우저 렌더(Vega-Lite/Plotly 스펙) 기본, ?charts=png 면 서버 PNG
+CLIENT_CHARTS = str(get_query_params().get("charts", CHART_BACKEND)) != "png"
 _force_light_theme()
+_prof.tags.update(mobile=IS_MOBILE, charts="client" if CLIENT_CHARTS else "png")
+
+# 자격증 딥링크 (?license=ID, 인쇄용 QR) — 세션 첫 실행에서만 선택
+_deep_license = str(get_query_params().get("license", "")).strip()
+if _deep_license and not st.session_state.get("_deep_link_done"):
+    st.session_state["_deep_link_done"] = True
+    if len(facets.positions_of(_deep_license)):
+        st.session_state["selected_license"] = _deep_license
 
 # -------------------------------------------------
 # 사이드바 (전공 + 검색/필터 + NCS + QR)
 # -------------------------------------------------
-selected_ids = None
-ncs_license_ids = None
+_prof.lap("sidebar")
+sel_major = None
 
 with st.sidebar:
     st.markdown("### 🎛 필터")
@@ -433,11 +286,9 @@ with st.sidebar:
             st.session_state["last_selected_major"] = None
 
         if use_major:
-            if df_major is None:
+            if major_index is None:
                 st.error("전공 엑셀을 찾지 못했습니다.")
             else:
-                major_name_col, major_id_col = "학과명", "자격증ID"
-                majors_all = sorted(df_major[major_name_col].astype(str).unique().tolist())
 
                 def _on_major_query_change():
                     st.session_state["major_select"] = "(선택)"
@@ -450,10 +301,7 @@ with st.sidebar:
                     on_change=_on_major_query_change,
                 )
 
-                majors_view = [
-                    m for m in majors_all
-                    if (qmaj.strip() == "" or qmaj.lower() in m.lower())
-                ]
+                majors_view = major_index.filter(qmaj)
                 sel_major = st.selectbox(
                     "학과명",
                     ["(선택)"] + majors_view,
@@ -467,58 +315,37 @@ with st.sidebar:
                     st.session_state["last_selected_major"] = sel_major
 
                 if sel_major != "(선택)":
-                    selected_ids = (
-                        df_major.loc[
-                            df_major[major_name_col].astype(str) == sel_major,
-                            major_id_col,
-                        ]
-                        .astype(str)
-                        .unique()
-                        .tolist()
-                    )
-
                     # 취업률 미니 카드
-                    rate_cols = ["취업률_전체", "취업률_남", "취업률_여"]
-                    if all(c in df_major.columns for c in rate_cols):
-                        _row = (
-                            df_major.loc[
-                                df_major[major_name_col].astype(str) == sel_major,
-                                rate_cols,
-                            ]
-                            .apply(pd.to_numeric, errors="coerce")
-                            .dropna(how="all")
-                        )
-                        if not _row.empty:
-                            r_all = float(_row.iloc[0]["취업률_전체"]) if pd.notna(_row.iloc[0]["취업률_전체"]) else np.nan
-                            r_m = float(_row.iloc[0]["취업률_남"]) if pd.notna(_row.iloc[0]["취업률_남"]) else np.nan
-                            r_f = float(_row.iloc[0]["취업률_여"]) if pd.notna(_row.iloc[0]["취업률_여"]) else np.nan
-
-                            st.markdown("---")
-                            st.caption("전공 취업률")
-                            st.markdown(f"**취업률(전체)** : {r_all:.1f}%")
-
-                            if pd.notna(r_m) or pd.notna(r_f):
-                                st.markdown(
-                                    render_employ_donut_svg(r_m, r_f),
-                                    unsafe_allow_html=True,
-                                )
-                                st.markdown(
-                                    f"""
-                                    <div style="margin-top:-6px; line-height:1.6;">
-                                      <div style="display:flex; align-items:center; gap:.5rem;">
-                                        <span style="width:10px;height:10px;border-radius:50%;background:#2563eb;display:inline-block;"></span>
-                                        <span style="color:#2563eb;font-weight:700;">남:</span>
-                                        <span style="font-weight:700;color:#334155;">{r_m:.1f}%</span>
-                                      </div>
-                                      <div style="display:flex; align-items:center; gap:.5rem;">
-                                        <span style="width:10px;height:10px;border-radius:50%;background:#ef4444;display:inline-block;"></span>
-                                        <span style="color:#ef4444;font-weight:700;">여:</span>
-                                        <span style="font-weight:700;color:#334155;">{r_f:.1f}%</span>
-                                      </div>
-                                    </div>
-                                    """,
-                                    unsafe_allow_html=True,
-                                )
+                    rates = major_index.employment(sel_major)
+                    if rates is not None:
+                        r_all, r_m, r_f = rates
+
+                        st.markdown("---")
+                        st.caption("전공 취업률")
+                        st.markdown(f"**취업률(전체)** : {r_all:.1f}%")
+
+                        if pd.notna(r_m) or pd.notna(r_f):
+                            st.markdown(
+                                render_employ_donut_svg(r_m, r_f),
+                                unsafe_allow_html=True,
+                            )
+                            st.markdown(
+                                f"""
+                                <div style="margin-top:-6px; line-height:1.6;">
+                                  <div style="display:flex; align-items:center; gap:.5rem;">
+                                    <span style="width:10px;height:10px;border-radius:50%;background:#2563eb;display:inline-block;"></span>
+                                    <span style="color:#2563eb;font-weight:700;">남:</span>
+                                    <span style="font-weight:700;color:#334155;">{r_m:.1f}%</span>
+                                  </div>
+                                  <div style="display:flex; align-items:center; gap:.5rem;">
+                                    <span style="width:10px;height:10px;border-radius:50%;background:#ef4444;display:inline-block;"></span>
+                                    <span style="color:#ef4444;font-weight:700;">여:</span>
+                                    <span style="font-weight:700;color:#334155;">{r_f:.1f}%</span>
+                                  </div>
+                                </div>
+                                """,
+                                unsafe_allow_html=True,
+                            )
         else:
             st.caption("전공 필터를 끄면 전체 자격증 기준으로 목록이 구성됩니다.")
 
@@ -527,9 +354,15 @@ with st.sidebar:
     with st.container(border=True):
         st.markdown("#### 검색 / 필터")
 
-        q = st.text_input("자격증명 검색", value="", key="q", on_change=_clear_selection)
+        q = st.text_input(
+            "자격증명 검색",
+            value="",
+            key="q",
+            placeholder="예) 정보처리 또는 초성 ㅈㅂㅊㄹ",
+            on_change=_clear_selection,
+        )
 
-        cls_all = sorted(df[CLS_COL].dropna().astype(str).unique().tolist())
+        cls_all = facets.cls_values
         whitelist = [o for o in cls_all if any(k in o for k in ("국가기술", "국가전문", "국가민간"))]
         cls_options = whitelist if whitelist else cls_all
         sel_cls = st.selectbox(
@@ -540,8 +373,7 @@ with st.sidebar:
             on_change=_clear_selection,
         )
 
-        grade_nums = pd.to_numeric(df[GRADE_COL], errors="coerce")
-        grade_buckets = [b for b in [100, 200, 300, 400, 500] if (grade_nums.round(-2) == b).any()]
+        grade_buckets = facets.grade_buckets
         show_grade_filter = ("국가기술" in sel_cls)
         if show_grade_filter:
             sel_buckets = st.multiselect(
@@ -573,7 +405,7 @@ with st.sidebar:
         st.caption("NCS 직무 필터")
 
         # 대직무
-        large_choices = ["(전체)"] + ncs_large_opts[NCS_L_NAME].tolist() if not ncs_large_opts.empty else ["(전체)"]
+        large_choices = ["(전체)"] + ncs_tree.large_options()
         sel_ncs_large = st.selectbox(
             "대직무",
             large_choices,
@@ -583,16 +415,9 @@ with st.sidebar:
         )
 
         # 중직무
-        if df_ncs is not None and sel_ncs_large and sel_ncs_large != "(전체)":
-            mid_df = (
-                df_ncs.loc[df_ncs[NCS_L_NAME] == sel_ncs_large, [NCS_M_CODE, NCS_M_NAME]]
-                .dropna()
-                .drop_duplicates()
-                .sort_values([NCS_M_NAME, NCS_M_CODE], kind="stable")
-            )
-            mid_choices = ["(전체)"] + mid_df[NCS_M_NAME].tolist()
+        if sel_ncs_large and sel_ncs_large != "(전체)":
+            mid_choices = ["(전체)"] + ncs_tree.mid_options(sel_ncs_large)
         else:
-            mid_df = pd.DataFrame(columns=[NCS_M_CODE, NCS_M_NAME])
             mid_choices = ["(전체)"]
 
         sel_ncs_mid = st.selectbox(
@@ -604,28 +429,11 @@ with st.sidebar:
         )
 
         # 소직무
-        if df_ncs is not None and sel_ncs_large != "(전체)" and sel_ncs_mid != "(전체)":
-            small_df = (
-                df_ncs.loc[
-                    (df_ncs[NCS_L_NAME] == sel_ncs_large)
-                    & (df_ncs[NCS_M_NAME] == sel_ncs_mid),
-                    [NCS_S_CODE, NCS_S_NAME],
-                ]
-                .dropna()
-                .drop_duplicates()
-                .sort_values([NCS_S_NAME, NCS_S_CODE], kind="stable")
-            )
-            small_choices = ["(전체)"] + small_df[NCS_S_NAME].tolist()
-        elif df_ncs is not None and sel_ncs_large != "(전체)":
-            small_df = (
-                df_ncs.loc[df_ncs[NCS_L_NAME] == sel_ncs_large, [NCS_S_CODE, NCS_S_NAME]]
-                .dropna()
-                .drop_duplicates()
-                .sort_values([NCS_S_NAME, NCS_S_CODE], kind="stable")
-            )
-            small_choices = ["(전체)"] + small_df[NCS_S_NAME].tolist()
+        if sel_ncs_large != "(전체)" and sel_ncs_mid != "(전체)":
+            small_choices = ["(전체)"] + ncs_tree.small_options_for(sel_ncs_large, sel_ncs_mid)
+        elif sel_ncs_large != "(전체)":
+            small_choices = ["(전체)"] + ncs_tree.small_options_for(sel_ncs_large)
         else:
-            small_df = pd.DataFrame(columns=[NCS_S_CODE, NCS_S_NAME])
             small_choices = ["(전체)"]
 
         sel_ncs_small = st.selectbox(
@@ -636,26 +444,14 @@ with st.sidebar:
             on_change=_clear_selection,
         )
 
-        # 선택된 NCS 조합 → 자격증ID 집합
-        if df_ncs is not None:
-            any_selected = (
-                (sel_ncs_large and sel_ncs_large != "(전체)")
-                or (sel_ncs_mid and sel_ncs_mid != "(전체)")
-                or (sel_ncs_small and sel_ncs_small != "(전체)")
-            )
-
-            if any_selected:
-                mask = pd.Series(True, index=df_ncs.index)
-                if sel_ncs_large and sel_ncs_large != "(전체)":
-                    mask &= df_ncs[NCS_L_NAME] == sel_ncs_large
-                if sel_ncs_mid and sel_ncs_mid != "(전체)":
-                    mask &= df_ncs[NCS_M_NAME] == sel_ncs_mid
-                if sel_ncs_small and sel_ncs_small != "(전체)":
-                    mask &= df_ncs[NCS_S_NAME] == sel_ncs_small
-
-                filtered_ncs = df_ncs.loc[mask]
-                if not filtered_ncs.empty and (NCS_LIC_ID in filtered_ncs.columns):
-                    ncs_license_ids = set(_to_key(filtered_ncs[NCS_LIC_ID]).dropna())
+        # 선택한 NCS 경로의 관련 학과·직업 — 켤 때만 링크 테이블을 읽는다 (필터에는 필요 없음)
+        if sel_ncs_large != "(전체)" and st.toggle("관련 학과·직업 보기", key="show_ncs_links"):
+            ncs_path = [None if x == "(전체)" else x for x in (sel_ncs_large, sel_ncs_mid, sel_ncs_small)]
+            links = ds.ncs_links.for_rows(path_rows(ds.ncs, *ncs_path))
+            for kind, label in (("major", "관련 학과"), ("job", "관련 직업")):
+                names = links.get(kind, [])
+                more = f" 외 {len(names) - NCS_LINKS_SHOWN}개" if len(names) > NCS_LINKS_SHOWN else ""
+                st.caption(f"{label}: {', '.join(names[:NCS_LINKS_SHOWN]) or '-'}{more}")
 
         # 합격률 없는 자격증 토글
         def _on_toggle_no_pass():
@@ -676,258 +472,90 @@ with st.sidebar:
     with st.container(border=True):
         render_qr_home()
 
-# -------------------------------------------------
-# 난이도/합격률 계산
-# -------------------------------------------------
-SCORING = {
-    "trust_floor": 0.5,
-    "trust_span": 0.5,
-    "bonus_prac": 0.15,
-    "bonus_intv": 0.10,
-    "bonus_grade_max": 0.20,
-    "bonus_freq_max": 0.10,
-    "bonus_prof": 0.20,
-    "bonus_tech": 0.10,
-    "bonus_priv": 0.00,
-}
-
-
-def class_bonus(label):
-    s = str(label)
-    if "전문" in s:
-        return SCORING["bonus_prof"]
-    if "기술" in s:
-        return SCORING["bonus_tech"]
-    if "민간" in s:
-        return SCORING["bonus_priv"]
-    return 0.0
-
-
-def trust_weight(avg_app, all_avg_apps):
-    if pd.notna(avg_app) and all_avg_apps.notna().any():
-        norm = np.log1p(avg_app) / np.nanmax(np.log1p(all_avg_apps))
-        return SCORING["trust_floor"] + SCORING["trust_span"] * float(norm)
-    return 1.0
-
-
-def grade_bonus(code):
-    c = num(code)
-    if pd.isna(c):
-        return 0.0
-    return max(0.0, min(1.0, (500.0 - float(c)) / 400.0)) * SCORING["bonus_grade_max"]
-
-
-def freq_to_num(x):
-    if x is None:
-        return np.nan
-    if isinstance(x, (int, float)) and not np.isnan(x):
-        return float(x)
-    s = str(x).strip()
-    if s == "" or s.lower() == "nan":
-        return np.nan
-    if "상시" in s or "연중" in s:
-        return 12.0
-    if "수시" in s:
-        return 6.0
-    m = re.search(r"(\d+)", s)
-    return float(m.group(1)) if m else np.nan
-
-
-def freq_bonus(v, all_freq_series):
-    f = pd.to_numeric(v, errors="coerce")
-    if pd.isna(f) or all_freq_series.notna().sum() == 0:
-        return 0.0
-    fmin, fmax = float(np.nanmin(all_freq_series)), float(np.nanmax(all_freq_series))
-    if fmax == fmin:
-        return 0.0
-    return ((fmax - float(f)) / (fmax - fmin)) * SCORING["bonus_freq_max"]
-
-
-def qcut_1to5(s: pd.Series) -> pd.Series:
-    s = s.replace([np.inf, -np.inf], np.nan)
-    valid = s.dropna()
-    if valid.nunique() >= 5:
-        try:
-            bins = pd.qcut(valid, 5, labels=[1, 2, 3, 4, 5])
-            out = pd.Series(index=s.index, dtype="float")
-            out.loc[valid.index] = bins.astype(float)
-            return out
-        except Exception:
-            pass
-    mn = float(np.nanmin(valid)) if len(valid) else 0.0
-    mx = float(np.nanmax(valid)) if len(valid) else 1.0
-
-    def band(x):
-        if pd.isna(x):
-            return np.nan
-        if mx == mn:
-            return 3.0
-        r = (x - mn) / (mx - mn + 1e-12)
-        return float(np.clip(np.floor(r * 5) + 1, 1, 5))
-
-    return s.apply(band)
-
-
-# 평균 합격률/응시자수
-for ph in PHASES:
-    cols = [PASS_RATE_COLS[y][ph] for y in YEARS if PASS_RATE_COLS[y][ph] in df.columns]
-    df[f"PASS_{ph}_AVG(22-24)"] = df[cols].apply(num).mean(axis=1, skipna=True) if cols else np.nan
-
-df["OVERALL_PASS(%)"] = df[[f"PASS_{ph}_AVG(22-24)" for ph in PHASES]].mean(axis=1, skipna=True)
-
-app_cols = [APPL_COLS[y][ph] for y in YEARS for ph in PHASES if APPL_COLS[y][ph] in df.columns]
-df["APPLICANTS_AVG"] = df[app_cols].apply(num).mean(axis=1, skipna=True) if app_cols else np.nan
-
-# 구조 파싱
-def parse_structure(r):
-    t = str(r.get(STRUCT_COL, "") or "")
-    has_w = ("필기" in t) or (num(r.get(W_COL, 0)) > 0)
-    has_p = ("실기" in t) or (num(r.get(P_COL, 0)) > 0)
-    has_i = ("면접" in t) or (num(r.get(I_COL, 0)) > 0)
-    txt = "+".join([x for x, b in (("필기", has_w), ("실기", has_p), ("면접", has_i)) if b])
-    return has_w, has_p, has_i, txt
-
-
-df[["HAS_W", "HAS_P", "HAS_I", "STRUCT_TXT"]] = df.apply(
-    parse_structure, axis=1, result_type="expand"
-)
-
-freq_numeric = df[FREQ_COL].apply(freq_to_num) if FREQ_COL in df.columns else pd.Series([np.nan] * len(df))
-inv_overall = (100.0 - df["OVERALL_PASS(%)"]) / 100.0
-trust_w = df["APPLICANTS_AVG"].apply(lambda a: trust_weight(a, df["APPLICANTS_AVG"]))
-bonus_freq = freq_numeric.apply(lambda v: freq_bonus(v, freq_numeric))
-
-df["DIFF_SCORE_RAW"] = (
-    inv_overall.fillna(0) * trust_w
-    + df[CLS_COL].apply(class_bonus).fillna(0.0)
-    + df[GRADE_COL].apply(grade_bonus).fillna(0.0)
-    + bonus_freq.fillna(0.0)
-    + df.apply(
-        lambda r: (SCORING["bonus_prac"] if r["HAS_P"] else 0.0)
-        + (SCORING["bonus_intv"] if r["HAS_I"] else 0.0),
-        axis=1,
-    )
-)
-
-valid_mask = ~df["NO_PASS_DATA"]
-levels = qcut_1to5(df.loc[valid_mask, "DIFF_SCORE_RAW"])
-df["DIFF_LEVEL(1-5)"] = np.nan
-df.loc[valid_mask, "DIFF_LEVEL(1-5)"] = levels
-df["DIFF_SCORE"] = df["DIFF_SCORE_RAW"]
-df.loc[~valid_mask, "DIFF_SCORE"] = np.nan
-df.drop(columns=["DIFF_SCORE_RAW"], inplace=True)
-
 # -------------------------------------------------
 # 차트(절반 크기)
 # -------------------------------------------------
-BASE_CHART_W, BASE_CHART_H = (3.2, 1.6)
-LINE_W, MARKER_S = 1.8, 5.0
-TITLE_FSIZE, TICK_FSIZE, LABEL_FSIZE = 12, 9, 10
-
-
-def plot_yearly_pass_rates(row: pd.Series, lic_name: str):
-    years = [y for y in YEARS if all(PASS_RATE_COLS[y][ph] in df.columns for ph in PHASES)]
+def plot_yearly_pass_rates(row: pd.Series, pos: int, lic_name: str):
+    years, series = pass_rate_series(ds.stats, pos)
     if not years:
         return
-    x = np.arange(len(years))
-    fig, ax = plt.subplots(figsize=(BASE_CHART_W, BASE_CHART_H), dpi=160)
-    for ph, label in zip(PHASES, ["1차", "2차", "3차"]):
-        y = [pd.to_numeric(row.get(PASS_RATE_COLS[y][ph]), errors="coerce") for y in years]
-        yv = [float(v) if pd.notna(v) else np.nan for v in y]
-        ax.plot(x, yv, marker="o", linewidth=LINE_W, markersize=MARKER_S, label=label, solid_capstyle="round")
-    ax.set_xticks(x)
-    ax.set_xticklabels([str(y) for y in years])
-    ax.set_ylim(0, 100)
-    ax.set_yticks(np.arange(0, 101, 20))
-    ax.tick_params(axis="both", labelsize=TICK_FSIZE)
-    ax.set_ylabel("합격률(%)", fontsize=LABEL_FSIZE, labelpad=3)
-    ax.set_title(f"{lic_name} · 연도별 합격률 (1·2·3차)", pad=4, fontsize=TITLE_FSIZE, fontweight="bold")
-    ax.legend(
-        ncol=3,
-        loc="upper left",
-        bbox_to_anchor=(0.02, 1.02),
-        frameon=False,
-        fontsize=9,
-        handlelength=2.0,
-        columnspacing=1.0,
-    )
-    ax.grid(True, which="major", linestyle="--", alpha=.35)
-    hide_spines(ax)
-    fig.tight_layout(pad=0.4)
+    phases = "·".join(ph.removesuffix("차") for ph in series) + "차"
+    title = f"{lic_name} · 연도별 합격률 ({phases})"
 
     _, mid, _ = st.columns([1, 2, 1])
     with mid:
-        st.pyplot(fig, use_container_width=True)
+        if CLIENT_CHARTS:
+            st.vega_lite_chart(pass_rate_spec(title, years, series), use_container_width=True)
+        else:
+            style = chart_style()
+            png = CHART_CACHE.get_or_render(
+                ds,
+                "pass_rate",
+                row[ID_COL],
+                lambda: render_pass_rate_png(title, years, series, style),
+                style=style.key,
+            )
+            st.image(png, use_container_width=True)
 
     def _row_txt(part: str):
         chunks = []
-        for y in years:
-            v = pd.to_numeric(row.get(PASS_RATE_COLS[y][part]), errors="coerce")
+        for y, v in zip(years, series[part]):
             chunks.append(f"{y}년 {part} 합격률 : {v:.1f}%" if pd.notna(v) else f"{y}년 {part} 합격률 : -")
         return " · ".join(chunks)
 
-    centered_html = """
+    # 차수마다 한 줄 (마지막 줄만 아래 여백 없음)
+    lines = [_row_txt(ph) for ph in series]
+    rows_html = "".join(
+        f'<div style="margin-bottom:2px;">{t}</div>' for t in lines[:-1]
+    ) + f"<div>{lines[-1]}</div>"
+    centered_html = f"""
         <div style="font-size:12px; line-height:1.55; color:#334155; margin:6px 0 0; text-align:center;">
-            <div style="margin-bottom:2px;">{r1}</div>
-            <div style="margin-bottom:2px;">{r2}</div>
-            <div>{r3}</div>
+            {rows_html}
         </div>
-    """.format(r1=_row_txt("1차"), r2=_row_txt("2차"), r3=_row_txt("3차"))
+    """
     with mid:
         st.markdown(centered_html, unsafe_allow_html=True)
 
+
 # -------------------------------------------------
 # 필터 적용 + 결과 목록
 # -------------------------------------------------
+_prof.lap("filter")
 page_size = 6
 if st.session_state.get("page") is None:
     st.session_state.page = 1
 
 show_only_no_pass = st.session_state.get("show_only_no_pass", False)
 
-if show_only_no_pass:
-    f = df[df["NO_PASS_DATA"]].copy()
-else:
-    f = df[~df["NO_PASS_DATA"]].copy()
-
-if selected_ids:
-    f = f[f[ID_COL].astype(str).isin([str(x) for x in selected_ids])]
-if st.session_state.get("q"):
-    q = st.session_state["q"]
-    f = f[f[NAME_COL].astype(str).str.contains(q, case=False, na=False)]
-sel_cls = st.session_state.get("cls_single", "(전체)")
-if sel_cls != "(전체)":
-    f = f[f[CLS_COL].astype(str) == sel_cls]
-sel_buckets = st.session_state.get("sel_buckets", None)
-if sel_buckets is not None:
-    f = f[pd.to_numeric(f[GRADE_COL], errors="coerce").round(-2).isin(sel_buckets)]
-if st.session_state.get("want_w", False):
-    f = f[f["HAS_W"] == True]
-if st.session_state.get("want_p", False):
-    f = f[f["HAS_P"] == True]
-if st.session_state.get("want_i", False):
-    f = f[f["HAS_I"] == True]
-
-if ncs_license_ids is not None:
-    f = f[_to_key(f[ID_COL]).isin(ncs_license_ids)]
-
-if not show_only_no_pass:
-    sel_lv = st.session_state.get("sel_lv", [1, 2, 3, 4, 5])
-    f = f[f["DIFF_LEVEL(1-5)"].isin(sel_lv)]
-    f = f.sort_values(["DIFF_SCORE", "OVERALL_PASS(%)"], ascending=[False, True])
-else:
-    f = f.sort_values([NAME_COL])
+# 필터 조합 → 정렬된 행 위치 (세션 공유 LRU 캐시, 데이터셋 버전별)
+filters = filter_state(
+    q=st.session_state.get("q"),
+    cls=st.session_state.get("cls_single"),
+    buckets=st.session_state.get("sel_buckets", None),
+    want_w=st.session_state.get("want_w", False),
+    want_p=st.session_state.get("want_p", False),
+    want_i=st.session_state.get("want_i", False),
+    levels=st.session_state.get("sel_lv", [1, 2, 3, 4, 5]),
+    ncs_large=sel_ncs_large,
+    ncs_mid=sel_ncs_mid,
+    ncs_small=sel_ncs_small,
+    major=sel_major,
+    only_no_pass=show_only_no_pass,
+)
+order, fuzzy_used = get_results(ds, filters)
 
-total = len(f)
+total = len(order)
 max_pages = max(1, int(np.ceil(total / page_size)))
 st.session_state.page = int(np.clip(st.session_state.get("page", 1), 1, max_pages))
 page = st.session_state.page
 start, end = (page - 1) * page_size, (page - 1) * page_size + page_size
-page_df = f.iloc[start:end]
+page_df = df.iloc[order[start:end]]
 
 mode_txt = " (합격률 없는 자격증)" if show_only_no_pass else ""
 st.markdown(f"#### 결과: {total:,}건 (페이지 {page}/{max_pages}){mode_txt}")
-if not show_only_no_pass:
+if fuzzy_used:
+    st.caption(f"'{st.session_state.get('q')}'와(과) 일치하는 자격증이 없어 비슷한 이름을 보여줍니다. (유사도 순)")
+elif not show_only_no_pass:
     st.caption("정렬: 난이도 점수 내림차순 → 합격률 오름차순")
 
 ncol = 1 if IS_MOBILE else 3
@@ -936,7 +564,8 @@ ncol = 1 if IS_MOBILE else 3
 def license_card(row):
     title, rid = str(row[NAME_COL]), str(row[ID_COL])
     cls = str(row.get(CLS_COL, ""))
-    grade = row.get(GRADE_COL, "")
+    grade = row.get(GRADE_COL)
+    grade = "-" if pd.isna(grade) else grade
     freq_disp = row.get(FREQ_COL, "")
     struct = row.get("STRUCT_TXT", "")
     diff_lv = row.get("DIFF_LEVEL(1-5)", np.nan)
@@ -973,17 +602,16 @@ def license_card(row):
         with c3:
             ov = row.get("OVERALL_PASS(%)", np.nan)
             st.metric("전체 합격률(평균)", f"{ov:.1f}%" if pd.notna(ov) else "-")
-        p1, p2, p3 = st.columns(3)
-        with p1:
-            v = row.get("PASS_1차_AVG(22-24)", np.nan)
-            st.metric("1차 합격률(3년평균)", f"{v:.1f}%" if pd.notna(v) else "-")
-        with p2:
-            v = row.get("PASS_2차_AVG(22-24)", np.nan)
-            st.metric("2차 합격률(3년평균)", f"{v:.1f}%" if pd.notna(v) else "-")
-        with p3:
-            v = row.get("PASS_3차_AVG(22-24)", np.nan)
-            st.metric("3차 합격률(3년평균)", f"{v:.1f}%" if pd.notna(v) else "-")
-        if (df_jobs is not None) and (JOB_ID_COL in df_jobs.columns):
+        if ds.stats.phases:
+            n_years = len(ds.stats.years)
+            for col, ph in zip(st.columns(len(ds.stats.phases)), ds.stats.phases):
+                with col:
+                    v = row.get(phase_avg_col(ph), np.nan)
+                    st.metric(f"{ph} 합격률({n_years}년평균)", f"{v:.1f}%" if pd.notna(v) else "-")
+        else:
+            # 연도·차수 통계 컬럼이 하나도 없는 데이터 (st.columns(0) 은 예외)
+            st.caption("연도·차수별 합격률 데이터가 없습니다.")
+        if job_index.has_jobs:
             if st.button("관련 직무 보기", key=f"jobbtn_{rid}", use_container_width=True):
                 st.session_state["selected_license"] = rid
                 st.session_state.pop("selected_job_seq", None)
@@ -991,6 +619,7 @@ def license_card(row):
                 st.session_state["_scroll_to_top"] = True
 
 
+_prof.lap("cards")
 rows = list(page_df.to_dict(orient="records"))
 if not rows:
     st.info("조건에 맞는 결과가 없습니다. 필터를 조정해 보세요.")
@@ -1005,39 +634,33 @@ else:
 # -------------------------------------------------
 # 선택된 자격증 상세(그래프 + 직무 + 직업정보)
 # -------------------------------------------------
+_prof.lap("license_chart")
 sel_license = st.session_state.get("selected_license")
 
 if sel_license is not None:
-    lic_row = df[df[ID_COL].astype(str) == str(sel_license)]
-    if not lic_row.empty:
+    lic_pos = facets.positions_of(sel_license)
+    if len(lic_pos):
+        lic_row = df.iloc[lic_pos[0]]
         st.subheader("합격률")
         with st.container(border=True):
-            plot_yearly_pass_rates(lic_row.iloc[0], lic_row.iloc[0][NAME_COL])
+            with _prof.span("charts"):
+                plot_yearly_pass_rates(lic_row, int(lic_pos[0]), lic_row[NAME_COL])
 
-if df_jobs is not None and (JOB_ID_COL in df_jobs.columns) and sel_license:
-    mask = df_jobs[JOB_ID_COL].astype(str).str.strip() == str(sel_license).strip()
-    jobs = df_jobs.loc[mask].copy()
+_prof.lap("jobs")
+if job_index.has_jobs and sel_license:
+    # 자격증 → (jobdicSeq, 직업명, 관련 학과) 인덱스 조회
+    job_rows = job_index.jobs_for(sel_license)
     st.subheader("관련 직무")
-    if jobs.empty:
+    if not job_rows:
         st.info("연결된 직무 데이터가 없습니다.")
     else:
-        if "학과명" in jobs.columns:
-            jobs = (
-                jobs.assign(학과명=jobs["학과명"].astype(str).str.strip())
-                .groupby([JOB_SEQ_COL, "직업명"], as_index=False)["학과명"]
-                .agg(lambda s: ", ".join(pd.Series(s).dropna().unique()))
-            )
         ncol2 = 2
-        job_rows = list(jobs.to_dict(orient="records"))
         for i in range(0, len(job_rows), ncol2):
             cols = st.columns(ncol2)
             for j in range(ncol2):
                 if i + j >= len(job_rows):
                     break
-                jr = job_rows[i + j]
-                seq = str(jr.get(JOB_SEQ_COL, "")).strip()
-                title = str(jr.get("직업명", "(직업명 미상)"))
-                major = str(jr.get("학과명", "")).strip()
+                seq, title, major, _ = job_rows[i + j]
                 with cols[j]:
                     with st.container(border=True):
                         st.markdown(
@@ -1055,90 +678,48 @@ if df_jobs is not None and (JOB_ID_COL in df_jobs.columns) and sel_license:
                             st.session_state["selected_job_title"] = title
                             st.session_state["_scroll_to_top"] = True
 
+_prof.lap("job_detail")
 sel_job = st.session_state.get("selected_job_seq")
 if sel_license is not None:
     st.divider()
     st.subheader("직업 상세 정보")
-    if (
-        sel_job is None
-        or df_jobinfo is None
-        or JOB_SEQ_COL not in (df_jobinfo.columns if df_jobinfo is not None else [])
-    ):
+    if sel_job is None or not job_index.has_info:
         st.info("상세 보기를 선택하면 이곳에 표시됩니다.")
     else:
-        detail = df_jobinfo[df_jobinfo[JOB_SEQ_COL] == str(sel_job).strip()]
-        if detail.empty:
+        # 지표/레이더 점수/본문 HTML 은 jobdicSeq 별로 한 번 만들어 공유
+        det = job_index.detail(sel_job)
+        if det is None:
             st.warning("직업정보 데이터가 없습니다(키 불일치).")
         else:
-            r = detail.iloc[0].astype(str).str.strip().to_dict()
+            r = det.info
             title = st.session_state.get("selected_job_title") or r.get("직업명", "")
             with st.container(border=True):
                 st.markdown(
-                    f"### {title}  <small style='color:#868e96'>[{str(sel_job).strip()}]</small>",
+                    f"### {html.escape(title)}  <small style='color:#868e96'>[{html.escape(str(sel_job).strip())}]</small>",
                     unsafe_allow_html=True,
                 )
-                score_keys = ["보상", "고용안정", "발전가능성", "근무여건", "직업전문성", "고용평등"]
                 cols = st.columns(3)
-                k = 0
-                for sk in score_keys:
-                    val = r.get(sk, "")
-                    if val and val.lower() not in ["nan", "none"]:
-                        with cols[k % 3]:
-                            st.metric(sk, val)
-                        k += 1
-
-                radar_keys = ["보상", "고용안정", "발전가능성", "근무여건", "직업전문성", "고용평등"]
-                radar_vals = [_num_in_text(r.get(k, "")) for k in radar_keys]
-                if any(pd.notna(v) for v in radar_vals):
-                    vals = [0.0 if pd.isna(v) else float(v) for v in radar_vals]
-                    angles = np.linspace(0, 2 * np.pi, len(vals), endpoint=False)
+                for k, (sk, val) in enumerate(det.metrics):
+                    with cols[k % 3]:
+                        st.metric(sk, val)
+
+                if det.radar is not None:
+                    vals = list(det.radar)
                     _, mid, _ = st.columns([1, 2, 1])
-                    with mid:
-                        fig = plt.figure(figsize=(5.2, 5.2))
-                        ax = plt.subplot(111, polar=True)
-                        ax.set_theta_offset(np.pi / 2)
-                        ax.set_theta_direction(-1)
-                        angles_c = np.concatenate([angles, angles[:1]])
-                        vals_c = np.concatenate([vals, vals[:1]])
-                        ax.plot(angles_c, vals_c, linewidth=2.4)
-                        ax.fill(angles_c, vals_c, alpha=0.12)
-                        ax.set_thetagrids(np.degrees(angles), radar_keys)
-                        ax.set_ylim(0, 100)
-                        ax.set_rgrids([20, 40, 60, 80, 100], angle=90, fontsize=9)
-                        ax.set_title("직업 지표 레이더", pad=12)
-                        ax.grid(True, linestyle="--", alpha=0.35)
-                        ax.spines["polar"].set_linewidth(0.9)
-                        for ang, val in zip(angles, vals):
-                            ax.annotate(
-                                f"{val:.0f}",
-                                (ang, val),
-                                textcoords="offset points",
-                                xytext=(0, 6),
-                                ha="center",
+                    with mid, _prof.span("charts"):
+                        if CLIENT_CHARTS:
+                            st.plotly_chart(radar_spec(SCORE_KEYS, vals), use_container_width=True)
+                        else:
+                            style = chart_style()
+                            png = CHART_CACHE.get_or_render(
+                                ds, "radar", sel_job, lambda: render_radar_png(SCORE_KEYS, vals, style), style=style.key
                             )
-                        fig.tight_layout()
-                        st.pyplot(fig, use_container_width=True)
+                            st.image(png, use_container_width=True)
 
                 st.divider()
-                sections = [
-                    ("직업전망요약", "직업전망요약"),
-                    ("취업방법", "취업방법"),
-                    ("준비과정", "준비과정"),
-                    ("교육과정", "교육과정"),
-                    ("적성", "적성"),
-                    ("고용형태", "고용형태"),
-                    ("고용분류", "고용분류"),
-                    ("표준분류", "표준분류"),
-                    ("직무구분", "직무구분"),
-                    ("초임", "초임"),
-                    ("유사직업명", "유사직업명"),
-                ]
-                for key, label in sections:
-                    val = (r.get(key) or "").strip()
-                    if not val or val.lower() in ["nan", "none"]:
-                        continue
+                for label, fragment in det.sections:
                     st.markdown(f"**{label}**")
-                    st.markdown(render_detail_html(val), unsafe_allow_html=True)
+                    st.markdown(fragment, unsafe_allow_html=True)
 
                 c1, c2 = st.columns([1, 1])
                 with c1:
@@ -1155,6 +736,9 @@ if sel_license is not None:
                         st.session_state["_scroll_to_top"] = True
                         _safe_rerun()
 
+_prof.lap("pagination")
+
+
 # -------------------------------------------------
 # 페이지네이션 + 스크롤-투-탑
 # -------------------------------------------------
@@ -1212,3 +796,49 @@ with c_next:
 
 _emit_scroll_to_top_if_needed()
 
+# -------------------------------------------------
+# 계측 마무리 + 디버그 패널 (?profile=1, 패널 자체는 집계에서 제외)
+# -------------------------------------------------
+_prof.finish()
+_prof.log()
+
+if str(get_query_params().get("profile", "0")) == "1":
+    _ps = _prof.summary()
+    with st.expander("⏱ 성능 계측 (이번 재실행)", expanded=True):
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("전체", f"{_ps['total_ms']:.0f} ms", help=f"예산 {_ps['budget_ms']:.0f} ms")
+        m2.metric("요소", f"{_ps['elements']:,}", help=f"블록 {_ps['blocks']:,} · 메시지 {_ps['messages']:,}")
+        m3.metric("전송", f"{_ps['bytes'] / 1024:.1f} KB", help="이미지 등 미디어 파일은 별도 요청이라 제외")
+        m4.metric("예산 초과", "예" if _ps["over_budget"] else "아니오")
+
+        st.caption("구간별 (ms) — '포함' 항목은 다른 구간 시간의 일부")
+        st.dataframe(
+            pd.DataFrame(
+                [(k, v, "구간") for k, v in _ps["phases_ms"].items()]
+                + [(k, v, "포함") for k, v in _ps["spans_ms"].items()],
+                columns=["구간", "ms", "종류"],
+            ),
+            hide_index=True,
+            use_container_width=True,
+        )
+
+        st.caption(f"데이터셋 빌드 (프로세스당 1회, 버전 {ds.version}) — ms")
+        st.dataframe(
+            pd.DataFrame(list(ds.build_ms.items()), columns=["단계", "ms"]),
+            hide_index=True,
+            use_container_width=True,
+        )
+
+        if ds.memory:
+            st.caption("테이블 메모리 (압축 전 → 후) — KB")
+            st.dataframe(
+                pd.DataFrame(
+                    [(k, round(a / 1024, 1), round(b / 1024, 1)) for k, (a, b) in ds.memory.items()],
+                    columns=["테이블", "압축 전", "압축 후"],
+                ),
+                hide_index=True,
+                use_container_width=True,
+            )
+
+        st.caption("캐시")
+        st.json({"results": RESULT_CACHE.stats(), "charts": CHART_CACHE.stats()}, expanded=False)
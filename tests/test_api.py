@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# REST API — 번들 데이터셋 위에 create_app(lambda: ds) 로 만든 앱을 로컬 TestClient 로 호출 (외부 서비스 없음)
+
+import gzip
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from api import MAX_PAGE_SIZE, create_app  # noqa: E402
+from cert_core.config import ID_COL  # noqa: E402
+from cert_core.dataset import build_dataset  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def ds():
+    return build_dataset()
+
+
+@pytest.fixture(scope="module")
+def client(ds):
+    with TestClient(create_app(lambda: ds)) as c:
+        yield c
+
+
+def _license_with_jobs(ds):
+    return next(i for i in (str(x).strip() for x in ds.cert[ID_COL])
+                if any(j.major_list for j in ds.job_index.jobs_for(i)))
+
+
+def test_list_pagination(client, ds):
+    first = client.get("/certifications", params={"size": 5}).json()
+    assert first["version"] == ds.version and first["page"] == 1 and first["size"] == 5
+    assert first["total"] == len(ds.cert.loc[~ds.cert["NO_PASS_DATA"]])
+    assert first["pages"] == -(-first["total"] // 5) and len(first["items"]) == 5
+    assert first["fuzzy"] is False
+
+    second = client.get("/certifications", params={"size": 5, "page": 2}).json()
+    ids = [x["id"] for x in first["items"] + second["items"]]
+    assert len(set(ids)) == 10
+    # 난이도 점수 내림차순
+    scores = [x["difficulty_score"] for x in first["items"] + second["items"]]
+    assert scores == sorted(scores, reverse=True)
+
+    past_end = client.get("/certifications", params={"size": 5, "page": first["pages"] + 1}).json()
+    assert past_end["items"] == []
+    assert client.get("/certifications", params={"size": MAX_PAGE_SIZE + 1}).status_code == 422
+    assert client.get("/certifications", params={"page": 0}).status_code == 422
+
+
+def test_search_and_fuzzy_flag(client):
+    exact = client.get("/certifications", params={"q": "전기기사", "level": [1, 2, 3, 4, 5]}).json()
+    assert exact["fuzzy"] is False and "전기기사" in [x["name"] for x in exact["items"]]
+
+    typo = client.get("/certifications", params={"q": "전기 기사"}).json()
+    assert typo["fuzzy"] is True and typo["items"][0]["name"] == "전기기사"
+
+    none = client.get("/certifications", params={"q": "zzzzqqq"}).json()
+    assert none["fuzzy"] is False and none["total"] == 0
+
+
+def test_detail_and_not_found(client, ds):
+    lid = str(ds.cert.iloc[int(ds.cert["NO_PASS_DATA"].to_numpy(dtype=bool).argmin())][ID_COL]).strip()
+    item = client.get(f"/certifications/{lid}").json()["item"]
+    assert item["id"] == lid and item["url"].endswith(f"license={lid}")
+    assert set(item["pass_rate_phase_avg"]) == set(ds.stats.phases)
+    assert set(item["yearly"]) == {str(y) for y in ds.stats.years}
+
+    for path in ("/certifications/__none__", "/certifications/__none__/jobs", "/majors/__none__/certifications"):
+        r = client.get(path)
+        assert r.status_code == 404 and "detail" in r.json()
+
+
+def test_job_majors_are_a_deduplicated_list(client, ds):
+    lid = _license_with_jobs(ds)
+    items = client.get(f"/certifications/{lid}/jobs").json()["items"]
+    assert items
+    for item in items:
+        majors = item["majors"]
+        assert isinstance(majors, list)
+        assert len(majors) == len(set(majors))
+        assert all(m and m == m.strip() and "," not in m for m in majors)
+
+
+def test_major_and_ncs_routes(client, ds):
+    major = next(m for m in ds.majors.names if ds.majors.license_ids(m))
+    body = client.get(f"/majors/{major}/certifications", params={"size": 3}).json()
+    assert body["major"] == major and body["total"] >= 1 and len(body["items"]) <= 3
+
+    tree = client.get("/ncs/tree").json()["tree"]
+    assert tree["children"] and all("license_count" in c for c in tree["children"])
+
+
+def test_etag_304_and_gzip(client, ds):
+    r = client.get("/certifications", params={"size": 50}, headers={"Accept-Encoding": "gzip"})
+    etag = r.headers["ETag"]
+    assert etag.startswith(f'W/"{ds.version}-') and r.headers["X-Dataset-Version"] == ds.version
+    assert r.headers.get("Content-Encoding") == "gzip"
+
+    cached = client.get("/certifications", params={"size": 50}, headers={"If-None-Match": etag})
+    assert cached.status_code == 304 and cached.content == b"" and cached.headers["ETag"] == etag
+    assert client.get("/certifications", params={"size": 50}, headers={"If-None-Match": "*"}).status_code == 304
+
+    # 다른 URL → 다른 ETag → 304 아님
+    other = client.get("/certifications", params={"size": 49}, headers={"If-None-Match": etag})
+    assert other.status_code == 200 and other.headers["ETag"] != etag
+
+
+def test_gzip_body_roundtrip(client):
+    # httpx 가 자동으로 풀기 전의 원본 바이트도 gzip 인지 확인
+    with client.stream("GET", "/ncs/tree", headers={"Accept-Encoding": "gzip"}) as r:
+        raw = b"".join(r.iter_raw())
+    assert r.headers.get("Content-Encoding") == "gzip"
+    assert gzip.decompress(raw).startswith(b"{")
+
+
+def test_ncs_links_route():
+    # 링크 테이블은 처음 조회할 때만 로드
+    ds = build_dataset()
+    with TestClient(create_app(lambda: ds)) as client:
+        assert not ds.ncs_links.loaded
+        large = ds.ncs_tree.large_options()[0]
+        mid = ds.ncs_tree.mid_options(large)[0]
+        body = client.get("/ncs/links", params={"large": large, "mid": mid}).json()
+        assert ds.ncs_links.loaded
+        assert body["path"] == {"large": large, "mid": mid, "small": None}
+        assert body["majors"] and body["jobs"]
+        assert body["majors"] == sorted(set(body["majors"]))
+        # 상위 경로는 하위 경로의 학과를 모두 포함
+        wider = client.get("/ncs/links", params={"large": large}).json()
+        assert set(body["majors"]) <= set(wider["majors"])
+        assert client.get("/ncs/links", params={"large": "__none__"}).status_code == 404
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+# 데이터셋 버전 / 변경 감지 키가 스냅샷 manifest 를 반영하는지 (원천 없이 스냅샷만 배포한 경우)
+
+import json
+import os
+
+from cert_core.dataset import _stat_key, _version
+from cert_core.loaders import SOURCES
+from cert_core.snapshot import MANIFEST_NAME, build_snapshot, snapshot_fingerprint
+
+
+def _snapshot_only(snapshot_dir):
+    # 원천 파일 지문은 모두 None — 스냅샷만 있는 배포
+    return dict({name: None for name in SOURCES}, snapshot=snapshot_fingerprint(str(snapshot_dir)))
+
+
+def test_version_follows_replaced_snapshot(tmp_path):
+    build_snapshot(str(tmp_path))
+    v1, key1 = _version(_snapshot_only(tmp_path)), _stat_key(str(tmp_path))
+
+    # 같은 원천으로 다시 빌드 → 내용이 같으므로 같은 버전
+    build_snapshot(str(tmp_path))
+    assert _version(_snapshot_only(tmp_path)) == v1
+
+    # 다른 데이터의 스냅샷으로 교체 (manifest 는 빌드 마지막에 원자적으로 바뀐다)
+    path = os.path.join(tmp_path, MANIFEST_NAME)
+    with open(path, encoding="utf-8") as fp:
+        manifest = json.load(fp)
+    manifest["rows"]["cert"] += 1
+    manifest["sources"]["cert"]["sha256"] = "0" * 64
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump(manifest, fp)
+    assert _version(_snapshot_only(tmp_path)) != v1
+    assert _stat_key(str(tmp_path)) != key1
+
+
+def test_missing_snapshot_has_no_fingerprint(tmp_path):
+    assert snapshot_fingerprint(str(tmp_path)) is None
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# 필터 상태 정규화(캐시 키)와 데이터셋 버전별 LRU 무효화
+
+import numpy as np
+import pytest
+
+from cert_core.cache import LRUCache
+from cert_core.dataset import build_dataset
+from cert_core.results import RESULT_CACHE, filter_state, get_results, run_query
+
+
+@pytest.fixture(scope="module")
+def ds():
+    return build_dataset()
+
+
+def test_equivalent_filter_states_share_one_entry(ds):
+    a = filter_state(q="  전기기사 ", cls="(전체)", buckets=[300, 100, 100], levels=[5, 1, 3], ncs_large="(전체)",
+                     major="(선택)")
+    b = filter_state(q="전기기사", buckets=[100, 300], levels=[1, 3, 5])
+    assert a == b and hash(a) == hash(b)
+    # 대소문자 무시, 공백만 입력하면 검색 조건 없음
+    assert filter_state(q="C++").q == filter_state(q="c++").q
+    assert filter_state(q="   ").q is None
+    # 합격률 없는 목록에는 난이도 조건이 적용되지 않음
+    assert filter_state(levels=[1], only_no_pass=True) == filter_state(levels=[2, 3], only_no_pass=True)
+
+    RESULT_CACHE.clear()
+    first = get_results(ds, a)
+    second = get_results(ds, b)
+    assert second is first
+    assert len(RESULT_CACHE) == 1 and RESULT_CACHE.hits == 1 and RESULT_CACHE.misses == 1
+    # 앞뒤 공백을 뗀 질의와 원래 질의의 결과가 같다 (이름 검색도 앞뒤 공백을 무시)
+    assert np.array_equal(first[0], run_query(ds, filter_state(q="  전기기사 "))[0])
+
+
+def test_new_dataset_version_clears_cache():
+    cache, calls = LRUCache(maxsize=4), []
+
+    def compute(v):
+        return lambda: calls.append(v) or v
+
+    assert cache.get_or_compute("v1", 1.0, "k", compute("v1")) == "v1"
+    assert cache.get_or_compute("v1", 1.0, "k", compute("v1")) == "v1"
+    assert calls == ["v1"] and len(cache) == 1
+
+    # 더 새로 빌드된 버전 → 이전 항목은 모두 버리고 다시 계산
+    cache.get_or_compute("v1", 1.0, "other", compute("v1"))
+    assert cache.get_or_compute("v2", 2.0, "k", compute("v2")) == "v2"
+    assert len(cache) == 1 and cache.stats()["version"] == "v2"
+
+    # 교체 직전의 옛 데이터셋 요청은 계산만 하고 저장하지 않는다
+    assert cache.get_or_compute("v1", 1.0, "k", compute("v1")) == "v1"
+    assert cache.get_or_compute("v2", 2.0, "k", compute("v2")) == "v2"
+    assert calls == ["v1", "v1", "v2", "v1"] and len(cache) == 1
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    for k in ("a", "b"):
+        cache.get_or_compute("v", 0.0, k, lambda k=k: k)
+    cache.get_or_compute("v", 0.0, "a", lambda: "a")   # a 를 최근으로
+    cache.get_or_compute("v", 0.0, "c", lambda: "c")   # b 가 밀려남
+    assert cache.get("b") is None and cache.get("a") == "a" and cache.get("c") == "c"
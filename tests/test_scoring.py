@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+# 벡터화한 점수 계산이 예전 행 단위(apply) 구현과 같은 결과를 내는지 — 번들 data/ 기준 골든 파일
+#
+# tests/data/score_golden.csv: 벡터화 이전(user-003 직전) scoring.py 로 번들 데이터를 계산한 결과 (행 순서 그대로).
+# qcut_1to5 / trust_weight / freq_bonus 등을 바꿔 값이 달라지면 여기서 실패한다.
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from cert_core.config import ID_COL
+from cert_core.loaders import _to_key, load_sources
+from cert_core.scoring import flag_no_pass, qcut_1to5, score_table
+
+GOLDEN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "score_golden.csv")
+NUM_COLS = ["DIFF_SCORE", "DIFF_LEVEL(1-5)", "OVERALL_PASS(%)", "APPLICANTS_AVG"]
+
+
+def _golden():
+    g = pd.read_csv(GOLDEN, dtype={ID_COL: str, "STRUCT_TXT": str}, float_precision="round_trip")
+    g["STRUCT_TXT"] = g["STRUCT_TXT"].fillna("")
+    return g
+
+
+def _scored():
+    tables = load_sources()
+    return score_table(flag_no_pass(tables["cert"], tables["no_pass"]))
+
+
+def test_score_table_matches_rowwise_baseline():
+    g, df = _golden(), _scored()
+    assert len(df) == len(g)
+    assert (_to_key(df[ID_COL]).to_numpy() == g[ID_COL].to_numpy()).all()
+    for c in NUM_COLS:
+        assert np.array_equal(df[c].to_numpy(dtype="float64"), g[c].to_numpy(dtype="float64"), equal_nan=True), c
+    assert (df["STRUCT_TXT"].to_numpy() == g["STRUCT_TXT"].to_numpy()).all()
+
+
+def test_qcut_1to5_equal_width_fallback():
+    # 고유값이 5개 미만이면 등간격 구간, 상수 열은 전부 3
+    assert qcut_1to5(pd.Series([1.0, 1.0, 1.0])).tolist() == [3.0, 3.0, 3.0]
+    out = qcut_1to5(pd.Series([0.0, 0.0, 1.0, np.nan]))
+    assert out.iloc[0] == 1.0 and out.iloc[2] == 5.0 and np.isnan(out.iloc[3])
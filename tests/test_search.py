@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# 이름 검색 — 초성 / 부분 문자열 / 오타 허용(trigram) 대체, 필터 마스크와의 관계
+
+import numpy as np
+import pytest
+
+from cert_core.dataset import build_dataset
+from cert_core.facets import query_rows
+from cert_core.search import NameSearchIndex
+
+NAMES = ["전기기사", "전기산업기사", "전기기능사", "전자기사", "정보처리기사", "조경기사", "C++ 프로그래머"]
+
+
+@pytest.fixture(scope="module")
+def facets():
+    return build_dataset().facets
+
+
+def _names(index, mask):
+    return [index.names[i] for i in np.flatnonzero(mask)]
+
+
+def test_literal_and_choseong_match():
+    idx = NameSearchIndex(NAMES)
+    assert _names(idx, idx.mask("전기기ㅅ")) == ["전기기사"]          # 음절 + 초성 혼합
+    assert _names(idx, idx.mask("ㅈㄱㄱㅅ")) == ["전기기사", "조경기사"]    # 초성만
+    assert _names(idx, idx.mask("산업")) == ["전기산업기사"]
+    assert _names(idx, idx.mask(" 전자 ")) == ["전자기사"]             # 앞뒤 공백 무시
+    assert _names(idx, idx.mask("c++")) == ["C++ 프로그래머"]          # 정규식 메타문자는 리터럴, 대소문자 무시
+    assert not idx.mask("전기 기사").any()                             # 공백이 들어간 질의는 리터럴 불일치
+
+
+def test_fuzzy_picks_top_k_inside_mask():
+    # 같은 점수의 다른 행이 상위 k 를 모두 차지해도 마스크 안의 행을 찾는다
+    idx = NameSearchIndex(["정보처리기사"] * 25 + ["정보처리산업기사"])
+    mask = np.zeros(idx.size, dtype=bool)
+    mask[-1] = True
+    pos, score = idx.fuzzy("정보처리기샤", k=3, mask=mask)
+    assert pos.tolist() == [25] and score[0] >= 0.6
+    assert 25 not in idx.fuzzy("정보처리기샤", k=3)[0].tolist()
+
+
+def test_query_rows_literal_then_fuzzy(facets):
+    names = facets.search.names
+    order, fuzzy = query_rows(facets, q="전기기ㅅ")
+    assert not fuzzy and [names[i] for i in order] == ["전기기사"]
+
+    # 리터럴 불일치 → 오타 허용 대체, 가장 가까운 이름이 먼저
+    order, fuzzy = query_rows(facets, q="전기 기사")
+    assert fuzzy and names[order[0]] == "전기기사"
+
+    order, fuzzy = query_rows(facets, q="ㅈㅂㅊㄹ")
+    assert not fuzzy and {names[i] for i in order} == {"정보처리기사", "정보처리산업기사", "정보처리기능사"}
+
+    # 오타 허용 결과도 없으면 빈 목록 + 대체 안내 없음
+    order, fuzzy = query_rows(facets, q="zzzzqqq")
+    assert not fuzzy and not len(order)
+
+
+def test_query_rows_fuzzy_respects_filters(facets):
+    m = facets.mask(buckets=[100])
+    assert not (facets.search.mask("정보처리기사") & m).any()
+    # 카탈로그 전체에 리터럴 일치가 있으면 필터 밖이어도 오타 허용 검색은 하지 않는다
+    assert facets.search.mask("정보처리기사").any()
+    order, fuzzy = query_rows(facets, q="정보처리기사", buckets=[100])
+    assert not fuzzy and not len(order)
+
+    # 리터럴 불일치 → 필터를 통과한 행 안에서 오타 허용 상위 결과
+    order, fuzzy = query_rows(facets, q="정보처리기샤", buckets=[100])
+    assert fuzzy and len(order) and m[order].all()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# 연도·차수 통계 컬럼이 없는 데이터 — 빈 통계로 처리되고 앱 카드가 깨지지 않는지
+#
+#   python -m pytest -q      (저장소 루트에서: 번들 data/ 를 상대 경로로 읽는다)
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cert_core.loaders import load_sources
+from cert_core.scoring import flag_no_pass, score_table
+from cert_core.stats import YearPhaseStats, stat_columns
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _without_stats(df):
+    return df.drop(columns=list(stat_columns(df.columns).values()))
+
+
+def test_stats_without_year_phase_columns():
+    stats = YearPhaseStats.from_frame(pd.DataFrame({"자격증명": ["가", "나"]}))
+    assert stats.years == [] and stats.phases == []
+    assert stats.phase_avg().shape == (2, 0)
+    assert np.isnan(stats.overall()).all() and np.isnan(stats.applicants_avg()).all()
+    assert stats.series(0) == ([], {})
+    assert stats.row(0) == {}
+    assert stats.to_long().empty
+
+
+def test_score_table_without_year_phase_columns():
+    tables = load_sources()
+    df = _without_stats(tables["cert"])
+    out = score_table(flag_no_pass(df, tables["no_pass"]))
+    assert out["OVERALL_PASS(%)"].isna().all()
+    assert out["APPLICANTS_AVG"].isna().all()
+    assert not any(c.startswith("PASS_") for c in out.columns)
+    assert out.loc[~out["NO_PASS_DATA"], "DIFF_LEVEL(1-5)"].notna().all()
+
+
+def test_app_cards_without_year_phase_columns(tmp_path):
+    from cert_core.bench import _import_apptest
+    from cert_core.synth import write_tables
+
+    if _import_apptest() is None:  # 저장소 루트의 streamlit.py 를 피해서 import
+        pytest.skip("streamlit 없음")
+
+    tables = load_sources()
+    tables["cert"] = _without_stats(tables["cert"])
+    write_tables(tables, str(tmp_path), fmt="csv")
+    # 데이터 경로는 import 시점에 정해지므로 CERT_DATA_DIR 을 준 별도 프로세스에서 실행
+    script = textwrap.dedent("""
+        from cert_core.bench import _import_apptest
+        at = _import_apptest().from_file("streamlit.py", default_timeout=120).run()
+        assert not at.exception, at.exception
+        assert any("연도·차수별 합격률 데이터가 없습니다" in c.value for c in at.caption)
+    """)
+    env = dict(os.environ, CERT_DATA_DIR=str(tmp_path))
+    proc = subprocess.run([sys.executable, "-c", script], cwd=ROOT, env=env, capture_output=True, text=True,
+                          timeout=300)
+    assert proc.returncode == 0, proc.stderr[-2000:]